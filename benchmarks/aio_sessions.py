@@ -0,0 +1,40 @@
+"""
+Load test of asyncio roll sessions on one core.
+
+Every session rolls a pool and awaits a Master Die callback that yields to the event loop
+once, like a chat-bot waiting for a player's answer, before choosing a value.
+
+    python -m benchmarks.aio_sessions [number of sessions] [concurrent sessions]
+"""
+import asyncio
+import sys
+import time
+
+from oneroll.aio import roll_session, solver_md
+
+
+async def player(roll):
+    await asyncio.sleep(0)
+    return 10
+
+
+async def run(n, concurrency, md):
+    async def worker(count):
+        for x in range(count):
+            await roll_session(6, md=md)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(n // concurrency) for x in range(concurrency)))
+    return (n // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+def main(n=200000, concurrency=5000):
+    print("{} sessions, {} at a time".format(n, concurrency))
+
+    for name, md in [("no Master Die", None), ("awaited player", player), ("solver_md()", solver_md())]:
+        rate = asyncio.run(run(n, concurrency, md))
+        print("{:<16} {:10.0f} sessions/s".format(name, rate))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
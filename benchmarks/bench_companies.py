@@ -0,0 +1,67 @@
+"""
+Benchmarks of company generation and the company network; see conftest.py for how to run them.
+"""
+import random
+
+import pytest
+
+from oneroll.companies import onerollcompany
+from oneroll.generate import generate_companies
+from oneroll.network import build_company_network
+from oneroll.relations import resolve_relations
+from oneroll.tradecenters import trade_centers
+
+COMPANIES = [10, 1000, 100000]
+
+
+@pytest.mark.parametrize("dice", [5, 15])
+def test_onerollcompany(bench, dice):
+    bench(onerollcompany, dice=dice, rng=random.Random(1))
+
+
+@pytest.mark.parametrize("companies", [10, 1000])
+def test_onerollcompany_many(bench, companies):
+    rng = random.Random(2)
+    bench(lambda: [onerollcompany(dice=rng.randint(5, 15), rng=rng) for x in range(companies)])
+
+
+@pytest.mark.parametrize("columns", [False, True])
+@pytest.mark.parametrize("companies", COMPANIES)
+def test_generate_companies(bench, companies, columns):
+    bench(generate_companies, companies, columns=columns, rng=3)
+
+
+@pytest.fixture(scope="module")
+def company_tables():
+    return {n: generate_companies(n, columns=True, rng=4).to_companies() for n in COMPANIES}
+
+
+@pytest.mark.parametrize("companies", COMPANIES)
+def test_build_network(bench, company_tables, companies):
+    bench(build_company_network, company_tables[companies], extra_edges=companies // 6, seed=5)
+
+
+@pytest.mark.parametrize("companies", COMPANIES)
+def test_resolve_relations(bench, company_tables, companies):
+    network = build_company_network(company_tables[companies], extra_edges=companies // 6, seed=6)
+    bench(resolve_relations, network, rng=7)
+
+
+@pytest.mark.parametrize("companies", COMPANIES)
+def test_trade_centers(bench, company_tables, companies):
+    network = build_company_network(company_tables[companies], extra_edges=companies // 6, seed=8)
+    bench(trade_centers, network, k=64, seed=9)
+
+
+@pytest.mark.parametrize("companies", [30, 1000])
+def test_build_network_script(bench, companies):
+    """The steps of buildNetwork.py, from rolling the companies to the relationship graph."""
+    rng = random.Random(10)
+
+    def script():
+        network = build_company_network([onerollcompany(dice=rng.randint(5, 15), rng=rng)
+                                         for x in range(companies)], extra_edges=5, seed=11)
+        trade_centers(network, 5)
+        return resolve_relations(network).to_networkx()
+
+    bench(script)
@@ -0,0 +1,67 @@
+"""
+Benchmarks of rolling and contests; see conftest.py for how to run them.
+"""
+import random
+
+import pytest
+
+from oneroll.core import Match, Roll, dynamic_contest, gobble_match, static_contest
+
+POOLS = [1, 5, 10, 15, 40, 100]
+
+# No more than 50 dice fit in Matches of width 5.
+ROLLS = [(pool, limit_width) for limit_width in (False, True) for pool in POOLS if not limit_width or pool <= 50]
+
+
+@pytest.mark.parametrize("pool, limit_width", ROLLS)
+def test_roll(bench, pool, limit_width):
+    bench(Roll, pool, over10=True, limit_width=limit_width, rng=random.Random(1))
+
+
+@pytest.mark.parametrize("pool", POOLS)
+def test_results(bench, pool):
+    """matches, widest and waste of a Roll whose dice just changed."""
+    roll = Roll(pool, over10=True, rng=random.Random(2))
+
+    def results():
+        roll._cache = None
+        return roll.matches, roll.widest, roll.waste
+
+    bench(results)
+
+
+@pytest.mark.parametrize("pool", [1, 5, 10])
+def test_static_contest(bench, pool):
+    bench(static_contest, pool, 5, rng=random.Random(3))
+
+
+@pytest.mark.parametrize("width_wins", [False, True])
+@pytest.mark.parametrize("pool", [1, 5, 10])
+def test_dynamic_contest(bench, pool, width_wins):
+    bench(dynamic_contest, pool, pool, width_wins, rng=random.Random(4))
+
+
+@pytest.mark.parametrize("pool", POOLS)
+def test_dynamic_contest_rolled(bench, pool):
+    rng = random.Random(5)
+    roll1, roll2 = Roll(pool, over10=True, rng=rng), Roll(pool, over10=True, rng=rng)
+    bench(dynamic_contest, roll1, roll2)
+
+
+def test_gobble_match(bench):
+    rng = random.Random(6)
+    pairs = [(Match(rng.randint(2, 5), rng.randint(1, 10)), Match(rng.randint(2, 5), rng.randint(1, 10)))
+             for x in range(100)]
+
+    def gobble_all():
+        # gobble_match uses up the Gobble dice, so every call gets new ones.
+        for match, defense in pairs:
+            gobble_match(match, defense.to_gobble())
+
+    bench(gobble_all)
+
+
+@pytest.mark.parametrize("rolls", [10, 1000])
+def test_roll_sum(bench, rolls):
+    pool = [Roll(3, rng=random.Random(x)) for x in range(rolls)]
+    bench(Roll.merge, *pool)
@@ -0,0 +1,40 @@
+"""
+Memory per instance of Roll and CompactRoll.
+
+    python -m benchmarks.compact_memory [number of rolls] [dice per roll]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+
+from oneroll.compact import CompactRoll
+from oneroll.core import Roll
+
+
+def measure(build, n):
+    gc.collect()
+    tracemalloc.start()
+    items = build(n)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return size / n
+
+
+def main(n=100000, dice=15):
+    random.seed(0)
+    rolls = [Roll(dice, over10=True) for x in range(n)]
+    dice_lists = [roll.dice[:] for roll in rolls]
+
+    roll_size = measure(lambda n: [Roll(d, over10=True) for d in dice_lists], n)
+    compact_size = measure(lambda n: [CompactRoll(d, over10=True) for d in dice_lists], n)
+
+    print("{} rolls of {} dice".format(n, dice))
+    print("Roll:        {:7.1f} bytes per instance".format(roll_size))
+    print("CompactRoll: {:7.1f} bytes per instance".format(compact_size))
+    print("reduction:   {:7.1f}x".format(roll_size / compact_size))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
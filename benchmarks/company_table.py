@@ -0,0 +1,56 @@
+"""
+Memory and speed of Company objects against a CompanyTable.
+
+    python -m benchmarks.company_table [number of companies]
+"""
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from oneroll.companytable import CompanyTable
+from oneroll.generate import generate_companies
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    items = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return items, size
+
+
+def best(stmt, number=3):
+    return min(timeit.repeat(stmt, number=1, repeat=number))
+
+
+def main(n=100000):
+    companies = generate_companies(n, rng=0)
+    for company in companies:
+        company.roll = None
+
+    # Both stores hold the same companies, without their rolls.
+    copies, object_size = measure(lambda: CompanyTable.from_companies(companies).to_companies())
+    table, table_size = measure(lambda: CompanyTable.from_companies(companies))
+
+    print("{} companies".format(n))
+    print("Company objects: {:7.1f} bytes per company".format(object_size / n))
+    print("CompanyTable:    {:7.1f} bytes per company".format(table_size / n))
+    print("reduction:       {:7.1f}x".format(object_size / table_size))
+    print()
+
+    cases = [("size", lambda: [company.size for company in companies], lambda: table.size),
+             ("filter might >= 2", lambda: [company for company in companies if company.might >= 2],
+              lambda: table.filter(table.might >= 2)),
+             ("sort by size", lambda: sorted(companies, key=lambda company: company.size),
+              lambda: table.sort_by("size"))]
+
+    for name, objects, columns in cases:
+        before, after = best(objects), best(columns)
+        print("{:<18} objects {:8.1f} ms   table {:8.1f} ms   {:6.1f}x".format(
+            name, before * 1000, after * 1000, before / after))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
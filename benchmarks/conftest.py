@@ -0,0 +1,116 @@
+"""
+Shared fixtures of the pytest-benchmark suite in benchmarks/bench_*.py.
+
+The suite is not part of the normal test run; give the files explicitly. Timings are
+compared by pytest-benchmark against the committed baseline timing_baseline.json:
+
+    python -m pytest benchmarks/bench_*.py --benchmark-compare=benchmarks/timing_baseline.json --benchmark-compare-fail=min:50%
+
+Timings depend on the machine, and single runs of the shorter benchmarks vary by a third
+on a busy one, hence the wide margin on the fastest round. After a deliberate change in
+speed, or on a different machine, write a new baseline and commit it:
+
+    python -m pytest benchmarks/bench_*.py --benchmark-json=benchmarks/timing_baseline.json
+
+Like saved results, the JSON output leaves out the time of every single round unless
+--benchmark-save-data is given. Local runs can still be kept in .benchmarks/ with
+--benchmark-autosave and compared with plain --benchmark-compare.
+
+Peak memory is measured once per benchmark with tracemalloc, kept in the extra_info of
+the saved results, and compared against a JSON baseline of its own:
+
+    python -m pytest benchmarks/bench_*.py --memory-save=benchmarks/memory_baseline.json
+    python -m pytest benchmarks/bench_*.py --benchmark-disable --memory-compare=benchmarks/memory_baseline.json
+
+Both baselines are keyed by test id, so run from the root of the repository. With
+--benchmark-disable every benchmark runs once, which is enough for the memory check.
+"""
+import gc
+import json
+import os
+import tracemalloc
+
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("memory", "peak memory of the oneroll benchmarks")
+    group.addoption("--memory-save", metavar="PATH", help="Write the peak memory of every benchmark to PATH.")
+    group.addoption("--memory-compare", metavar="PATH", help="Fail benchmarks using more memory than in PATH.")
+    group.addoption("--memory-tolerance", type=float, default=0.1,
+                    help="Allowed growth over the baseline peak memory, 0.1 for 10%%.")
+
+
+_peaks = {}
+
+# Peaks of a few kilobytes vary between runs by more than any sensible tolerance.
+SLACK = 4096
+
+
+def peak_memory(function, *args, **kwargs):
+    """
+    Peak memory allocated while calling function once.
+
+    The function is called once before measuring, so imports and other one-time setup do
+    not count against whichever benchmark happens to run first.
+
+    :return: Number of bytes.
+    """
+    function(*args, **kwargs)
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        function(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def bench(benchmark, request):
+    """
+    Like the benchmark fixture, but first records the peak memory of one call and checks
+    it against the --memory-compare baseline.
+    """
+    def run(function, *args, **kwargs):
+        peak = peak_memory(function, *args, **kwargs)
+        benchmark.extra_info["peak_memory"] = peak
+        _peaks[request.node.nodeid] = peak
+
+        path = request.config.getoption("--memory-compare")
+        if path:
+            baseline = _load(path).get(request.node.nodeid)
+            tolerance = request.config.getoption("--memory-tolerance")
+
+            if baseline is not None and peak > baseline * (1 + tolerance) + SLACK:
+                pytest.fail("Peak memory {} bytes, baseline {} bytes.".format(peak, baseline))
+
+        return benchmark(function, *args, **kwargs)
+
+    return run
+
+
+def _load(path):
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    if not config.getoption("benchmark_save_data"):
+        for benchmark in output_json["benchmarks"]:
+            benchmark["stats"].pop("data", None)
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--memory-save", None)
+
+    if path and _peaks:
+        peaks = _load(path)
+        peaks.update(_peaks)
+
+        with open(path, "w") as f:
+            json.dump(peaks, f, indent=1, sort_keys=True)
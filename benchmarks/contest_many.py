@@ -0,0 +1,45 @@
+"""
+Cost per contest of dynamic_contest and static_contest against their array versions.
+
+    python -m benchmarks.contest_many [number of contests]
+"""
+import random
+import sys
+import timeit
+
+import numpy as np
+
+from oneroll.batch import RollBatch, dynamic_contest_many, static_contest_many
+from oneroll.core import DiceBuffer, dynamic_contest, static_contest
+
+
+def best(stmt, number=3):
+    return min(timeit.repeat(stmt, number=1, repeat=number))
+
+
+def main(n=1000000):
+    scalar_n = min(n, 100000)
+    rng = DiceBuffer(random.Random(0))
+    batch_a, batch_b = RollBatch(n, 6, rng=1), RollBatch(n, 5, rng=2)
+    sizes_a = np.full(n, 6)
+    rolls = list(zip(batch_a[:scalar_n], batch_b[:scalar_n]))
+
+    cases = [("dynamic, pool sizes", lambda: [dynamic_contest(6, 5, rng=rng) for x in range(scalar_n)],
+              lambda: dynamic_contest_many(sizes_a, 5, rng=3)),
+             ("dynamic, rolled dice", lambda: [dynamic_contest(a, b) for a, b in rolls],
+              lambda: dynamic_contest_many(batch_a, batch_b)),
+             ("dynamic, width wins", lambda: [dynamic_contest(6, 5, width_wins=True, rng=rng) for x in range(scalar_n)],
+              lambda: dynamic_contest_many(sizes_a, 5, width_wins=True, rng=3)),
+             ("static, pool sizes", lambda: [static_contest(6, 4, rng=rng) for x in range(scalar_n)],
+              lambda: static_contest_many(sizes_a, 4, rng=3))]
+
+    print("{} contests, scalar functions timed on {}".format(n, scalar_n))
+
+    for name, scalar, many in cases:
+        before, after = best(scalar) / scalar_n, best(many) / n
+        print("{:<22} scalar {:8.0f} ns   many {:6.1f} ns   {:6.0f}x".format(
+            name, before * 1e9, after * 1e9, before / after))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+Cold start time of a dice command line tool, and of the heavier parts of oneroll.
+
+Every statement runs in a new interpreter; the time of an interpreter that imports nothing
+is subtracted. Exits with status 1 if rolling dice takes longer than the budget.
+
+    python -m benchmarks.import_time [runs] [budget in ms]
+"""
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    ("dice CLI", "import oneroll; print(oneroll.Roll(5))"),
+    ("companies", "import oneroll; oneroll.onerollcompany()"),
+    ("generate_companies", "import oneroll; oneroll.generate_companies(10)"),
+    ("buildNetwork", "import oneroll.buildNetwork"),
+    ("to_networkx", "import oneroll; oneroll.build_company_network([oneroll.Company()] * 3).to_networkx()"),
+]
+
+
+def cold_start(statement, runs):
+    """
+    Fastest of several runs of statement in a new interpreter.
+
+    :return: Seconds.
+    """
+    best = None
+
+    for x in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True, stdout=subprocess.DEVNULL)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+
+    return best
+
+
+def main(runs=10, budget=60):
+    bare = cold_start("pass", runs)
+    print("interpreter startup    {:7.1f} ms".format(bare * 1e3))
+
+    times = {}
+    for label, statement in STATEMENTS:
+        times[label] = cold_start(statement, runs) - bare
+        print("{:<22} {:7.1f} ms".format(label, times[label] * 1e3))
+
+    if times["dice CLI"] * 1e3 > budget:
+        print("dice CLI is over the budget of {} ms".format(budget))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
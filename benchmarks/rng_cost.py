@@ -0,0 +1,51 @@
+"""
+Cost per die of the random sources Roll can use.
+
+"draw only" times drawing the dice; for the random module that is the old one
+random.randint call per die. "Roll()" times building a Roll with the source as rng.
+
+    python -m benchmarks.rng_cost [dice per roll]
+"""
+import random
+import sys
+import timeit
+
+import numpy as np
+
+from oneroll.core import DiceBuffer, Roll
+
+
+def per_die(statement, dice, number):
+    return min(timeit.repeat(statement, number=number, repeat=5)) / (number * dice) * 1e9
+
+
+def main(dice=10):
+    number = 20000
+    sources = [
+        ("random module (None)", None),
+        ("random.Random", random.Random(1)),
+        ("DiceBuffer(random.Random)", DiceBuffer(random.Random(1))),
+        ("numpy Generator", np.random.default_rng(1)),
+        ("DiceBuffer(numpy Generator)", DiceBuffer(np.random.default_rng(1))),
+    ]
+
+    print("{} dice per roll, ns per die".format(dice))
+    print("{:30} {:>10} {:>10}".format("source", "draw only", "Roll()"))
+
+    for name, rng in sources:
+        if rng is None:
+            draw = lambda: [random.randint(1, 10) for y in range(dice)]
+        elif isinstance(rng, DiceBuffer):
+            draw = lambda: rng.draw(dice)
+        elif isinstance(rng, random.Random):
+            draw = lambda: rng.choices(range(1, 11), k=dice)
+        else:
+            draw = lambda: rng.integers(1, 11, size=dice).tolist()
+
+        print("{:30} {:10.1f} {:10.1f}".format(name,
+                                               per_die(draw, dice, number),
+                                               per_die(lambda: Roll(dice, over10=True, rng=rng), dice, number)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
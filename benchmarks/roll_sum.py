@@ -0,0 +1,60 @@
+"""
+Time summing many small rolls into one pool.
+
+The old Roll.__add__ concatenated and sorted both dice lists for every addition, so it
+is only timed on the first few thousand rolls; it grows quadratically.
+
+    python -m benchmarks.roll_sum [number of rolls] [dice per roll] [rolls for the old addition]
+"""
+import random
+import sys
+import time
+
+from oneroll.core import Roll
+
+
+def copying_add(roll1, roll2):
+    """Roll addition as it was before rolls were added by face histogram."""
+    dice = roll1.dice + roll2.dice
+    counts = [a + b for a, b in zip(roll1._counts, roll2._counts)]
+    return Roll._from_counts(sorted(dice), counts, over10=len(dice) > 10)
+
+
+def timed(label, function, n):
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+
+    print("{:<18} {:8.3f} s {:8.2f} us per roll".format(label, seconds, seconds / n * 1e6))
+    return result
+
+
+def main(n=100000, dice=3, old=5000):
+    random.seed(0)
+    rolls = [Roll(dice) for x in range(n)]
+    old = min(old, n)
+
+    def copying():
+        total = rolls[0]
+        for roll in rolls[1:old]:
+            total = copying_add(total, roll)
+        return total
+
+    def in_place():
+        total = Roll([])
+        for roll in rolls:
+            total += roll
+        return total
+
+    print("{} rolls of {} dice".format(n, dice))
+    reference = timed("copying, {}".format(old), copying, old)
+    total = timed("sum()", lambda: sum(rolls), n)
+    timed("+=", in_place, n)
+    merged = timed("Roll.merge()", lambda: Roll.merge(*rolls), n)
+
+    assert total.counts == merged.counts
+    assert reference.counts == Roll.merge(*rolls[:old]).counts
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
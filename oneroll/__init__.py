@@ -1,2 +1,54 @@
+"""
+One Roll Engine dice.
+
+Importing oneroll only loads the dice core. Everything else, including the parts built on
+NumPy and NetworkX, is imported the first time it is used:
+
+    >>> import oneroll
+    >>> roll = oneroll.Roll(5)                          # oneroll.core, loaded with the package
+    >>> companies = oneroll.generate_companies(10)      # imports oneroll.generate and NumPy now
+    >>> network = oneroll.network                       # submodules load on first access too
+    >>> len(companies)
+    10
+"""
+from importlib import import_module
+
 from .core import *
 
+_LAZY = {
+    "aio": ["contest_session", "roll_session", "solver_ed", "solver_md"],
+    "batch": ["RollBatch", "dynamic_contest_many", "roll_pools", "static_contest_many"],
+    "compact": ["CompactRoll"],
+    "companies": ["Company", "CompiledTable", "Corpus", "ORC_table", "onerollcompany"],
+    "companytable": ["CompanyTable", "CompanyView"],
+    "conflict": ["Conflict"],
+    "generate": ["generate_companies"],
+    "lookup": ["OutcomeTable", "use_table"],
+    "network": ["CompanyNetwork", "build_company_network"],
+    "odds": ["Pool", "dynamic_odds", "static_odds"],
+    "oddscache": ["OddsCache"],
+    "relations": ["Relations", "resolve_relations"],
+    "rolllog": ["RollLog", "RollLogWriter"],
+    "simulate": ["simulate_contests"],
+    "solver": ["best_ed", "best_md"],
+    "stream": ["iter_companies", "iter_contests", "iter_rolls"],
+    "tradecenters": ["TradeCenters", "trade_centers"],
+}
+
+_ATTRIBUTES = {name: module for module, names in _LAZY.items() for name in names}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return import_module("." + name, __name__)
+
+    if name in _ATTRIBUTES:
+        value = getattr(import_module("." + _ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_ATTRIBUTES))
@@ -0,0 +1,106 @@
+"""
+Rolling from asyncio code.
+
+A roll session is a coroutine. Instead of calling input() like roll_with_md() and
+roll_with_ed(), it awaits the Master Die and Expert Die values from async callbacks, so a
+server can ask its users while it keeps serving others. Nothing is printed.
+
+All sessions of an event loop draw their dice from one DiceBuffer, so thousands of
+concurrent sessions share a few large draws from the random number generator.
+
+    >>> async def ask_player(roll):
+    ...     return 10
+    >>> roll = asyncio.run(roll_session(5, md=ask_player))
+"""
+import asyncio
+import random
+import weakref
+
+from .core import DiceBuffer, Roll, _check_dice, dynamic_contest
+from .solver import best_ed, best_md
+
+# One DiceBuffer per event loop: sessions of a loop never run at the same time, sessions
+# of loops in different threads never share a buffer.
+_buffers = weakref.WeakKeyDictionary()
+
+
+def loop_dice(block=65536):
+    """
+    DiceBuffer shared by the sessions of the running event loop.
+
+    :param block: Number of dice drawn at once when the buffer is created.
+    :return: DiceBuffer
+    """
+    loop = asyncio.get_running_loop()
+
+    if loop not in _buffers:
+        _buffers[loop] = DiceBuffer(random.Random(), block)
+
+    return _buffers[loop]
+
+
+async def _value(choice, arg):
+    value = choice if isinstance(choice, int) else await choice(arg)
+    _check_dice([value])
+    return value
+
+
+async def roll_session(dice, md=None, ed=None, rng=None):
+    """
+    Roll dice, with an optional Expert Die set before and Master Die set after rolling.
+
+    :param dice: Number of dice to roll.
+    :param md: Async callable taking the Roll and returning the Master Die value, or None.
+    :param ed: Expert Die value, async callable taking dice and returning the value, or None.
+    :param rng: Source of random dice, see Roll. Defaults to loop_dice().
+    :return: Roll object.
+    """
+    rng = rng if rng is not None else loop_dice()
+    expert = None if ed is None else await _value(ed, dice)
+
+    _roll = Roll(dice, rng=rng)
+
+    if expert is not None:
+        _roll.dice.append(expert)
+        _roll.dice.sort()
+
+    if md is not None:
+        _roll.dice.append(await _value(md, _roll))
+        _roll.dice.sort()
+
+    return _roll
+
+
+async def contest_session(dice1, dice2, md1=None, md2=None, ed1=None, ed2=None, width_wins=False, rng=None):
+    """
+    Dynamic contest between two roll sessions run side by side.
+
+    :return: Tuple of (result, roll1, roll2) with result as returned by dynamic_contest.
+    """
+    roll1, roll2 = await asyncio.gather(roll_session(dice1, md1, ed1, rng), roll_session(dice2, md2, ed2, rng))
+
+    return dynamic_contest(roll1, roll2, width_wins), roll1, roll2
+
+
+def solver_md(goal="height", diff=None, opponent=None, width_wins=False):
+    """
+    Master Die callback for bots and NPCs that picks the value with best_md().
+
+    :return: Async callable for roll_session(md=...).
+    """
+    async def choose(roll):
+        return best_md(roll, goal, diff, opponent, width_wins)
+
+    return choose
+
+
+def solver_ed(goal="height", diff=None, opponent=None, width_wins=False):
+    """
+    Expert Die callback for bots and NPCs that picks the value with best_ed().
+
+    :return: Async callable for roll_session(ed=...).
+    """
+    async def choose(dice):
+        return best_ed(dice, goal, diff, opponent, width_wins)
+
+    return choose
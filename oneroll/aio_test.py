@@ -0,0 +1,88 @@
+from oneroll.aio import *
+from oneroll.core import DiceBuffer
+import asyncio
+import random
+import pytest
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestRollSession:
+    """Tests for roll_session."""
+
+    def test_plain(self):
+        assert run(roll_session(5, rng=DiceBuffer.replay([3, 1, 4, 1, 5]))).dice == [1, 1, 3, 4, 5]
+
+    def test_md(self):
+        """The Master Die callback sees the rolled dice and its value is added."""
+        seen = []
+
+        async def choose(roll):
+            seen.append(list(roll.dice))
+            await asyncio.sleep(0)
+            return 4
+
+        roll = run(roll_session(5, md=choose, rng=DiceBuffer.replay([3, 1, 4, 1, 5])))
+
+        assert seen == [[1, 1, 3, 4, 5]]
+        assert roll.dice == [1, 1, 3, 4, 4, 5]
+        assert roll.counts[3] == 2
+
+    def test_ed(self):
+        """The Expert Die is chosen before any die is rolled."""
+        dice = DiceBuffer.replay([2, 7])
+
+        async def choose(pool):
+            assert pool == 2 and dice._pos == 0
+            return 9
+
+        assert run(roll_session(2, ed=choose, rng=dice)).dice == [2, 7, 9]
+        assert run(roll_session(2, ed=10, rng=DiceBuffer.replay([2, 7]))).dice == [2, 7, 10]
+
+    def test_invalid_value(self):
+        async def choose(roll):
+            return 11
+
+        with pytest.raises(ValueError):
+            run(roll_session(3, md=choose))
+
+    def test_concurrent_sessions(self):
+        """Thousands of sessions wait for their callbacks at the same time and share one dice buffer."""
+        waiting = []
+
+        async def choose(roll):
+            waiting.append(roll)
+            await asyncio.sleep(0.01)
+            return 10
+
+        async def main():
+            rolls = await asyncio.gather(*(roll_session(4, md=choose) for x in range(2000)))
+            return rolls, loop_dice()
+
+        rolls, buffer = run(main())
+
+        assert len(waiting) == 2000
+        assert all(len(roll) == 5 and 10 in roll.dice for roll in rolls)
+        assert len(buffer._dice) == 65536
+
+
+class TestBots:
+    """Tests for the solver callbacks and contest sessions."""
+
+    def test_solver_md(self):
+        roll = run(roll_session(4, md=solver_md(goal="width"), rng=DiceBuffer.replay([2, 5, 5, 9])))
+
+        assert roll.dice == [2, 5, 5, 5, 9]
+
+    def test_solver_ed(self):
+        roll = run(roll_session(3, ed=solver_ed(), rng=DiceBuffer.replay([1, 2, 3])))
+
+        assert roll.dice == [1, 2, 3, 10]
+
+    def test_contest_session(self):
+        result, roll1, roll2 = run(contest_session(3, 3, md1=solver_md(), rng=DiceBuffer(random.Random(1))))
+
+        assert result is True
+        assert len(roll1) == 4 and len(roll2) == 3
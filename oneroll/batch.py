@@ -0,0 +1,403 @@
+import numpy as np
+
+from .core import Roll
+
+FACES = np.arange(1, 11, dtype=np.uint8)
+
+# Rows per block when building histograms, keeps the temporary index arrays small.
+_CHUNK = 1 << 20
+
+
+def histograms(dice):
+    """
+    Count the faces of every roll in a 2-D array of dice.
+
+    :param dice: Array of shape (n_rolls, pool_size) holding die values from 1 to 10.
+    :return: Array of shape (n_rolls, 10); column i holds the number of dice showing i + 1.
+    """
+    dice = np.asarray(dice)
+    n_rolls, pool_size = dice.shape
+    dtype = np.uint8 if pool_size < 256 else np.uint16
+    counts = np.empty((n_rolls, 10), dtype=dtype)
+
+    for start in range(0, n_rolls, _CHUNK):
+        block = dice[start:start + _CHUNK]
+        rows = len(block)
+        index = block.astype(np.intp) + (np.arange(rows, dtype=np.intp) * 11)[:, None]
+        counts[start:start + rows] = np.bincount(index.ravel(), minlength=11 * rows).reshape(rows, 11)[:, 1:]
+
+    return counts
+
+
+def roll_pools(sizes, rng=None):
+    """
+    Roll many pools of different sizes at once.
+
+    :param sizes: Array-like of the number of dice of every pool.
+    :param rng: numpy.random.Generator or seed.
+    :return: Array of shape (len(sizes), 10) of the face histograms of the rolls, like histograms().
+    """
+    sizes = np.asarray(sizes, dtype=np.intp).ravel()
+    rng = np.random.default_rng(rng)
+    width = int(sizes.max()) if len(sizes) else 0
+    counts = np.empty((len(sizes), 10), dtype=np.uint8 if width < 256 else np.uint16)
+
+    if len(sizes) and sizes.min() < 0:
+        raise ValueError("Pool sizes can not be negative.")
+
+    for start in range(0, len(sizes), _CHUNK):
+        block = sizes[start:start + _CHUNK]
+        # Slots past the size of a pool hold 0, which histograms() does not count.
+        dice = rng.integers(1, 11, size=(len(block), width), dtype=np.uint8)
+        dice[np.arange(width) >= block[:, None]] = 0
+        counts[start:start + len(block)] = histograms(dice)
+
+    return counts
+
+
+def sorted_dice(counts):
+    """
+    Expand face histograms back into sorted dice.
+
+    :param counts: Array of shape (n_rolls, 10) as returned by histograms(). All rows must sum to the same pool size.
+    :return: uint8 array of shape (n_rolls, pool_size), each row sorted ascending.
+    """
+    counts = np.asarray(counts)
+    n_rolls = len(counts)
+    pool_size = int(counts[0].sum()) if n_rolls else 0
+
+    return np.repeat(np.tile(FACES, n_rolls), counts.ravel()).reshape(n_rolls, pool_size)
+
+
+def highest_matches(counts):
+    """
+    Match with the largest height of every face histogram, like Roll.highest.
+
+    :param counts: Array of shape (n_rolls, 10) as returned by histograms().
+    :return: Array of shape (n_rolls, 2) holding (width, height); (0, 0) for rolls without a Match.
+    """
+    counts = np.asarray(counts)
+    face = 9 - np.argmax((counts > 1)[:, ::-1], axis=1)
+
+    return _pairs(counts, face)
+
+
+def widest_matches(counts):
+    """
+    Match with the largest width of every face histogram, with the same tiebreak as Roll.widest.
+
+    :param counts: Array of shape (n_rolls, 10) as returned by histograms().
+    :return: Array of shape (n_rolls, 2) holding (width, height); (0, 0) for rolls without a Match.
+    """
+    counts = np.asarray(counts)
+    rows = np.arange(len(counts))
+
+    width = counts.max(axis=1)
+    face = np.argmax(counts == width[:, None], axis=1)
+
+    # Roll.widest prefers the highest Match whenever it is as wide as the widest one.
+    high_face = 9 - np.argmax((counts > 1)[:, ::-1], axis=1)
+    face = np.where(counts[rows, high_face] == width, high_face, face)
+
+    return _pairs(counts, face)
+
+
+def limit_widths(counts, rng):
+    """
+    Reroll dice of Matches wider than 5 in place, with the same distribution as Roll(limit_width=True).
+
+    Rerolling a die of the widest Match until no Match is wider than 5 leaves every wide
+    Match at width 5, with each extra die on a face it rolled that had fewer than 5 dice.
+    A die rolled until it lands on such a face shows each of them with equal chance, so
+    every extra die is placed directly on one of the open faces, all rolls at once.
+
+    :param counts: Array of shape (n_rolls, 10) as returned by histograms(); changed in place.
+    :param rng: numpy.random.Generator
+    """
+    if len(counts) and counts.sum(axis=1).max() > 50:
+        raise ValueError("More than 50 dice can not be limited to Matches of width 5.")
+
+    rows = np.nonzero(counts.max(axis=1) > 5)[0]
+    wide = counts[rows]
+    left = np.where(wide > 5, wide - 5, 0).sum(axis=1)
+    np.minimum(wide, 5, out=wide)
+
+    active = np.arange(len(rows))
+
+    while len(active):
+        open_faces = wide[active] < 5
+        pick = rng.integers(0, open_faces.sum(axis=1))
+        face = (open_faces.cumsum(axis=1) > pick[:, None]).argmax(axis=1)
+        wide[active, face] += 1
+
+        left[active] -= 1
+        active = active[left[active] > 0]
+
+    counts[rows] = wide
+
+
+def _pairs(counts, face):
+    pairs = np.zeros((len(counts), 2), dtype=counts.dtype)
+    pairs[:, 0] = counts[np.arange(len(counts)), face]
+    pairs[:, 1] = face + 1
+    pairs[~(counts > 1).any(axis=1)] = 0
+    return pairs
+
+
+class RollBatch:
+    """
+    Many ORE rolls of the same pool, stored as one 2-D array of dice.
+
+    Every property is computed for all rolls at once and agrees with the matching
+    property of a single Roll made from the same dice.
+
+        >>> batch = RollBatch(1000000, 6, rng=1)
+        >>> batch.dice.shape
+        (1000000, 6)
+        >>> batch[0]
+        Roll(x=[2, 5, 8, 9, 10, 10])
+        >>> batch.highest[0]
+        array([ 2, 10], dtype=uint8)
+
+    :param n_rolls: Number of rolls in the batch.
+    :param pool_size: Number of dice to roll per roll.
+    :param penalty: Number of penalty dice, subtracted from pool_size before rolling.
+    :param over10: Allow rolling more than 10 dice.
+    :param limit_width: Limit width of Matches to maximum of 5, by rerolling dice like Roll does.
+    :param rng: numpy.random.Generator or seed used for rolling.
+    """
+
+    def __init__(self, n_rolls, pool_size=4, penalty=0, over10=False, limit_width=False, rng=None):
+        self.penalty = penalty
+        self.over10 = over10
+        self.limit_width = limit_width
+
+        x = max(pool_size - penalty, 0)
+
+        if not over10:
+            x = min(x, 10)
+
+        rng = np.random.default_rng(rng)
+        raw = rng.integers(1, 11, size=(n_rolls, x), dtype=np.uint8)
+
+        self._counts = histograms(raw)
+
+        if limit_width:
+            limit_widths(self._counts, rng)
+
+        self.dice = sorted_dice(self._counts)
+
+    @classmethod
+    def from_dice(cls, dice, penalty=0, over10=None, limit_width=False):
+        """
+        Build a batch from already rolled dice.
+
+        :param dice: Array-like of shape (n_rolls, pool_size) with die values from 1 to 10.
+        :param penalty: Penalty recorded on the batch.
+        :param over10: over10 flag recorded on the batch. Defaults to whether the pool has more than 10 dice.
+        :param limit_width: limit_width flag recorded on the batch. The dice are not changed.
+        :return: RollBatch
+        """
+        dice = np.asarray(dice, dtype=np.uint8)
+
+        if dice.ndim != 2:
+            raise ValueError("2-D array of dice expected but got {} dimensions.".format(dice.ndim))
+
+        if dice.size and (dice.min() < 1 or dice.max() > 10):
+            raise ValueError("Die values must be between 1 and 10.")
+
+        batch = cls.__new__(cls)
+        batch.penalty = penalty
+        batch.over10 = dice.shape[1] > 10 if over10 is None else over10
+        batch.limit_width = limit_width
+        batch.dice = np.sort(dice, axis=1)
+        batch._counts = None
+
+        return batch
+
+    @property
+    def pool_size(self):
+        """Number of dice in every roll of the batch."""
+        return self.dice.shape[1]
+
+    @property
+    def counts(self):
+        """
+        Face histogram of every roll.
+
+        :return: Array of shape (n_rolls, 10); column i holds the number of dice showing i + 1.
+        """
+        if self._counts is None:
+            self._counts = histograms(self.dice)
+        return self._counts
+
+    @property
+    def matches(self):
+        """
+        Width of the Match at every height.
+
+        :return: Array of shape (n_rolls, 10); column i holds the width of the Match of height i + 1, or 0.
+        """
+        counts = self.counts
+        return np.where(counts > 1, counts, 0).astype(counts.dtype)
+
+    @property
+    def has_match(self):
+        """
+        Truthiness of every roll's matches.
+
+        :return: Boolean array of shape (n_rolls,).
+        """
+        return (self.counts > 1).any(axis=1)
+
+    @property
+    def waste(self):
+        """
+        Waste die values of every roll.
+
+        :return: Boolean array of shape (n_rolls, 10); column i is True if i + 1 is a waste die.
+        """
+        return self.counts == 1
+
+    @property
+    def highest(self):
+        """
+        Match with the largest height of every roll.
+
+        :return: Array of shape (n_rolls, 2) holding (width, height); (0, 0) for rolls without a Match.
+        """
+        return highest_matches(self.counts)
+
+    @property
+    def widest(self):
+        """
+        Match with the largest width of every roll, with the same tiebreak as Roll.widest.
+
+        :return: Array of shape (n_rolls, 2) holding (width, height); (0, 0) for rolls without a Match.
+        """
+        return widest_matches(self.counts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RollBatch.from_dice(self.dice[index], self.penalty, self.over10, self.limit_width)
+
+        return Roll(self.dice[index].tolist(), penalty=self.penalty, over10=self.over10, limit_width=self.limit_width)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self.dice)
+
+    def __repr__(self):
+        return "RollBatch(n_rolls={}, pool_size={})".format(len(self), self.pool_size)
+
+
+WIN = 1
+LOSE = 0
+NO_MATCH = -1
+
+
+def _contest_counts(pools, n, rng):
+    """Face histograms of the rolls of one side of many contests."""
+    if isinstance(pools, RollBatch):
+        return pools.counts
+
+    pools = np.asarray(pools)
+
+    if pools.ndim == 2:
+        # Pre-rolled dice; 0 marks an empty slot of a shorter roll.
+        if pools.size and (pools.min() < 0 or pools.max() > 10):
+            raise ValueError("Die values must be between 1 and 10.")
+        return histograms(pools)
+
+    # Like Roll(x) for an int: at most 10 dice, and none for a negative x.
+    return roll_pools(np.clip(np.broadcast_to(pools, (n,)), 0, 10), rng)
+
+
+def _contest_size(*pools):
+    sizes = [len(pool) for pool in pools if isinstance(pool, RollBatch) or np.ndim(pool)]
+
+    if len(set(sizes)) > 1:
+        raise ValueError("Contest sides of different lengths: {}.".format(sizes))
+
+    return sizes[0] if sizes else 1
+
+
+def match_heights(counts):
+    """
+    Height of the highest Match of every face histogram, 0 for rolls without a Match.
+
+    :param counts: Array of shape (n_rolls, 10) as returned by histograms().
+    :return: uint8 array of shape (n_rolls,).
+    """
+    return ((np.asarray(counts) > 1) * FACES).max(axis=1)
+
+
+def match_widths(counts):
+    """
+    Width of the widest Match of every face histogram, 0 for rolls without a Match.
+
+    :param counts: Array of shape (n_rolls, 10) as returned by histograms().
+    :return: Array of shape (n_rolls,).
+    """
+    counts = np.asarray(counts)
+    return np.where(counts > 1, counts, 0).max(axis=1)
+
+
+def dynamic_contest_many(pools_a, pools_b, width_wins=False, rng=None):
+    """
+    Many dynamic contests at once, with the semantics of dynamic_contest.
+
+    Each side is either pool sizes, rolled like dynamic_contest rolls an int, or pre-rolled
+    dice: a RollBatch, or a 2-D array of die values, padded with 0 for shorter rolls. A
+    single int is used for every contest.
+
+        >>> dynamic_contest_many([5, 6, 7], 4, rng=9)
+        array([-1,  1,  1], dtype=int8)
+
+    :param pools_a: Pool sizes or dice of the first side.
+    :param pools_b: Pool sizes or dice of the second side.
+    :param width_wins: Compare the widest Matches instead of the highest.
+    :param rng: numpy.random.Generator or seed for rolling pool sizes.
+    :return: int8 array of WIN, LOSE (ties included) or NO_MATCH when neither roll has a Match.
+    """
+    rng = np.random.default_rng(rng)
+    n = _contest_size(pools_a, pools_b)
+    counts_a = _contest_counts(pools_a, n, rng)
+    counts_b = _contest_counts(pools_b, n, rng)
+
+    score = match_widths if width_wins else match_heights
+    score_a, score_b = score(counts_a), score(counts_b)
+
+    codes = (score_a > score_b).astype(np.int8)
+    codes[(score_a == 0) & (score_b == 0)] = NO_MATCH
+
+    return codes
+
+
+def static_contest_many(pools, diffs=1, rng=None):
+    """
+    Many static contests at once, with the semantics of static_contest.
+
+    pools is given like the sides of dynamic_contest_many(). A roll succeeds if its highest
+    Match is at least as high as the difficulty. Rolls without a Match fail, like in
+    static_contest, but are told apart as NO_MATCH.
+
+        >>> static_contest_many([5, 6, 7], [3, 5, 8], rng=9)
+        array([-1,  0,  1], dtype=int8)
+
+    :param pools: Pool sizes or dice.
+    :param diffs: Difficulty of every contest, or one for all.
+    :param rng: numpy.random.Generator or seed for rolling pool sizes.
+    :return: int8 array of WIN, LOSE or NO_MATCH.
+    """
+    rng = np.random.default_rng(rng)
+    n = _contest_size(pools, diffs)
+    heights = match_heights(_contest_counts(pools, n, rng))
+
+    codes = (heights >= np.asarray(diffs)).astype(np.int8)
+    codes[heights == 0] = NO_MATCH
+
+    return codes
@@ -0,0 +1,164 @@
+from oneroll.batch import *
+from oneroll.core import Match, Roll, dynamic_contest, static_contest
+from oneroll.odds import dynamic_odds, static_odds
+import pytest
+
+
+class TestRollBatch:
+    """Tests for the RollBatch class."""
+
+    def test_shape(self):
+        """A RollBatch holds one sorted row of uint8 dice per roll."""
+        batch = RollBatch(100, 6, rng=1)
+
+        assert batch.dice.shape == (100, 6)
+        assert batch.dice.dtype == np.uint8
+        assert (np.diff(batch.dice.astype(int), axis=1) >= 0).all()
+        assert len(batch) == 100
+
+    def test_construction_over10_penalty(self):
+        """Pool sizes are reduced by the penalty and capped at 10 unless over10 is set, like Roll."""
+        assert RollBatch(10, 25).pool_size == 10
+        assert RollBatch(10, 25, over10=True).pool_size == 25
+        assert RollBatch(10, 20, penalty=13).pool_size == 7
+        assert RollBatch(10, 3, penalty=5).pool_size == 0
+
+    def test_from_dice_invalid(self):
+        """Die values outside 1-10 are rejected."""
+        with pytest.raises(ValueError):
+            RollBatch.from_dice([[0, 1, 2]])
+
+        with pytest.raises(ValueError):
+            RollBatch.from_dice([1, 2, 3])
+
+    def test_counts(self):
+        """The face histogram of every roll sums to the pool size."""
+        batch = RollBatch.from_dice([[1, 1, 2, 10], [3, 3, 3, 3]])
+
+        assert batch.counts.tolist() == [[2, 1, 0, 0, 0, 0, 0, 0, 0, 1], [0, 0, 4, 0, 0, 0, 0, 0, 0, 0]]
+
+    @pytest.mark.parametrize("pool_size", [0, 1, 2, 5, 10, 15, 40])
+    def test_same_as_roll(self, pool_size):
+        """Every vectorized property agrees with the property of a Roll made from the same dice."""
+        batch = RollBatch(2000, pool_size, over10=True, rng=pool_size)
+
+        highest = batch.highest
+        widest = batch.widest
+        matches = batch.matches
+        waste = batch.waste
+        has_match = batch.has_match
+
+        for i, roll in enumerate(batch):
+            assert roll.dice == batch.dice[i].tolist()
+            assert tuple(highest[i]) == (roll.highest or (0, 0))
+            assert tuple(widest[i]) == (roll.widest or (0, 0))
+            assert [Match(int(w), h + 1) for h, w in enumerate(matches[i]) if w] == roll.matches
+            assert (FACES[waste[i]]).tolist() == roll.waste
+            assert has_match[i] == bool(roll.matches)
+
+    def test_widest_tiebreak(self):
+        """Equal widths resolve to the highest Match only if it is as wide as the widest one."""
+        batch = RollBatch.from_dice([[2, 2, 2, 5, 5, 5, 9, 9], [2, 2, 2, 5, 5, 9, 9, 9]])
+
+        assert batch.widest.tolist() == [[3, 2], [3, 9]]
+
+    def test_getitem_slice(self):
+        """Slicing a batch returns a smaller batch over the same dice."""
+        batch = RollBatch(10, 4, rng=3)
+
+        assert isinstance(batch[2:5], RollBatch)
+        assert (batch[2:5].dice == batch.dice[2:5]).all()
+
+    def test_limit_width(self):
+        """With limit_width, no Match is wider than 5, and pool sizes stay the same."""
+        batch = RollBatch(2000, 40, over10=True, limit_width=True, rng=4)
+
+        assert batch.counts.max() <= 5
+        assert (batch.counts.sum(axis=1) == 40).all()
+        assert batch[0].limit_width
+        assert RollBatch(2000, 40, over10=True, rng=4).counts.max() > 5
+
+    def test_limit_width_distribution(self):
+        """Chi-square test of the dice on face 10 against Roll(limit_width=True)."""
+        import random
+        from collections import Counter
+
+        n = 3000
+        batch = Counter(RollBatch(n, 45, over10=True, limit_width=True, rng=5).counts[:, 9].tolist())
+        rng = random.Random(5)
+        rolls = Counter(Roll(45, over10=True, limit_width=True, rng=rng).counts[9] for x in range(n))
+
+        chi2 = 0
+        for width in range(6):
+            expected = (batch[width] + rolls[width]) / 2
+            if expected:
+                chi2 += ((batch[width] - expected) ** 2 + (rolls[width] - expected) ** 2) / expected
+
+        assert chi2 < 20.52     # 5 degrees of freedom, p = 0.001
+
+
+class TestRollPools:
+    """Tests for roll_pools."""
+
+    def test_sizes(self):
+        sizes = [0, 1, 5, 10, 3] * 200
+        counts = roll_pools(sizes, rng=1)
+
+        assert counts.shape == (1000, 10)
+        assert counts.sum(axis=1).tolist() == sizes
+
+    def test_faces(self):
+        """Every face comes up equally often."""
+        counts = roll_pools([10] * 10000, rng=2).sum(axis=0)
+
+        assert abs(counts / 10000 - 1).max() < 0.05
+
+    def test_negative(self):
+        with pytest.raises(ValueError):
+            roll_pools([3, -1])
+
+
+class TestContestMany:
+    """Tests for dynamic_contest_many and static_contest_many."""
+
+    codes = {True: WIN, False: LOSE, None: NO_MATCH}
+
+    @pytest.mark.parametrize("width_wins", [False, True])
+    def test_same_as_dynamic_contest(self, width_wins):
+        """Pre-rolled dice give the results of dynamic_contest on the same rolls."""
+        batch_a, batch_b = RollBatch(3000, 5, rng=1), RollBatch(3000, 4, rng=2)
+
+        assert dynamic_contest_many(batch_a, batch_b.dice, width_wins=width_wins).tolist() == \
+               [self.codes[dynamic_contest(a, b, width_wins=width_wins)] for a, b in zip(batch_a, batch_b)]
+
+    def test_padded_dice(self):
+        dice = [[2, 2, 0, 0], [3, 4, 5, 0], [7, 7, 7, 1]]
+        rolls = [Roll([2, 2]), Roll([3, 4, 5]), Roll([7, 7, 7, 1])]
+
+        assert dynamic_contest_many(dice, dice[::-1]).tolist() == \
+               [self.codes[dynamic_contest(a, b)] for a, b in zip(rolls, rolls[::-1])]
+
+    def test_same_as_static_contest(self):
+        batch = RollBatch(3000, 6, rng=3)
+        diffs = np.random.default_rng(4).integers(0, 11, 3000)
+        codes = static_contest_many(batch, diffs)
+
+        assert ((codes == WIN) == [static_contest(roll, int(diff)) for roll, diff in zip(batch, diffs)]).all()
+        assert ((codes == NO_MATCH) == ~batch.has_match).all()
+
+    def test_pool_sizes(self):
+        """Pool sizes are rolled like dynamic_contest rolls ints, capped at 10 dice."""
+        odds = dynamic_odds(10, 4)
+        codes = dynamic_contest_many(np.full(100000, 14), 4, rng=5)
+
+        assert abs((codes == WIN).mean() - float(odds.win)) < 0.01
+        assert abs((codes == NO_MATCH).mean() - float(odds.none)) < 0.01
+
+    def test_static_pool_sizes(self):
+        codes = static_contest_many(np.full(100000, 5), 6, rng=6)
+
+        assert abs((codes == WIN).mean() - float(static_odds(5, 6))) < 0.01
+
+    def test_lengths(self):
+        with pytest.raises(ValueError):
+            dynamic_contest_many([3, 4], [3, 4, 5])
@@ -1,5 +1,7 @@
-from networkx import *
 from .companies import *
+from .network import build_company_network
+from .relations import resolve_relations
+from .tradecenters import trade_centers
 import random
 
 
@@ -11,7 +13,6 @@ def hassolitarynodes(g):
 
 if __name__ == "__main__":
 
-    network = Graph()
     corpus = Corpus()
 
 
@@ -19,44 +20,24 @@ if __name__ == "__main__":
     randComp = [onerollcompany(corpus.randomname(), random.randint(5, 15)) for x in range(30)]
 
 
-    # add Companies as nodes to graph
-    for comp in randComp:
-        if len(network) == 0:
-            network.add_node(comp)
-        else:
-            network.add_edge(choice(network.nodes()), comp)
-
-
-    # throw some random connections into the mix
-    for x in range(5):
-        network.add_edge(choice(network.nodes()), choice(network.nodes()))
+    # link the Companies into a random tree and throw some random connections into the mix
+    companies = build_company_network(randComp, extra_edges=5)
 
 
     # Betweenness centrality for trade centers?
-    for x, y in sorted(list(betweenness_centrality(network).items()), key=lambda x: x[1], reverse=True)[:5]:
+    for x, y in trade_centers(companies, 5):
         print(x)
         print(y)
 
     # build directed relationship graph from network
-    relationships = DiGraph()
-
-
-    for x, y in network.edges():
-        # compare actions
-        print("'{}' vs '{}'".format(x.name, y.name))
-        for k, v in actions.items():
-
-            if v[1]:
-                print(x.stats)
-                print(y.stats)
-                print(k, "{} vs {}".format(v[0], v[1]))
-                pool1 = sum([getattr(x, stat) for stat in v[0]])
-                pool2 = sum([getattr(y, stat) for stat in v[1]])
+    results = resolve_relations(companies)
+    relationships = results.to_networkx()
 
-                print("{} vs {}".format(pool1, pool2))
+    for action, tally in results.outcome_table().items():
+        print("{}: {} won, {} lost, {} without a Match".format(action, tally.wins, tally.losses, tally.none))
 
 
-    #draw(network, labels={node: node.name for node in network})
+    #draw(relationships, labels={node: randComp[node].name for node in relationships})
     #show()
 
 
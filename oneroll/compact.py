@@ -0,0 +1,162 @@
+from .core import Roll, _check_dice, _summarize
+
+_OVER10 = 1
+_LIMIT_WIDTH = 2
+
+
+class CompactRoll:
+    """
+    Memory efficient, immutable variant of Roll for keeping large numbers of rolls around.
+
+    A CompactRoll only stores its face histogram as 10 bytes, and one int for penalty and
+    flags. It has the read-only API of Roll.
+
+        >>> compact = CompactRoll([2, 2, 2, 3, 4, 5, 6, 6])
+        >>> compact.matches
+        [3x2, 2x6]
+        >>> compact.to_roll()
+        Roll(x=[2, 2, 2, 3, 4, 5, 6, 6])
+
+    :param x: py.int, representing number of dice to roll, or py.list of ints from 1 to 10, representing dice values.
+    :param penalty: py.int of penalty dice
+    :param over10: Allow rolling more than 10 dice.
+    :param limit_width: Limit width of oneroll.Match to maximum of 5.
+    """
+    __slots__ = ("_counts", "_flags")
+
+    def __init__(self, x=4, penalty=0, over10=False, limit_width=False):
+
+        if type(x) == int:
+            counts = Roll(x, penalty=penalty, over10=over10, limit_width=limit_width).counts
+
+        elif type(x) == list:
+            _check_dice(x)
+            counts = [0] * 10
+            for value in x:
+                counts[value - 1] += 1
+
+        else:
+            raise TypeError("Int or list expected but {} given.".format(type(x)))
+
+        self._counts = bytes(counts)
+        self._flags = penalty << 2 | (_LIMIT_WIDTH if limit_width else 0) | (_OVER10 if over10 else 0)
+
+    @classmethod
+    def from_roll(cls, roll):
+        """
+        Pack a Roll.
+
+        :param roll: Roll object
+        :return: CompactRoll with the same dice and flags.
+        """
+        return cls._from_counts(roll.counts, roll.penalty, roll.over10, roll.limit_width)
+
+    @classmethod
+    def _from_counts(cls, counts, penalty=0, over10=False, limit_width=False):
+        compact = cls.__new__(cls)
+        compact._counts = bytes(counts)
+        compact._flags = penalty << 2 | (_LIMIT_WIDTH if limit_width else 0) | (_OVER10 if over10 else 0)
+        return compact
+
+    def to_roll(self):
+        """
+        Unpack into a regular, changeable Roll.
+
+        :return: Roll object
+        """
+        return Roll._from_counts(self.dice, list(self._counts), self.penalty, self.over10, self.limit_width)
+
+    @property
+    def penalty(self):
+        return self._flags >> 2
+
+    @property
+    def over10(self):
+        return bool(self._flags & _OVER10)
+
+    @property
+    def limit_width(self):
+        return bool(self._flags & _LIMIT_WIDTH)
+
+    @property
+    def dice(self):
+        """
+        Sorted list of die values. The list is a copy, changing it does not change the CompactRoll.
+        """
+        return [face for face, count in enumerate(self._counts, 1) for y in range(count)]
+
+    @property
+    def counts(self):
+        """
+        Face histogram of the roll.
+
+        :return: Tuple of 10 ints, the number of dice showing each face from 1 to 10.
+        """
+        return tuple(self._counts)
+
+    @property
+    def matches(self):
+        return _summarize(self._counts)[0]
+
+    @property
+    def waste(self):
+        return _summarize(self._counts)[3]
+
+    @property
+    def highest(self):
+        return _summarize(self._counts)[1]
+
+    @property
+    def widest(self):
+        return _summarize(self._counts)[2]
+
+    def __eq__(self, other):
+        """
+        Rolls are equal if their dice have the same values, like Roll.
+
+        :param other: CompactRoll or Roll object
+        :return: Bool
+        """
+        return [count > 0 for count in self._counts] == [count > 0 for count in other.counts]
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __add__(self, other):
+        try:
+            counts = [a + b for a, b in zip(self._counts, other.counts)]
+            over_10 = sum(counts) > 10
+            limit_width = self.limit_width or other.limit_width
+
+            return CompactRoll._from_counts(counts, over10=over_10, limit_width=limit_width)
+        except AttributeError:
+            raise TypeError("Addition not possible between Types CompactRoll and {}.".format(type(other)))
+
+    def __radd__(self, other):
+        if other == 0:
+            return self
+        else:
+            return self.__add__(other)
+
+    def __len__(self):
+        return sum(self._counts)
+
+    def __repr__(self):
+
+        rep = list()
+
+        rep.append("x={}".format(self.dice))
+
+        if self.penalty:
+            rep.append("penalty={}".format(self.penalty))
+
+        if self.over10:
+            rep.append("over10=True")
+
+        if self.limit_width:
+            rep.append("limit_width=True")
+
+        return "CompactRoll(" + ", ".join(rep) + ")"
+
+    def __str__(self):
+        return str(self.matches + self.waste)
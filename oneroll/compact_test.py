@@ -0,0 +1,94 @@
+from oneroll.compact import *
+from oneroll.core import Match
+import gc
+import pytest
+import sys
+import tracemalloc
+
+
+class TestCompactRoll:
+    """Tests for the CompactRoll class."""
+
+    def test_construction(self):
+        with pytest.raises(TypeError):
+            CompactRoll("string")
+
+        with pytest.raises(ValueError):
+            CompactRoll([0, 1])
+
+        assert len(CompactRoll()) == 4
+        assert len(CompactRoll(25)) == 10
+        assert len(CompactRoll(20, penalty=3, over10=True)) == 17
+
+    def test_no_instance_dict(self):
+        assert not hasattr(CompactRoll(), "__dict__")
+
+    def test_same_api_as_roll(self):
+        """A CompactRoll gives the same results as the Roll it was made from."""
+        for x in range(200):
+            roll = Roll(12, over10=True, penalty=x % 3)
+            compact = CompactRoll.from_roll(roll)
+
+            assert compact.dice == roll.dice
+            assert compact.matches == roll.matches
+            assert compact.highest == roll.highest
+            assert compact.widest == roll.widest
+            assert compact.waste == roll.waste
+            assert len(compact) == len(roll)
+            assert str(compact) == str(roll)
+            assert compact.penalty == roll.penalty and compact.over10
+            assert compact == roll and roll == compact
+
+    def test_to_roll(self):
+        compact = CompactRoll([4, 4, 9], penalty=2, limit_width=True)
+        roll = compact.to_roll()
+
+        assert repr(roll) == "Roll(x=[4, 4, 9], penalty=2, limit_width=True)"
+        roll.dice.append(9)
+        assert roll.matches == [Match(2, 4), Match(2, 9)]
+        assert compact.matches == [Match(2, 4)]
+
+    def test_dice_is_a_copy(self):
+        compact = CompactRoll([1, 2, 3])
+        compact.dice.append(3)
+
+        assert compact.matches == []
+
+    def test_memory_released(self):
+        """Nothing is kept for a CompactRoll after it is deleted, without help from the cyclic garbage collector."""
+        def roll_and_drop():
+            rolls = [CompactRoll(15, over10=True) for x in range(5000)]
+            del rolls
+
+        roll_and_drop()     # one-time allocations, eg. of the random module
+        gc.disable()
+        tracemalloc.start()
+
+        try:
+            roll_and_drop()
+            kept = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+            gc.enable()
+
+        assert kept < 10000
+
+    def test_addition(self):
+        roll1 = CompactRoll([1, 2, 3])
+        roll2 = CompactRoll([3, 5])
+
+        assert (roll1 + roll2).dice == [1, 2, 3, 3, 5]
+        assert (roll1 + Roll([1])).matches == [Match(2, 1)]
+        assert sum([roll1, roll2, roll2]).matches == [Match(3, 3), Match(2, 5)]
+        assert (CompactRoll(6) + CompactRoll(6)).over10
+
+        with pytest.raises(TypeError):
+            roll1 + 4
+
+    def test_smaller_than_roll(self):
+        """The instance and its histogram are smaller than a Roll with its __dict__ and dice list."""
+        roll = Roll(15, over10=True)
+        compact = CompactRoll.from_roll(roll)
+
+        roll_size = sys.getsizeof(roll) + sys.getsizeof(roll.__dict__) + sys.getsizeof(roll.dice)
+        assert sys.getsizeof(compact) + sys.getsizeof(compact._counts) < roll_size / 2
@@ -1,15 +1,37 @@
 import os
-from collections import Counter
+from collections import Counter, namedtuple
 from random import choice
 from textwrap import dedent
 
+from . import instrument
 from .core import Roll
 
 
 class Corpus:
     def __init__(self):
-        self.nouns = self.loadwordfile("./nouns.txt")
-        self.adjectives = self.loadwordfile("adjectives.txt")
+        # The word files are read when the first name is made.
+        self._nouns = None
+        self._adjectives = None
+
+    @property
+    def nouns(self):
+        if self._nouns is None:
+            self._nouns = self.loadwordfile("./nouns.txt")
+        return self._nouns
+
+    @nouns.setter
+    def nouns(self, words):
+        self._nouns = words
+
+    @property
+    def adjectives(self):
+        if self._adjectives is None:
+            self._adjectives = self.loadwordfile("adjectives.txt")
+        return self._adjectives
+
+    @adjectives.setter
+    def adjectives(self, words):
+        self._adjectives = words
 
     @property
     def noun(self):
@@ -188,35 +210,120 @@ ORC_table = {
 }
 
 
-def onerollcompany(name="OneRollCompany", dice=15):
+Result = namedtuple("Result", ["name", "deltas", "assets"])
+Result.__doc__ = """\
+One entry of a compiled company table.
+
+:param name: Name of the result.
+:param deltas: Tuple of stat changes, in Company._stats order.
+:param assets: Tuple of asset ids, see CompiledTable.asset_names.
+"""
+
+
+class CompiledTable:
+    """
+    A One Roll Companies table compiled for constant time lookups.
+
+    The nested dicts of names, stat bumps and assets are flattened once into one Result
+    per (height, rank), where rank 1 is the result of a waste die and ranks 2 to 5 are the
+    results of the dice of a Match. Asset names are interned into ids.
+
+        >>> COMPILED_ORC.result(9, 2)
+        Result(name='Expectation of Piety', deltas=(0, 0, 1, 0, 0), assets=(21,))
+        >>> COMPILED_ORC.asset_names[21]
+        'Classic Enemy'
+
+    :param table: Dict of height: {rank: [name, (stat, value) or ("assets", name), ...]}, like ORC_table.
+    """
+
+    def __init__(self, table):
+        self.asset_names = []
+        self.results = [None] * 50
+        asset_ids = {}
+
+        for height in range(1, 11):
+            for rank in range(1, 6):
+                name, *effects = table[height][rank]
+                deltas = [0] * 5
+                assets = []
+
+                for stat, value in effects:
+                    if stat == "assets":
+                        if value not in asset_ids:
+                            asset_ids[value] = len(self.asset_names)
+                            self.asset_names.append(value)
+                        assets.append(asset_ids[value])
+                    else:
+                        deltas[Company._stats.index(stat)] += value
+
+                self.results[(height - 1) * 5 + rank - 1] = Result(name, tuple(deltas), tuple(assets))
+
+    def result(self, height, rank):
+        """
+        Look up a result.
 
+        :param height: Height of the Match or value of the waste die.
+        :param rank: 1 for a waste die, 2 to 5 for the dice of a Match.
+        :return: Result
+        """
+        return self.results[(height - 1) * 5 + rank - 1]
+
+    def roll_results(self, roll):
+        """
+        All results of a company roll: those of the Matches by height, then those of the waste dice.
+
+        :param roll: Roll with no Match wider than 5.
+        :return: List of Result objects.
+        """
+        results = self.results
+        found = []
+
+        for width, height in roll.matches:
+            found.extend(results[(height - 1) * 5 + rank - 1] for rank in range(2, width + 1))
+
+        found.extend(results[(die - 1) * 5] for die in roll.waste)
+
+        return found
+
+
+COMPILED_ORC = CompiledTable(ORC_table)
+
+
+def onerollcompany(name="OneRollCompany", dice=15, rng=None, table=COMPILED_ORC):
+    """
+    Randomly generate a company with the One Roll Companies rules.
+
+    :param name: Name of the company.
+    :param dice: Number of dice to roll.
+    :param rng: Source of random dice, see Roll.
+    :param table: CompiledTable, or a dict like ORC_table, of the results to use.
+    :return: Company object.
+    """
+    if not isinstance(table, CompiledTable):
+        table = CompiledTable(table)
+
+    started = instrument.enabled and instrument.start()
     company = Company(name, (0, 0, 1, 0, 0))
-    roll = Roll(dice, over10=True, limit_width=True)
+    roll = Roll(dice, over10=True, limit_width=True, rng=rng)
 
     company.roll = roll
-    results = []
-
-    # get Match results
-    for match in roll.matches:
-        width = match[0]
-        height = match[1]
-
-        results.extend([ORC_table[height][x] for x in range(2, width +1)])
-
-    # get Waste Die results
-    results += [ORC_table[die][1] for die in roll.waste]
-    print("Processing Results")
-    for res in results:
-        for i in res:
-            if type(i) == str:
-                pass  # maybe do something useful with those strings
-            else:
-                if type(i[1]) == str:
-                    print(i)
-                    company.assets.append(i[1])
-                    print(len(company.assets))
-                else:
-                    setattr(company, i[0], getattr(company, i[0]) + i[1])
+    stats = [0, 0, 1, 0, 0]
+
+    for result in table.roll_results(roll):
+        stats = [a + b for a, b in zip(stats, result.deltas)]
+
+        for asset in result.assets:
+            company.assets.append(table.asset_names[asset])
+            if instrument.enabled:
+                instrument.event("company_assets", company=company, asset=table.asset_names[asset])
+
+    for stat, value in zip(Company._stats, stats):
+        setattr(company, stat, value)
+
+    if started:
+        instrument.event("companies")
+        instrument.observe("company", started)
+
     return company
 
 
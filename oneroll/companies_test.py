@@ -0,0 +1,70 @@
+from oneroll.companies import *
+from oneroll.core import Roll
+import random
+
+
+class TestCompiledTable:
+    """Tests for the CompiledTable class."""
+
+    def test_results(self):
+        """Every (height, rank) entry of the table compiles to its name, stat changes and assets."""
+        for height, ranks in ORC_table.items():
+            for rank, (name, *effects) in ranks.items():
+                result = COMPILED_ORC.result(height, rank)
+                stats = dict(zip(Company._stats, result.deltas))
+                assets = [COMPILED_ORC.asset_names[x] for x in result.assets]
+
+                assert result.name == name
+                assert sum(result.deltas) == sum(value for stat, value in effects if stat != "assets")
+                assert all(stats[stat] >= value for stat, value in effects if stat != "assets")
+                assert assets == [value for stat, value in effects if stat == "assets"]
+
+    def test_interned_assets(self):
+        """Asset names are stored once each."""
+        assert len(COMPILED_ORC.asset_names) == len(set(COMPILED_ORC.asset_names))
+
+    def test_roll_results(self):
+        results = COMPILED_ORC.roll_results(Roll([1, 1, 1, 4, 10]))
+
+        assert [result.name for result in results] == ["Gossipy Old Folks", "Paid Network of Informants",
+                                                       "Exotic Crop", "Culture of Inquisitiveness"]
+
+
+class TestOneRollCompany:
+    """Tests for onerollcompany."""
+
+    def test_stats(self):
+        """A company's stats are the base stats plus the changes of all its roll's results."""
+        for seed in range(50):
+            company = onerollcompany(rng=random.Random(seed))
+            deltas = [result.deltas for result in COMPILED_ORC.roll_results(company.roll)]
+
+            assert company.stats_tuple == tuple(sum(x) for x in zip((0, 0, 1, 0, 0), *deltas))
+            assert company.size == sum(company.stats_tuple) + len(company.assets)
+
+    def test_custom_table(self):
+        """onerollcompany accepts alternate tables, compiled or not."""
+        table = {height: {rank: ["Gold", ("treasure", 2)] for rank in range(1, 6)} for height in range(1, 11)}
+
+        company = onerollcompany(dice=10, rng=random.Random(1), table=table)
+        assert company.treasure == 2 * (len(company.roll.waste) + sum(m.width - 1 for m in company.roll.matches))
+
+        company = onerollcompany(dice=10, rng=random.Random(1), table=CompiledTable(table))
+        assert company.might == 0 and company.assets == []
+
+
+class TestCorpus:
+    """Tests for the Corpus class."""
+
+    def test_lazy_words(self, tmp_path, monkeypatch):
+        """Word files are read when the first name is made, from the working directory."""
+        monkeypatch.chdir(tmp_path)
+        corpus = Corpus()
+
+        (tmp_path / "nouns.txt").write_text("falcon\n")
+        (tmp_path / "adjectives.txt").write_text("Red\n")
+
+        assert corpus.randomname() == "The Red Falcon"
+
+        corpus.nouns = ["tower"]
+        assert corpus.randomname() == "The Red Tower"
@@ -0,0 +1,345 @@
+"""
+Columnar storage for large numbers of companies.
+
+A CompanyTable keeps one int16 column per stat, the assets of all companies as one flat
+array of asset ids with offsets per company (CSR), and an int16 usage matrix in place of
+the per company Counter of Company.used. Rows are accessed through CompanyView objects,
+which behave like Company but only hold a reference to the table and a row number.
+
+    >>> table = generate_companies(100000, columns=True, rng=1)
+    >>> strong = table.filter(table.might >= 3).sort_by("size", reverse=True)
+    >>> strong[0].name
+    'OneRollCompany'
+"""
+from collections import Counter
+from textwrap import dedent
+
+import numpy as np
+
+from .companies import Company
+from .core import Roll
+
+
+def _stat_column(index):
+    def get(self):
+        return self.stats[:, index]
+
+    def set(self, values):
+        self.stats[:, index] = values
+
+    return property(get, set, doc="Column of {} values.".format(Company._stats[index]))
+
+
+class CompanyTable:
+    """
+    Struct-of-arrays store of companies.
+
+    :param names: Sequence of company names.
+    :param stats: Array-like of shape (n, 5) of stats in Company._stats order.
+    :param asset_ids: Flat array of asset ids of all companies.
+    :param asset_offsets: Array of shape (n + 1,); the assets of company i are asset_ids[asset_offsets[i]:asset_offsets[i + 1]].
+    :param asset_names: List of asset names, indexed by id.
+    :param counts: Optional uint8 array of shape (n, 10) of the face histograms of the company rolls.
+    """
+
+    influence = _stat_column(0)
+    might = _stat_column(1)
+    sovereignty = _stat_column(2)
+    territory = _stat_column(3)
+    treasure = _stat_column(4)
+
+    def __init__(self, names, stats, asset_ids=(), asset_offsets=None, asset_names=(), counts=None):
+        self.names = list(names)
+        self.stats = np.array(stats, dtype=np.int16).reshape(-1, 5)
+        self.asset_ids = np.array(asset_ids, dtype=np.int32)
+        self.asset_offsets = (np.zeros(len(self.names) + 1, dtype=np.int64) if asset_offsets is None
+                              else np.array(asset_offsets, dtype=np.int64))
+        self.asset_names = list(asset_names)
+        self.used = np.zeros_like(self.stats)
+        self.counts = None if counts is None else np.array(counts, dtype=np.uint8).reshape(-1, 10)
+
+        if not len(self.names) == len(self.stats) == len(self.asset_offsets) - 1:
+            raise ValueError("Names, stats and asset offsets must describe the same number of companies.")
+
+        if self.counts is not None and len(self.counts) != len(self.names):
+            raise ValueError("{} roll histograms given for {} companies.".format(len(self.counts), len(self.names)))
+
+    @classmethod
+    def from_companies(cls, companies):
+        """
+        Build a table from Company objects.
+
+        :param companies: Iterable of Company objects.
+        :return: CompanyTable
+        """
+        companies = list(companies)
+        asset_names = []
+        asset_ids = {}
+        ids = []
+        offsets = [0]
+
+        for company in companies:
+            for asset in company.assets:
+                if asset not in asset_ids:
+                    asset_ids[asset] = len(asset_names)
+                    asset_names.append(asset)
+                ids.append(asset_ids[asset])
+            offsets.append(len(ids))
+
+        counts = None
+        if companies and all(company.roll is not None for company in companies):
+            counts = [company.roll.counts for company in companies]
+
+        table = cls([company.name for company in companies],
+                    [company.stats_tuple for company in companies],
+                    ids, offsets, asset_names, counts)
+
+        for row, company in enumerate(companies):
+            for stat, count in company.used.items():
+                table.used[row, Company._stats.index(stat)] = count
+
+        return table
+
+    @classmethod
+    def concat(cls, tables):
+        """
+        One table of the companies of several tables, in order.
+
+        :param tables: Non-empty sequence of CompanyTable objects with the same asset names.
+        :return: CompanyTable
+        """
+        tables = list(tables)
+
+        if any(table.asset_names != tables[0].asset_names for table in tables):
+            raise ValueError("Tables with different asset names can not be joined.")
+
+        offsets = []
+        base = 0
+        for table in tables:
+            offsets.append(table.asset_offsets[:-1] + base)
+            base += len(table.asset_ids)
+        offsets.append(tables[-1].asset_offsets[-1:] + base - len(tables[-1].asset_ids))
+
+        counts = None
+        if all(table.counts is not None for table in tables):
+            counts = np.concatenate([table.counts for table in tables])
+
+        result = cls([name for table in tables for name in table.names],
+                     np.concatenate([table.stats for table in tables]),
+                     np.concatenate([table.asset_ids for table in tables]),
+                     np.concatenate(offsets), tables[0].asset_names, counts)
+        result.used = np.concatenate([table.used for table in tables])
+
+        return result
+
+    def to_companies(self):
+        """
+        Turn every row into a stand-alone Company object.
+
+        :return: List of Company objects.
+        """
+        companies = []
+
+        for view in self:
+            company = Company(view.name, view.stats_tuple, view.assets)
+            company.used.update(view.used)
+            company.roll = view.roll
+            companies.append(company)
+
+        return companies
+
+    @property
+    def asset_counts(self):
+        """Number of assets of every company."""
+        return np.diff(self.asset_offsets)
+
+    @property
+    def size(self):
+        """Company size, ie. sum of stats and number of assets, of every company."""
+        return self.stats.sum(axis=1, dtype=np.int64) + self.asset_counts
+
+    def assets(self, row):
+        """
+        Asset names of one company.
+
+        :param row: Row number.
+        :return: List of str.
+        """
+        ids = self.asset_ids[self.asset_offsets[row]:self.asset_offsets[row + 1]]
+        return [self.asset_names[x] for x in ids.tolist()]
+
+    def take(self, rows):
+        """
+        New table of the given rows, in the given order.
+
+        :param rows: Array of row numbers.
+        :return: CompanyTable
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        starts, counts = self.asset_offsets[rows], self.asset_counts[rows]
+
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        offsets[1:] = counts.cumsum()
+        index = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+
+        table = CompanyTable([self.names[x] for x in rows.tolist()], self.stats[rows],
+                             self.asset_ids[index], offsets, self.asset_names,
+                             None if self.counts is None else self.counts[rows])
+        table.used = self.used[rows]
+
+        return table
+
+    def filter(self, mask):
+        """
+        New table of the companies where mask is True, eg. table.filter(table.might >= 3).
+
+        :param mask: Boolean array with one value per company.
+        :return: CompanyTable
+        """
+        return self.take(np.nonzero(mask)[0])
+
+    def sort_by(self, key, reverse=False):
+        """
+        New table sorted by a stat, "size", or an array of sort keys. The sort is stable.
+
+        :param key: Stat name, "size", or array with one value per company.
+        :param reverse: Sort in descending order.
+        :return: CompanyTable
+        """
+        values = getattr(self, key) if isinstance(key, str) else np.asarray(key)
+
+        if reverse:
+            values = -values.astype(np.int64)
+
+        return self.take(np.argsort(values, kind="stable"))
+
+    def refresh(self):
+        """Clear the stat usage of all companies."""
+        self.used[:] = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if not -len(self) <= index < len(self):
+                raise IndexError("Company index out of range.")
+            return CompanyView(self, index % len(self))
+
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+
+        index = np.asarray(index)
+        return self.filter(index) if index.dtype == bool else self.take(index)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield CompanyView(self, row)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return "CompanyTable(companies={})".format(len(self))
+
+
+def _view_stat(index):
+    def get(self):
+        return int(self._table.stats[self._row, index])
+
+    def set(self, value):
+        self._table.stats[self._row, index] = value
+
+    return property(get, set)
+
+
+class CompanyView:
+    """
+    One row of a CompanyTable, with the attributes of a Company.
+
+    Changing a stat of the view changes the table.
+
+    :param table: CompanyTable
+    :param row: Row number.
+    """
+    __slots__ = ("_table", "_row")
+
+    influence = _view_stat(0)
+    might = _view_stat(1)
+    sovereignty = _view_stat(2)
+    territory = _view_stat(3)
+    treasure = _view_stat(4)
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self):
+        return self._table.names[self._row]
+
+    @property
+    def assets(self):
+        return self._table.assets(self._row)
+
+    @property
+    def size(self):
+        return sum(self.stats_tuple) + int(self._table.asset_counts[self._row])
+
+    @property
+    def stats(self):
+        return dict(zip(Company._stats, self.stats_tuple))
+
+    @property
+    def stats_tuple(self):
+        return tuple(self._table.stats[self._row].tolist())
+
+    @property
+    def roll(self):
+        """Roll of the company, or None if the table holds no rolls."""
+        if self._table.counts is None:
+            return None
+
+        counts = self._table.counts[self._row].tolist()
+        dice = [face for face, count in enumerate(counts, 1) for x in range(count)]
+
+        return Roll._from_counts(dice, counts, over10=True, limit_width=True)
+
+    @property
+    def used(self):
+        """Stat usage of the company as a Counter. The Counter is a copy, use use() to change it."""
+        return Counter({stat: count for stat, count in zip(Company._stats, self._table.used[self._row].tolist())
+                        if count})
+
+    def use(self, stat, amount=1):
+        """
+        Record usage of a stat.
+
+        :param stat: Stat name.
+        :param amount: Number of uses.
+        """
+        self._table.used[self._row, Company._stats.index(stat)] += amount
+
+    def refresh(self):
+        """Clear stat usage of the company."""
+        self._table.used[self._row] = 0
+
+    def __eq__(self, other):
+        return isinstance(other, CompanyView) and self._table is other._table and self._row == other._row
+
+    def __hash__(self):
+        return hash((id(self._table), self._row))
+
+    def __repr__(self):
+        return "CompanyView(name={p.name}, row={p._row})".format(p=self)
+
+    def __str__(self):
+        stringrep = """\
+                    {c.name}:
+
+                    Influence: {c.influence}
+                    Might: {c.might}
+                    Sovereignty: {c.sovereignty}
+                    Territory: {c.territory}
+                    Treasure: {c.treasure}
+
+                    Assets: {c.assets}"""
+
+        return dedent(stringrep).format(c=self)
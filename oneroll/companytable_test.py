@@ -0,0 +1,109 @@
+from oneroll.companytable import *
+from oneroll.companies import Company
+from oneroll.generate import generate_companies
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def companies():
+    return generate_companies(300, dice=[5, 10, 15] * 100, rng=4)
+
+
+class TestCompanyTable:
+    """Tests for the CompanyTable class."""
+
+    def test_round_trip(self, companies):
+        """Companies turned into a table and back keep their stats, assets, usage and rolls."""
+        companies[3].used["might"] += 2
+        table = CompanyTable.from_companies(companies)
+
+        for company, copy in zip(companies, table.to_companies()):
+            assert copy.name == company.name
+            assert copy.stats_tuple == company.stats_tuple
+            assert copy.assets == company.assets
+            assert copy.used == company.used
+            assert copy.roll == company.roll
+
+    def test_columns(self, companies):
+        table = CompanyTable.from_companies(companies)
+
+        assert table.stats.dtype == np.int16
+        assert table.might.tolist() == [company.might for company in companies]
+        assert table.size.tolist() == [company.size for company in companies]
+
+    def test_filter(self, companies):
+        table = CompanyTable.from_companies(companies)
+        strong = table.filter(table.might >= 2)
+
+        assert [view.stats_tuple for view in strong] == \
+               [company.stats_tuple for company in companies if company.might >= 2]
+        assert [view.assets for view in strong] == [company.assets for company in companies if company.might >= 2]
+
+    def test_sort_by(self, companies):
+        """Sorting is stable and keeps the assets with their company."""
+        table = CompanyTable.from_companies(companies)
+        ordered = sorted(companies, key=lambda company: company.size, reverse=True)
+
+        assert [(view.size, view.assets) for view in table.sort_by("size", reverse=True)] == \
+               [(company.size, company.assets) for company in ordered]
+        assert table.sort_by("treasure").treasure.tolist() == sorted(table.treasure.tolist())
+
+    def test_indexing(self, companies):
+        table = CompanyTable.from_companies(companies)
+
+        assert table[-1].stats_tuple == companies[-1].stats_tuple
+        assert [view.assets for view in table[10:20]] == [company.assets for company in companies[10:20]]
+        assert [view.might for view in table[[5, 1]]] == [companies[5].might, companies[1].might]
+
+        with pytest.raises(IndexError):
+            table[len(table)]
+
+    def test_concat(self, companies):
+        table = CompanyTable.from_companies(companies)
+        table.used[7, 1] = 3
+        joined = CompanyTable.concat([table[:7], table[7:8], table[8:8], table[8:]])
+
+        assert [(view.name, view.stats_tuple, view.assets, view.used) for view in joined] == \
+               [(view.name, view.stats_tuple, view.assets, view.used) for view in table]
+        assert (joined.counts == table.counts).all()
+
+        with pytest.raises(ValueError):
+            CompanyTable.concat([table, CompanyTable(["A"], [(0, 0, 1, 0, 0)])])
+
+    def test_mismatched_columns(self):
+        with pytest.raises(ValueError):
+            CompanyTable(["A", "B"], [(0, 0, 1, 0, 0)])
+
+
+class TestCompanyView:
+    """Tests for the CompanyView class."""
+
+    def test_writes_through(self):
+        table = CompanyTable(["A", "B"], [(0, 0, 1, 0, 0), (1, 2, 3, 4, 5)])
+        view = table[1]
+        view.might = 7
+
+        assert table.might.tolist() == [0, 7]
+        assert table[1].stats == {"influence": 1, "might": 7, "sovereignty": 3, "territory": 4, "treasure": 5}
+
+    def test_usage(self):
+        """Stat usage is kept in the table's usage matrix."""
+        table = CompanyTable(["A", "B"], [(0, 0, 1, 0, 0), (1, 2, 3, 4, 5)])
+        table[0].use("might")
+        table[0].use("might", 2)
+
+        assert table[0].used == {"might": 3}
+        assert table.used[0, Company._stats.index("might")] == 3
+
+        table[0].refresh()
+        assert not table[0].used
+
+    def test_slots(self):
+        view = CompanyTable(["A"], [(0, 0, 1, 0, 0)])[0]
+
+        with pytest.raises(AttributeError):
+            view.extra = 1
+
+    def test_no_rolls(self):
+        assert CompanyTable(["A"], [(0, 0, 1, 0, 0)])[0].roll is None
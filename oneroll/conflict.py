@@ -0,0 +1,157 @@
+"""
+Conflicts between any number of ORE rolls.
+
+Every participant declares one or more actions with a single roll. The Matches of the roll
+are given to the actions in order of declaration, fastest Match first. All Matches of all
+participants then resolve in order of width, then height; at equal speed defenses go first.
+
+A defense turns its Match into gobble dice that protect a participant, the defender itself
+unless it names another target. When a later action targets a protected participant, the
+protecting gobble dice of at least its height remove dice from its Match until it is
+ruined, lowest usable gobble dice first. This is gobble_match() applied across all
+participants. Because defenses only count once they have resolved, gobble dice of a
+slower Match never touch a faster one.
+
+Gobble dice are kept as per-height counts, so resolving a skirmish of hundreds of
+participants never creates objects per die.
+
+    >>> conflict = Conflict()
+    >>> conflict.add("Guard", Roll([4, 4, 4, 9]), "defend")
+    >>> conflict.add("Thief", Roll([3, 3, 7, 7]), "steal", ("attack", "Guard"))
+    >>> [(result.actor, result.action, result.height, result.success) for result in conflict.resolve()]
+    [('Guard', 'defend', 4, True), ('Thief', 'steal', 7, True), ('Thief', 'attack', 3, False)]
+"""
+from collections import namedtuple
+
+DEFEND = "defend"
+
+
+class Result(namedtuple("Result", ["actor", "action", "target", "width", "height", "gobbled"])):
+    """
+    Outcome of one declared action.
+
+    :param actor: Name of the participant.
+    :param action: Kind of action, eg. "attack" or DEFEND.
+    :param target: Name of the target, or None.
+    :param width: Width of the Match used, 0 if the roll had no Match left for the action.
+    :param height: Height of the Match used, 0 if the roll had no Match left for the action.
+    :param gobbled: Dice removed from the Match by gobble dice.
+    """
+    __slots__ = ()
+
+    @property
+    def effective_width(self):
+        """Width of the Match after gobble dice were applied."""
+        return self.width - self.gobbled
+
+    @property
+    def success(self):
+        """True if the action kept a Match of at least 2 dice."""
+        return self.effective_width > 1
+
+
+def multiple_action_pool(dice, actions):
+    """
+    Dice to roll when declaring several actions: one die fewer for every extra action.
+
+    :param dice: Pool of the participant.
+    :param actions: Number of declared actions.
+    :return: int
+    """
+    return max(dice - max(actions - 1, 0), 0)
+
+
+def _declare(action):
+    """Normalize a declared action to an (action, target) pair."""
+    if isinstance(action, str):
+        return action, None
+
+    action, target = action
+    return action, target
+
+
+class Conflict:
+    """
+    A conflict of many participants, resolved all at once.
+    """
+
+    def __init__(self):
+        self.participants = {}
+        # Gobble dice left after resolve(), per protected participant: count per height.
+        self.gobble = {}
+
+    def add(self, name, roll, *actions):
+        """
+        Enter a participant into the conflict.
+
+        :param name: Unique name of the participant.
+        :param roll: Roll or CompactRoll of the participant.
+        :param actions: Declared actions, each an action name or an (action, target) pair.
+            DEFEND protects the participant itself, (DEFEND, name) protects another.
+        """
+        if name in self.participants:
+            raise ValueError("{} is already taking part in the conflict.".format(name))
+
+        if not actions:
+            raise ValueError("{} has to declare at least one action.".format(name))
+
+        self.participants[name] = (roll, [_declare(action) for action in actions])
+
+    def _sets(self):
+        """All Matches with their actions, as sort keys for the order of resolution."""
+        sets = []
+
+        for order, (name, (roll, actions)) in enumerate(self.participants.items()):
+            counts = roll.counts
+            matches = sorted(((count, face) for face, count in enumerate(counts, 1) if count > 1), reverse=True)
+
+            for i, (action, target) in enumerate(actions):
+                width, height = matches[i] if i < len(matches) else (0, 0)
+
+                if action == DEFEND and target is None:
+                    target = name
+
+                # Widest first, then highest, then defenses, then order of declaration.
+                sets.append((-width, -height, action != DEFEND, order, i, name, action, target))
+
+        return sorted(sets)
+
+    def resolve(self):
+        """
+        Resolve all declared actions.
+
+        :return: List of Result in order of resolution. Gobble dice left over are in self.gobble afterwards.
+        """
+        gobble = {}
+        results = []
+
+        for width, height, attack, order, i, name, action, target in self._sets():
+            width, height = -width, -height
+            gobbled = 0
+
+            if width and not attack:
+                gobble.setdefault(target, [0] * 10)[height - 1] += width
+
+            elif width and target in gobble:
+                pool = gobble[target]
+                need = width - 1
+
+                for face in range(height - 1, 10):
+                    used = min(pool[face], need - gobbled)
+                    pool[face] -= used
+                    gobbled += used
+
+                    if gobbled == need:
+                        break
+
+            results.append(Result(name, action, target, width, height, gobbled))
+
+        self.gobble = gobble
+
+        return results
+
+    def __len__(self):
+        return len(self.participants)
+
+    def __repr__(self):
+        return "Conflict(participants={})".format(len(self))
@@ -0,0 +1,96 @@
+from oneroll.conflict import *
+from oneroll.core import Match, Roll, gobble_match
+import random
+import pytest
+
+
+class TestConflict:
+    """Tests for the Conflict class."""
+
+    def test_same_as_gobble_match(self):
+        """One defense against one attack gives the result of gobble_match."""
+        rng = random.Random(1)
+
+        for x in range(500):
+            defense = Match(rng.randint(2, 5), rng.randint(1, 10))
+            attack = Match(rng.randint(2, 5), rng.randint(1, 10))
+
+            conflict = Conflict()
+            conflict.add("A", Roll([defense.height] * defense.width), DEFEND)
+            conflict.add("B", Roll([attack.height] * attack.width), ("attack", "A"))
+            result = [result for result in conflict.resolve() if result.actor == "B"][0]
+
+            gobbled, match, gobble = gobble_match(attack, defense.to_gobble())
+            assert result.success == bool(match)
+            if match:
+                assert result.effective_width == match.width
+
+    def test_order(self):
+        """Sets resolve by width, then height, with defenses first at equal speed."""
+        conflict = Conflict()
+        conflict.add("A", Roll([5, 5, 9, 9]), "attack", "maneuver")
+        conflict.add("B", Roll([2, 2, 2]), "attack")
+        conflict.add("C", Roll([9, 9]), DEFEND)
+
+        assert [(result.actor, result.action) for result in conflict.resolve()] == \
+               [("B", "attack"), ("C", DEFEND), ("A", "attack"), ("A", "maneuver")]
+
+    def test_slow_defense(self):
+        """Gobble dice of a narrower set come too late for a wider attack."""
+        conflict = Conflict()
+        conflict.add("A", Roll([10, 10]), DEFEND)
+        conflict.add("B", Roll([3, 3, 3]), ("attack", "A"))
+
+        assert conflict.resolve()[0].gobbled == 0
+
+    def test_protect_other(self):
+        """Gobble dice protect the named target, spent across all its attackers, lowest first."""
+        conflict = Conflict()
+        conflict.add("Bodyguard", Roll([6, 6, 6, 9, 9, 9]), (DEFEND, "Duke"), (DEFEND, "Duke"))
+        conflict.add("Assassin", Roll([5, 5]), ("attack", "Duke"))
+        conflict.add("Brute", Roll([8, 8]), ("attack", "Duke"))
+        conflict.add("Other", Roll([4, 4]), ("attack", "Bodyguard"))
+        results = {result.actor: result for result in conflict.resolve()}
+
+        assert not results["Assassin"].success
+        assert not results["Brute"].success
+        assert results["Other"].success
+        assert conflict.gobble["Duke"] == [0, 0, 0, 0, 0, 2, 0, 0, 2, 0]
+
+    def test_multiple_actions(self):
+        """Actions get the fastest Matches in order of declaration, extra actions get none."""
+        conflict = Conflict()
+        conflict.add("A", Roll([3, 3, 8, 8, 8]), "first", "second", "third")
+        results = conflict.resolve()
+
+        assert [(result.action, result.width, result.height) for result in results] == \
+               [("first", 3, 8), ("second", 2, 3), ("third", 0, 0)]
+        assert not results[-1].success
+
+    def test_many_participants(self):
+        rng = random.Random(2)
+        conflict = Conflict()
+
+        for i in range(500):
+            target = "P{}".format(rng.randrange(500))
+            conflict.add("P{}".format(i), Roll(6, rng=rng), DEFEND, ("attack", target))
+
+        results = conflict.resolve()
+
+        assert len(results) == 1000
+        assert all(result.gobbled <= max(result.width - 1, 0) for result in results)
+
+    def test_declarations(self):
+        conflict = Conflict()
+        conflict.add("A", Roll([1, 1]), "attack")
+
+        with pytest.raises(ValueError):
+            conflict.add("A", Roll([2, 2]), "attack")
+
+        with pytest.raises(ValueError):
+            conflict.add("B", Roll([2, 2]))
+
+    def test_multiple_action_pool(self):
+        assert multiple_action_pool(6, 1) == 6
+        assert multiple_action_pool(6, 3) == 4
+        assert multiple_action_pool(1, 3) == 0
@@ -1,6 +1,9 @@
 import random
-from collections import Counter, namedtuple
-from operator import itemgetter
+import weakref
+from collections import namedtuple
+from operator import add, itemgetter
+
+from . import instrument
 
 
 class Gobble:
@@ -60,6 +63,244 @@ class Match(namedtuple("Match", ["width", "height"])):
         return self.width > 1
 
 
+FACES = range(1, 11)
+
+
+class DiceBuffer:
+    """
+    Source of d10 results that draws them from a random number generator in blocks.
+
+    Pass it as rng to Roll and the other rolling functions to replace one generator call
+    per die by one call per block.
+
+        >>> dice = DiceBuffer(random.Random(1))
+        >>> Roll(5, rng=dice).dice
+        [2, 3, 5, 8, 9]
+
+    :param rng: random.Random, numpy.random.Generator, or None for the random module.
+    :param block: Number of dice drawn from rng at once.
+    """
+
+    def __init__(self, rng=None, block=4096):
+        self.rng = rng
+        self.block = block
+        self._dice = []
+        self._pos = 0
+
+    @classmethod
+    def replay(cls, dice):
+        """
+        Buffer of pre-generated dice, eg. read from a roll log. Drawing past its end raises IndexError.
+
+        :param dice: Iterable of die values.
+        :return: DiceBuffer
+        """
+        buffer = cls(block=0)
+        buffer._dice = list(dice)
+        _check_dice(buffer._dice)
+        return buffer
+
+    def draw(self, k):
+        """
+        Take the next k dice from the buffer.
+
+        :param k: Number of dice.
+        :return: List of die values.
+        """
+        end = self._pos + k
+
+        if end > len(self._dice):
+            if not self.block:
+                raise IndexError("Dice buffer exhausted.")
+
+            rest = self._dice[self._pos:]
+            self._dice = rest + _roll_dice(max(self.block, k - len(rest)), self.rng)
+            self._pos, end = 0, k
+
+        dice = self._dice[self._pos:end]
+        self._pos = end
+
+        return dice
+
+    def randint(self, a, b):
+        """Single d10 result, for compatibility with random.randint(1, 10). Other ranges raise ValueError."""
+        if (a, b) != (1, 10):
+            raise ValueError("A DiceBuffer only rolls d10, randint(1, 10), but got randint({}, {}).".format(a, b))
+
+        return self.draw(1)[0]
+
+
+def _draw(k, rng=None):
+    """
+    Roll k d10.
+
+    :param rng: DiceBuffer, random.Random, numpy.random.Generator, or None for the random module.
+    :return: List of die values.
+    """
+    if instrument.enabled:
+        instrument.event("dice", k)
+
+    return _roll_dice(k, rng)
+
+
+def _roll_dice(k, rng=None):
+    """Roll k d10 like _draw, without counting them; DiceBuffer refills use it directly."""
+    if rng is None:
+        rng = random
+
+    if isinstance(rng, DiceBuffer):
+        return rng.draw(k)
+
+    if hasattr(rng, "integers"):
+        return rng.integers(1, 11, size=k).tolist()
+
+    return rng.choices(FACES, k=k)
+
+
+def _limit_width(counts, rng=None):
+    """
+    Reroll the extra dice of Matches wider than 5, in place.
+
+    This gives the same result as rerolling a die of the widest Match until no Match is
+    wider than 5: every such Match ends up with width 5, and each extra die ends up on the
+    first face it rolls that has fewer than 5 dice. Dice landing on a full face are rolled
+    again, so no Match is ever recomputed.
+
+    :param counts: Face histogram, list of 10 ints; changed in place.
+    :param rng: Source of random dice, see _draw.
+    :return: Number of dice rerolled.
+    """
+    extra = sum(count - 5 for count in counts if count > 5)
+
+    if extra and sum(counts) > 50:
+        raise ValueError("More than 50 dice can not be limited to Matches of width 5.")
+
+    for face, count in enumerate(counts):
+        if count > 5:
+            counts[face] = 5
+
+    left = extra
+
+    while left:
+        # Draws exactly as many dice as the one by one rerolls would, in the same order.
+        for value in _draw(left, rng):
+            if counts[value - 1] < 5:
+                counts[value - 1] += 1
+                left -= 1
+
+    return extra
+
+
+def _summarize(counts):
+    """
+    Derive the results of a roll from its face histogram.
+
+    :param counts: Sequence of 10 ints, the number of dice showing each face from 1 to 10.
+    :return: Tuple of (matches, highest, widest, waste) as returned by the Roll properties.
+    """
+    matches = [Match(count, face) for face, count in enumerate(counts, 1) if count > 1]
+    waste = [face for face, count in enumerate(counts, 1) if count == 1]
+
+    if matches:
+        highest = matches[-1]
+        widest = max(matches, key=itemgetter(0))
+
+        if widest[0] == highest[0]:     # check if sets all have the same width
+            widest = highest            # if yes: pick highest as "tiebreaker"
+    else:
+        highest = widest = ()
+
+    return matches, highest, widest, waste
+
+
+# OutcomeTable the results of small pools are looked up in, set by oneroll.lookup.use_table().
+_outcomes = None
+
+
+def _check_dice(values):
+    for value in values:
+        if not 1 <= value <= 10:
+            raise ValueError("Die values must be between 1 and 10, got {}.".format(value))
+
+
+class DiceList(list):
+    """
+    List of die values that keeps the face histogram of its Roll up to date.
+
+    Every change to the list, like appending a Master Die or changing a value in place,
+    is passed on to the owning Roll, so its cached results stay correct. The Roll is only
+    weakly referenced, so a Roll and its dice can be freed without the cyclic garbage collector.
+    """
+    __slots__ = ("_roll",)
+
+    def __reduce__(self):
+        # Copies are plain lists of values, detached from the Roll.
+        return DiceList, (list(self),)
+
+    def _changed(self, added, removed):
+        ref = getattr(self, "_roll", None)
+        roll = ref and ref()
+
+        if roll is not None:
+            roll._changed(added, removed)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = list(value)
+            added, removed = value, self[key]
+        else:
+            added, removed = [value], [self[key]]
+
+        _check_dice(added)
+        super().__setitem__(key, value)
+        self._changed(added, removed)
+
+    def __delitem__(self, key):
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        self._changed([], removed)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        before = list(self)
+        super().__imul__(n)
+        self._changed(list(self), before)
+        return self
+
+    def append(self, value):
+        _check_dice([value])
+        super().append(value)
+        self._changed([value], [])
+
+    def extend(self, values):
+        values = list(values)
+        _check_dice(values)
+        super().extend(values)
+        self._changed(values, [])
+
+    def insert(self, index, value):
+        _check_dice([value])
+        super().insert(index, value)
+        self._changed([value], [])
+
+    def pop(self, index=-1):
+        value = super().pop(index)
+        self._changed([], [value])
+        return value
+
+    def remove(self, value):
+        super().remove(value)
+        self._changed([], [value])
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self._changed([], removed)
+
+
 class Roll:
     """
     Class for One Roll Engine dice rolls.
@@ -75,20 +316,31 @@ class Roll:
         >>> specific.widest
         3x2
 
-    :param x: py.int, representing number of dice to roll, or py.list of ints, representing dice values.
+    The face histogram of the dice is kept up to date on every change, and matches,
+    highest, widest and waste are computed from it once until the dice change again.
+
+    :param x: py.int, representing number of dice to roll, or py.list of ints from 1 to 10, representing dice values.
     :param penalty: py.int of penalty dice
     :param over10: Allow rolling more than 10 dice.
     :param limit_width: Limit width of oneroll.Match to maximum of 5.
+    :param rng: Source of random dice for rolling and rerolling: DiceBuffer, random.Random,
+        numpy.random.Generator, or None for the random module.
     """
 
-    def __init__(self, x=4, penalty=0, over10=False, limit_width=False):
+    def __init__(self, x=4, penalty=0, over10=False, limit_width=False, rng=None):
 
         if type(x) not in [int, list]:
             raise TypeError("Int or list expected but {} given.".format(type(x)))
 
+        started = instrument.enabled and instrument.start()
+
         self.over10 = over10
         self.limit_width = limit_width
         self.penalty = penalty
+        self.rng = rng
+
+        capped = None
+        widened = []
 
         if type(x) == list:
             self.dice = sorted(x)
@@ -97,17 +349,109 @@ class Roll:
             x -= self.penalty
 
             if not over10 and x > 10:
+                capped = x
                 x = min(x, 10)
-                print("Too man dice! Only rolling 10.")
 
-            self.dice = [random.randint(1, 10) for y in range(x)]
-            self.dice.sort()
+            dice = _draw(max(x, 0), rng)
+
+            if limit_width:
+                counts = [0] * 10
+                for value in dice:
+                    counts[value - 1] += 1
+
+                if max(counts) > 5:
+                    if instrument.enabled:
+                        widened = [Match(count, face) for face, count in enumerate(counts, 1) if count > 5]
+
+                    _limit_width(counts, rng)
+                    dice = [face for face, count in enumerate(counts, 1) for _ in range(count)]
+
+            self.dice = sorted(dice)
+
+        if started:
+            # Hooks are only called once the Roll is complete, so they can use it.
+            if capped is not None:
+                instrument.event("capped", roll=self, dice=capped)
+
+            for match in widened:
+                instrument.event("limit_width_rerolls", match.width - 5, roll=self, match=match)
+
+            instrument.event("rolls")
+            instrument.observe("roll", started)
 
-            if limit_width and self.widest != ():
-                while self.widest.width > 5:
-                    print("Set {} too wide, rerolling...".format(self.widest))
-                    index = self.dice.index(self.widest[1])
-                    self.reroll(index)
+    @property
+    def dice(self):
+        """
+        List of die values. Changing it in place updates the results of the Roll.
+
+        Rolls made by adding or merging other rolls only keep a face histogram; their
+        sorted dice are listed the first time they are asked for.
+        """
+        if self._dice is None:
+            dice = DiceList(face for face, count in enumerate(self._counts, 1) for _ in range(count))
+            dice._roll = weakref.ref(self)
+            self._dice = dice
+
+        return self._dice
+
+    @dice.setter
+    def dice(self, values):
+        dice = DiceList(values)
+        _check_dice(dice)
+
+        counts = [0] * 10
+        for value in dice:
+            counts[value - 1] += 1
+
+        if getattr(self, "_dice", None) is not None:
+            self._dice._roll = None
+
+        dice._roll = weakref.ref(self)
+        self._dice = dice
+        self._counts = counts
+        self._cache = None
+
+    def _changed(self, added, removed):
+        """Update the face histogram after dice were added to or removed from the Roll."""
+        counts = self._counts
+
+        for value in added:
+            counts[value - 1] += 1
+
+        for value in removed:
+            counts[value - 1] -= 1
+
+        self._cache = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_dice"]
+        state["dice"] = list(self.dice)
+        del state["_counts"], state["_cache"]
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        dice = state.pop("dice")
+        self.__dict__.update(state)
+        self.dice = dice
+
+    def _results(self):
+        if self._cache is None:
+            if _outcomes is not None and sum(self._counts) <= _outcomes.max_dice:
+                self._cache = _outcomes.results(self._counts)
+            else:
+                self._cache = _summarize(self._counts)
+        return self._cache
+
+    @property
+    def counts(self):
+        """
+        Face histogram of the Roll.
+
+        :return: Tuple of 10 ints, the number of dice showing each face from 1 to 10.
+        """
+        return tuple(self._counts)
 
     @property
     def matches(self):
@@ -116,9 +460,7 @@ class Roll:
 
         :return: Sorted list of Match objects, if any. Else an empty list.
         """
-        counter = Counter(self.dice)
-
-        return sorted([Match(y, x) for x, y in counter.items() if y > 1], key=lambda item: item[1]) or []
+        return list(self._results()[0])
 
     @property
     def waste(self):
@@ -126,11 +468,7 @@ class Roll:
         Property function for retrieving waste dice, ie. die values that did not result in a Match.
         :return: Sorted list of waste die values or an empty list.
         """
-        if len(self.matches) > 0:
-            __waste = list(set(self.dice) - set([x[1] for x in self.matches]))
-            return sorted(__waste)
-        else:
-            return self.dice
+        return list(self._results()[3])
 
     @property
     def highest(self):
@@ -138,10 +476,7 @@ class Roll:
         Retrieve Match with largest Height.
         :return: Match object of max Height; empty tuple of no Match in Roll.
         """
-        if self.matches:
-            return max(self.matches, key=itemgetter(1))
-        else:
-            return ()
+        return self._results()[1]
 
     @property
     def widest(self):
@@ -149,39 +484,82 @@ class Roll:
         Retrieve Match with max Width.
         :return: Match object with most Width; empty tuple if no Match in Roll.
         """
-        if self.matches:
-            _widest = max(self.matches, key=itemgetter(0))
-
-            if _widest[0] == self.highest[0]:   # check if sets all have the same width
-                _widest = self.highest          # if yes: pick highest as "tiebreaker"
-            return _widest
-        else:
-            return ()
+        return self._results()[2]
 
-    def reroll(self, index):
+    def reroll(self, index, rng=None):
         """
         Reroll the die at index.
 
         :param index: Index of the die to be replaced by a new value.
+        :param rng: Source of random dice, defaults to the one the Roll was made with.
         :return: None
         """
         try:
-            self.dice[index] = random.randint(1, 10)
+            self.dice[index] = _draw(1, rng or self.rng)[0]
         except IndexError as e:
-            print("No die at index")
+            if instrument.enabled:
+                instrument.event("reroll_missing", roll=self, index=index)
             raise e
 
-    def reroll_all(self):
+    def reroll_all(self, rng=None):
         """
         Reroll all dice in Roll.
+
+        :param rng: Source of random dice, defaults to the one the Roll was made with.
         :return:
         """
         number = len(self.dice)
         self.dice = Roll(number,
                          over10=self.over10,
-                         limit_width=self.limit_width
+                         limit_width=self.limit_width,
+                         rng=rng or self.rng
                          ).dice
 
+    @classmethod
+    def _from_counts(cls, dice, counts, penalty=0, over10=False, limit_width=False):
+        """
+        Build a Roll from dice and their already known face histogram, without recounting.
+
+        The dice may be None; they are then listed from the histogram when first needed.
+        """
+        roll = cls.__new__(cls)
+        roll.over10 = over10
+        roll.limit_width = limit_width
+        roll.penalty = penalty
+        roll.rng = None
+
+        roll._dice = None
+        roll._counts = counts
+        roll._cache = None
+
+        if dice is not None:
+            roll._dice = DiceList(dice)
+            roll._dice._roll = weakref.ref(roll)
+
+        return roll
+
+    @classmethod
+    def merge(cls, *rolls):
+        """
+        Pool the dice of many rolls into one new Roll, by adding their face histograms.
+
+            >>> Roll.merge(Roll([1, 2]), Roll([2, 3]), Roll([3]))
+            Roll(x=[1, 2, 2, 3, 3])
+
+        :param rolls: Roll objects.
+        :return: Roll object, with the over10 and limit_width flags set like Roll + Roll does.
+        """
+        counts = [0] * 10
+
+        try:
+            for roll in rolls:
+                counts = list(map(add, counts, roll._counts))
+            limit_width = any(roll.limit_width for roll in rolls)
+        except AttributeError:
+            raise TypeError("Only Roll objects can be merged.")
+
+        return cls._from_counts(None, counts, over10=sum(counts) > 10, limit_width=limit_width)
+
     def __eq__(self, other):
         """
         Overridden builtin method. Rolls are equal if their dice have the same value.
@@ -189,6 +567,9 @@ class Roll:
         :param other: Roll object
         :return: Bool
         """
+        if isinstance(other, Roll):
+            return [count > 0 for count in self._counts] == [count > 0 for count in other._counts]
+
         return set(self.dice) == set(other.dice)
 
     def __ne__(self, other):
@@ -196,24 +577,45 @@ class Roll:
 
     def __add__(self, other):
         try:
-            new_dice = self.dice + other.dice
-            over_10 = len(new_dice) > 10
+            counts = [a + b for a, b in zip(self._counts, other._counts)]
             limit_width = self.limit_width or other.limit_width
-
-            return Roll(new_dice, over10=over_10, limit_width=limit_width)
         except AttributeError:
             raise TypeError("Addition not possible between Types Roll and {}.".format(type(other)))
 
+        return Roll._from_counts(None, counts, over10=sum(counts) > 10, limit_width=limit_width)
+
     def __radd__(self, other):
         if other == 0:
             return self
         else:
             return self.__add__(other)
 
-    __iadd__ = __add__
+    def __iadd__(self, other):
+        """
+        Add the dice of other to this Roll, in place. Lists of dice taken from the Roll
+        before are no longer kept up to date.
+        """
+        try:
+            other_counts = other._counts
+            self.limit_width = self.limit_width or other.limit_width
+        except AttributeError:
+            raise TypeError("Addition not possible between Types Roll and {}.".format(type(other)))
+
+        counts = self._counts
+        for i, count in enumerate(other_counts):
+            counts[i] += count
+
+        if self._dice is not None:
+            self._dice._roll = None
+            self._dice = None
+
+        self.over10 = sum(counts) > 10
+        self._cache = None
+
+        return self
 
     def __len__(self):
-        return self.dice.__len__()
+        return sum(self._counts)
 
     def __repr__(self):
 
@@ -242,19 +644,20 @@ class Contest:
                  roll1,
                  roll2=None,
                  diff=1,
-                 desc="A ORE Contest"):
+                 desc="A ORE Contest",
+                 rng=None):
 
         self.desc = desc
         self.result = ""
         self.winner = None
 
         if not roll2:
-            if static_contest(roll1, diff):
+            if static_contest(roll1, diff, rng=rng):
                 self.result = "Success!"
             else:
                 self.result = "Failure!"
         else:
-            self._res = dynamic_contest(roll1, roll2)
+            self._res = dynamic_contest(roll1, roll2, rng=rng)
 
             if self._res == None:
 
@@ -278,47 +681,57 @@ class Contest:
 
 
 
-def static_contest(roll, diff=1, penalty=0):
+def static_contest(roll, diff=1, penalty=0, rng=None):
+    started = instrument.enabled and instrument.start()
+
     if type(roll) == int:
-        roll = Roll(roll)
+        roll = Roll(roll, rng=rng)
 
-    if roll.matches and roll.matches[-1][1] >= diff:
+    result = bool(roll.matches and roll.matches[-1][1] >= diff)
 
-        return True
-    else:
+    if started:
+        instrument.event("contests")
+        instrument.observe("static_contest", started)
 
-        return False
+    return result
 
 
-def dynamic_contest(roll1, roll2, width_wins=False):
+def dynamic_contest(roll1, roll2, width_wins=False, rng=None):
 
     assert type(roll1) in (int, Roll), "Roll object or integer expected"
     assert type(roll2) in (int, Roll), "Roll object or integer expected"
 
+    started = instrument.enabled and instrument.start()
+
     if type(roll1) == int:
-        roll1 = Roll(roll1)
+        roll1 = Roll(roll1, rng=rng)
 
     if type(roll2) == int:
-        roll2 = Roll(roll2)
+        roll2 = Roll(roll2, rng=rng)
 
-    if not (roll1.matches or roll2.matches):
-        return None
+    matches1 = roll1.matches
+    matches2 = roll2.matches
 
-    if not roll1.matches:
+    if not (matches1 or matches2):
+        result = None
 
-        return False
+    elif not matches1:
+        result = False
 
-    if not roll2.matches:
+    elif not matches2:
+        result = True
 
-        return True
+    elif width_wins:
+        result = max(m.width for m in matches1) > max(m.width for m in matches2)
 
-    if width_wins:
-        _width1 = sorted(roll1.matches, key=lambda x:x[0])[-1][0]
-        _width2 = sorted(roll2.matches, key=lambda x:x[0])[-1][0]
-        return _width1 > _width2
     else:
+        result = matches1[-1].height > matches2[-1].height
+
+    if started:
+        instrument.event("contests")
+        instrument.observe("dynamic_contest", started)
 
-        return roll1.matches[-1][1] > roll2.matches[-1][1]
+    return result
 
 
 def gobble_match(match, gobble):
@@ -350,23 +763,24 @@ def gobble_match(match, gobble):
     return True, match, gobble
 
 
-def roll(dice):
+def roll(dice, rng=None):
     """
     Roll <dice> # of dice and return a Roll object.
 
     :param dice: Number of Dice to be rolled.
     :type: int
+    :param rng: Source of random dice, see Roll.
     :return: Roll object.
     """
     assert type(dice) == int, "Argument must be an integer."
 
-    return Roll(dice)
+    return Roll(dice, rng=rng)
 
 
-def roll_with_md(dice):
+def roll_with_md(dice, rng=None):
     """Roll <dice> # of dice and interactively add one Master Die. Returns Roll object."""
 
-    _roll = Roll(dice)
+    _roll = Roll(dice, rng=rng)
     print("You rolled:", _roll.dice)
 
     if _roll.matches:
@@ -380,13 +794,13 @@ def roll_with_md(dice):
     return _roll
 
 
-def roll_with_ed(dice, ed=None):
+def roll_with_ed(dice, ed=None, rng=None):
     """Roll <dice> # of dice and add a chosen Expert Die, returning a Roll object."""
 
     if not ed:
         ed = int(input("What number do you want to set your Expert Die to? "))
 
-    _roll = Roll(dice)
+    _roll = Roll(dice, rng=rng)
     _roll.dice.append(ed)
     _roll.dice.sort()
 
@@ -1,7 +1,20 @@
 from oneroll.core import *
+from oneroll import instrument
+from collections import Counter
+import random
 import pytest
 
 
+def rejection_limit_width(x, rng):
+    """Face histogram of x dice, rerolling a die of the widest Match while it is wider than 5."""
+    roll = Roll(x, over10=True, rng=rng)
+
+    while roll.widest != () and roll.widest.width > 5:
+        roll.reroll(roll.dice.index(roll.widest.height))
+
+    return roll.counts
+
+
 class TestRoll:
     """Tests for the Roll class."""
 
@@ -33,16 +46,45 @@ class TestRoll:
         assert len(Roll(20, penalty=3)) == 10   # Penalties subtract before limiting the pool to 10 dice
         assert len(Roll(20, penalty=3, over10=True)) == 17
 
-    def test_construction_limit_width(self, capsys):
+    def test_construction_limit_width(self):
         """If the limit_width flag is set, a Roll should reroll all matches over width 5."""
-        roll = Roll(40, over10=True, limit_width=True)
-        out, err = capsys.readouterr()
-        assert "too wide, rerolling" in out
+        rerolled = []
+
+        with instrument.listening("limit_width_rerolls", lambda name, roll, match: rerolled.append(match)):
+            roll = Roll(40, over10=True, limit_width=True, rng=random.Random(0))
+
+        assert rerolled and all(match.width > 5 for match in rerolled)
         assert roll.widest.width <= 5
 
         roll = Roll(100, over10=True)
         assert roll.widest.width > 5
 
+        with pytest.raises(ValueError):
+            Roll(51, over10=True, limit_width=True)
+
+    def test_limit_width_same_as_rerolling(self):
+        """The same dice rerolled one by one from the widest Match give the same Roll."""
+        for seed in range(300):
+            x = random.Random(seed).randint(10, 50)
+            roll = Roll(x, over10=True, limit_width=True, rng=random.Random(seed))
+
+            assert roll.counts == rejection_limit_width(x, random.Random(seed))
+
+    def test_limit_width_distribution(self):
+        """Chi-square test of the dice on face 10 against independent rolls rerolled one by one."""
+        rng = random.Random(1)
+        n = 3000
+        direct = Counter(Roll(45, over10=True, limit_width=True, rng=rng).counts[9] for x in range(n))
+        rerolled = Counter(rejection_limit_width(45, rng)[9] for x in range(n))
+
+        chi2 = 0
+        for width in range(6):
+            expected = (direct[width] + rerolled[width]) / 2
+            if expected:
+                chi2 += ((direct[width] - expected) ** 2 + (rerolled[width] - expected) ** 2) / expected
+
+        assert chi2 < 20.52     # 5 degrees of freedom, p = 0.001
+
     def test_matches(self):
         """
         A Roll with two or more dice of the same value returns a Match object with its .matches property.
@@ -126,6 +168,50 @@ class TestRoll:
         assert not roll2.over10
         assert (roll1 + roll2).over10
 
+    def test_addition_dice(self):
+        """The dice of a sum are listed, sorted, from its face histogram, and stay in sync."""
+        roll = Roll([9, 2, 2]) + Roll([5, 2])
+
+        assert roll._dice is None
+        assert len(roll) == 5 and roll.matches == [Match(3, 2)]
+        assert roll.dice == [2, 2, 2, 5, 9]
+
+        roll.dice.append(9)
+        assert roll.matches == [Match(3, 2), Match(2, 9)]
+
+    def test_iadd(self):
+        """Adding in place changes the Roll itself, and leaves the other Roll alone."""
+        roll = Roll([3, 3])
+        dice = roll.dice
+        other = Roll([3, 7], limit_width=True)
+        roll += other
+
+        assert roll.dice == [3, 3, 3, 7]
+        assert roll.widest == Match(3, 3)
+        assert roll.limit_width
+        assert other.dice == [3, 7]
+
+        dice.append(7)
+        assert roll.counts[6] == 1
+
+        roll += roll
+        assert roll.counts == (0, 0, 6, 0, 0, 0, 2, 0, 0, 0) and roll.over10 is False
+
+        with pytest.raises(TypeError):
+            roll += [1]
+
+    def test_merge(self):
+        rolls = [Roll(3) for x in range(50)]
+        merged = Roll.merge(*rolls)
+
+        assert merged.dice == sorted(die for roll in rolls for die in roll.dice)
+        assert merged.counts == sum(rolls).counts
+        assert merged.over10
+        assert len(Roll.merge()) == 0
+
+        with pytest.raises(TypeError):
+            Roll.merge(Roll(3), [1, 2])
+
     def test_equality_given_dice(self):
         """Two Rolls should be equal irrespective of the order of their dice."""
         dice1 = [1, 2, 3, 4, 5]
@@ -143,3 +229,161 @@ class TestRoll:
         assert len(Roll(5)) == 5
         assert len(Roll()) == 4
         assert len(Roll()) == len(Roll([1, 1, 1, 1]))
+
+    def test_counts(self):
+        """A Roll keeps a histogram of its dice, one count per face."""
+        roll = Roll([1, 1, 4, 10])
+
+        assert roll.counts == (2, 0, 0, 1, 0, 0, 0, 0, 0, 1)
+        assert sum(Roll(15, over10=True).counts) == 15
+
+    def test_invalid_dice(self):
+        """Die values outside of 1 to 10 are rejected, also when changing the dice later."""
+        with pytest.raises(ValueError):
+            Roll([0, 1, 2])
+
+        roll = Roll([1, 2, 3])
+        with pytest.raises(ValueError):
+            roll.dice.append(11)
+
+        with pytest.raises(ValueError):
+            roll.dice[0] = 0
+
+        assert roll.counts == (1, 1, 1, 0, 0, 0, 0, 0, 0, 0)
+
+    def test_dice_changes_update_results(self):
+        """Changing Roll.dice in place, as in the README, updates cached results."""
+        roll = Roll([1, 2, 3, 4])
+        assert roll.matches == []
+
+        roll.dice.append(4)
+        assert roll.matches == [Match(2, 4)]
+
+        roll.dice[0] = 2
+        assert roll.matches == [Match(2, 2), Match(2, 4)]
+        assert roll.waste == [3]
+
+        roll.dice[1:3] = [9, 9, 9]
+        assert roll.widest == Match(3, 9)
+
+        del roll.dice[-1]
+        roll.dice.remove(9)
+        roll.dice.pop()
+        assert roll.dice == [2, 9, 9] and roll.highest == Match(2, 9)
+
+        roll.dice.extend([4, 4])
+        roll.dice += [4]
+        assert roll.widest == Match(3, 4)
+
+        roll.dice.clear()
+        assert roll.matches == [] and roll.counts == (0,) * 10
+
+    def test_dice_reassigned(self):
+        """Assigning a new dice list replaces the histogram; the old list no longer affects the Roll."""
+        roll = Roll([5, 5, 6])
+        old = roll.dice
+        roll.dice = [7, 7, 7]
+        old.append(5)
+
+        assert roll.matches == [Match(3, 7)]
+        assert roll.counts == (0, 0, 0, 0, 0, 0, 3, 0, 0, 0)
+
+    def test_reroll_updates_results(self):
+        roll = Roll([3, 3])
+        roll.reroll(0)
+
+        assert roll.counts == tuple(roll.dice.count(face) for face in range(1, 11))
+        assert bool(roll.matches) == (roll.dice[0] == 3)
+
+    def test_copy(self):
+        """Copies of a Roll have their own dice and histogram."""
+        import copy
+        import pickle
+
+        roll = Roll([2, 2, 8])
+
+        for clone in (copy.deepcopy(roll), pickle.loads(pickle.dumps(roll))):
+            clone.dice.append(8)
+            assert clone.matches == [Match(2, 2), Match(2, 8)]
+            assert roll.matches == [Match(2, 2)]
+
+    def test_freed_without_gc(self):
+        """A Roll and its dice hold no reference cycle, so deleting the Roll frees it at once."""
+        import gc
+        import weakref
+
+        gc.disable()
+        try:
+            for make in (lambda: Roll(5), lambda: Roll([1, 2]), lambda: Roll([1]) + Roll([2])):
+                roll = make()
+                dice = roll.dice
+                ref = weakref.ref(roll)
+                del roll
+                assert ref() is None
+
+                dice.append(3)      # no longer owned, but still a list
+                assert dice[-1] == 3
+        finally:
+            gc.enable()
+
+    def test_rng(self):
+        """Rolls made from equally seeded random sources are equal."""
+        import random
+        import numpy as np
+
+        for make in (random.Random, np.random.default_rng, lambda seed: DiceBuffer(random.Random(seed))):
+            roll1 = Roll(10, rng=make(3))
+            roll2 = Roll(10, rng=make(3))
+            assert roll1.dice == roll2.dice
+
+            roll1.reroll(0)
+            roll2.reroll(0)
+            roll1.reroll_all()
+            roll2.reroll_all()
+            assert roll1.dice == roll2.dice
+
+    def test_rng_replay(self):
+        """A replay buffer rolls exactly the given dice, in order."""
+        dice = DiceBuffer.replay([4, 4, 1, 9, 2])
+        roll = Roll(3, rng=dice)
+
+        assert roll.dice == [1, 4, 4]
+        roll.reroll(0)
+        assert roll.dice == [9, 4, 4]
+        assert static_contest(1, rng=dice) is False
+
+        with pytest.raises(IndexError):
+            roll.reroll(0)
+
+
+class TestDiceBuffer:
+    """Tests for the DiceBuffer class."""
+
+    def test_blocks(self):
+        """Dice are drawn in blocks and handed out in order."""
+        import random
+
+        buffer = DiceBuffer(random.Random(1), block=8)
+        dice = buffer.draw(5) + buffer.draw(5) + buffer.draw(20)
+
+        assert dice[:8] == random.Random(1).choices(range(1, 11), k=8)
+        assert len(dice) == 30
+        assert all(1 <= die <= 10 for die in dice)
+
+    def test_randint(self):
+        """Only d10 results can be taken with randint."""
+        buffer = DiceBuffer.replay([7, 2])
+
+        assert buffer.randint(1, 10) == 7
+
+        for a, b in ((1, 6), (0, 4), (1, 100)):
+            with pytest.raises(ValueError):
+                buffer.randint(a, b)
+
+        assert buffer.draw(1) == [2]
+
+    def test_contests_with_rng(self):
+        import random
+
+        results = [dynamic_contest(6, 6, rng=random.Random(seed)) for seed in range(50)]
+        assert results == [dynamic_contest(6, 6, rng=random.Random(seed)) for seed in range(50)]
@@ -0,0 +1,167 @@
+"""
+Bulk generation of One Roll Companies.
+
+All pools are rolled at once with RollBatch, and the One Roll Companies table is applied
+through precompiled arrays: for every face and number of dice showing it, the summed stat
+changes and the assets gained. Nothing is printed.
+
+    >>> table = generate_companies(100000, columns=True, rng=1)
+    >>> table.might.shape
+    (100000,)
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from . import instrument
+from .batch import RollBatch
+from .companies import COMPILED_ORC, Company, CompiledTable
+from .companytable import CompanyTable
+from .core import Roll
+
+BASE_STATS = (0, 0, 1, 0, 0)
+
+CompiledORC = namedtuple("CompiledORC", ["deltas", "asset_ids", "asset_offsets", "asset_names"])
+CompiledORC.__doc__ = """\
+A CompiledTable turned into arrays, indexed by (dice, face - 1).
+
+:param deltas: int16 array of shape (6, 10, 5); the stat changes, in Company._stats order,
+    of that many dice showing the face, ie. a waste die for 1 and a Match for more.
+:param asset_ids: int32 array of the ids of the assets gained, all combinations after each other.
+:param asset_offsets: int64 array of shape (6, 10, 2); start and end of the assets of a combination in asset_ids.
+:param asset_names: List of asset names, indexed by id.
+"""
+
+
+def compile_orc(table=COMPILED_ORC):
+    """
+    Compile a One Roll Companies table into arrays for generate_companies().
+
+    :param table: CompiledTable, or a dict like ORC_table.
+    :return: CompiledORC
+    """
+    if not isinstance(table, CompiledTable):
+        table = CompiledTable(table)
+
+    deltas = np.zeros((6, 10, 5), dtype=np.int16)
+    asset_offsets = np.zeros((6, 10, 2), dtype=np.int64)
+    asset_ids = []
+
+    for face in range(1, 11):
+        for dice in range(1, 6):
+            # A waste die gives result 1, a Match of width w gives results 2 to w.
+            ranks = [1] if dice == 1 else range(2, dice + 1)
+            asset_offsets[dice, face - 1, 0] = len(asset_ids)
+
+            for rank in ranks:
+                result = table.result(face, rank)
+                deltas[dice, face - 1] += result.deltas
+                asset_ids.extend(result.assets)
+
+            asset_offsets[dice, face - 1, 1] = len(asset_ids)
+
+    return CompiledORC(deltas, np.array(asset_ids, dtype=np.int32), asset_offsets, table.asset_names)
+
+
+_compiled = compile_orc()
+
+
+def _roll_counts(n, dice, rng):
+    """Face histograms of n company rolls of dice dice each, or of one pool size per company."""
+    sizes = np.broadcast_to(np.asarray(dice), (n,))
+    counts = np.zeros((n, 10), dtype=np.uint8)
+
+    for size in np.unique(sizes):
+        rows = np.nonzero(sizes == size)[0]
+        counts[rows] = RollBatch(len(rows), int(size), over10=True, limit_width=True, rng=rng).counts
+
+    return counts
+
+
+def apply_orc(counts, compiled=_compiled):
+    """
+    Stats and assets of companies from the face histograms of their rolls.
+
+    :param counts: Array of shape (n, 10) of face histograms with no face shown more than 5 times.
+    :param compiled: CompiledORC, defaults to the compiled ORC_table.
+    :return: Tuple of (stats, asset_ids, asset_offsets): int16 stats of shape (n, 5), the flat
+        asset ids of all companies, and offsets of shape (n + 1,) into them per company.
+    """
+    counts = np.asarray(counts, dtype=np.intp)
+    faces = np.arange(10)
+
+    stats = compiled.deltas[counts, faces].sum(axis=1, dtype=np.int16) + np.array(BASE_STATS, dtype=np.int16)
+
+    # Like onerollcompany: the results of all Matches by height, then those of the waste dice.
+    slots = np.hstack([np.where(counts > 1, counts, 0), np.where(counts == 1, 1, 0)])
+    bounds = compiled.asset_offsets[slots, np.tile(faces, 2)]
+    starts, lengths = bounds[..., 0].ravel(), (bounds[..., 1] - bounds[..., 0]).ravel()
+
+    total = int(lengths.sum())
+    ends = np.cumsum(lengths)
+    index = np.repeat(starts - (ends - lengths), lengths) + np.arange(total)
+    asset_ids = compiled.asset_ids[index]
+
+    asset_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    asset_offsets[1:] = lengths.reshape(len(counts), 20).sum(axis=1).cumsum()
+
+    return stats, asset_ids, asset_offsets
+
+
+def _names(n, names):
+    if names is None:
+        return ["OneRollCompany"] * n
+
+    if callable(names):
+        return [names() for x in range(n)]
+
+    names = list(names)
+
+    if len(names) != n:
+        raise ValueError("{} names given for {} companies.".format(len(names), n))
+
+    return names
+
+
+def _generated(n, started):
+    if started:
+        instrument.event("companies", n)
+        instrument.observe("generate_companies", started)
+
+
+def generate_companies(n, dice=15, names=None, columns=False, rng=None, compiled=_compiled):
+    """
+    Generate n One Roll Companies at once.
+
+    :param n: Number of companies.
+    :param dice: Dice rolled per company, or a sequence of one pool size per company.
+    :param names: None, a sequence of n names, or a callable returning a new name, eg. Corpus().randomname.
+    :param columns: Return a CompanyTable instead of Company objects.
+    :param rng: numpy.random.Generator or seed.
+    :param compiled: CompiledORC of the company table to use.
+    :return: List of Company objects, or with columns=True a CompanyTable.
+    """
+    started = instrument.enabled and instrument.start()
+    rng = np.random.default_rng(rng)
+    counts = _roll_counts(n, dice, rng)
+    stats, asset_ids, asset_offsets = apply_orc(counts, compiled)
+    names = _names(n, names)
+
+    if columns:
+        table = CompanyTable(names, stats, asset_ids, asset_offsets, compiled.asset_names, counts)
+        _generated(n, started)
+        return table
+
+    asset_names = compiled.asset_names
+    faces = np.arange(1, 11)
+    companies = []
+
+    for i, name in enumerate(names):
+        assets = [asset_names[x] for x in asset_ids[asset_offsets[i]:asset_offsets[i + 1]].tolist()]
+        company = Company(name, stats[i].tolist(), assets)
+        company.roll = Roll._from_counts(np.repeat(faces, counts[i]).tolist(), counts[i].tolist(),
+                                         over10=True, limit_width=True)
+        companies.append(company)
+
+    _generated(n, started)
+    return companies
@@ -0,0 +1,65 @@
+from oneroll.generate import *
+from oneroll.companies import onerollcompany
+import random
+import pytest
+
+
+class TestGenerateCompanies:
+    """Tests for bulk company generation."""
+
+    def test_same_as_onerollcompany(self):
+        """Applying the compiled table to a roll gives the stats and assets onerollcompany does."""
+        for seed in range(200):
+            company = onerollcompany(dice=random.Random(seed).randint(5, 15), rng=random.Random(seed))
+            stats, asset_ids, asset_offsets = apply_orc([company.roll.counts])
+
+            assert tuple(stats[0].tolist()) == company.stats_tuple
+            assert [compile_orc().asset_names[x] for x in asset_ids] == company.assets
+            assert asset_offsets.tolist() == [0, len(company.assets)]
+
+    def test_objects(self, capsys):
+        companies = generate_companies(50, dice=12, names=["C{}".format(x) for x in range(50)], rng=1)
+
+        assert [company.name for company in companies] == ["C{}".format(x) for x in range(50)]
+        assert all(len(company.roll) == 12 for company in companies)
+        assert all(company.roll.widest == () or company.roll.widest.width <= 5 for company in companies)
+
+        for company in companies:
+            stats, asset_ids, asset_offsets = apply_orc([company.roll.counts])
+            assert tuple(stats[0].tolist()) == company.stats_tuple
+
+        out, err = capsys.readouterr()
+        assert out == ""
+
+    def test_columns(self):
+        """Columns hold the same companies as the objects made from the same seed."""
+        table = generate_companies(500, dice=[5, 10, 15] * 100 + [8] * 200, columns=True, rng=2)
+        companies = generate_companies(500, dice=[5, 10, 15] * 100 + [8] * 200, rng=2)
+
+        for view, company in zip(table, companies):
+            assert view.stats_tuple == company.stats_tuple
+            assert view.assets == company.assets
+            assert view.roll == company.roll
+
+        assert table.might.dtype == np.int16
+        assert len(table) == 500
+
+    def test_names(self):
+        counter = iter(range(10))
+        companies = generate_companies(3, names=lambda: "Company {}".format(next(counter)), rng=3)
+
+        assert [company.name for company in companies] == ["Company 0", "Company 1", "Company 2"]
+
+        with pytest.raises(ValueError):
+            generate_companies(3, names=["one", "two"])
+
+    def test_custom_table(self):
+        """Alternate company tables can be compiled and used."""
+        table = {face: {x: ["Result", ("might", 1)] for x in range(1, 6)} for face in range(1, 11)}
+        companies = generate_companies(20, dice=10, rng=4, compiled=compile_orc(table))
+
+        for company in companies:
+            waste = len(company.roll.waste)
+            match_dice = sum(match.width - 1 for match in company.roll.matches)
+            assert company.might == waste + match_dice
+            assert company.assets == []
@@ -0,0 +1,37 @@
+import oneroll
+import os
+import subprocess
+import sys
+import pytest
+
+
+def imported_after(code):
+    """Names of the heavy modules loaded after running code in a new interpreter."""
+    check = "import sys; {}; print([m for m in ('numpy', 'networkx', 'oneroll.batch') if m in sys.modules])"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(oneroll.__file__)))
+    output = subprocess.run([sys.executable, "-c", check.format(code)], capture_output=True, text=True, check=True,
+                            cwd=root)
+    return output.stdout.strip()
+
+
+class TestLazyImports:
+    """Tests for the lazily loaded parts of the package."""
+
+    def test_core_only(self):
+        assert imported_after("import oneroll; oneroll.Roll(5)") == "[]"
+        assert imported_after("import oneroll; oneroll.Corpus()") == "[]"
+
+    def test_on_access(self):
+        assert imported_after("import oneroll; oneroll.RollBatch") == "['numpy', 'oneroll.batch']"
+        assert imported_after("import oneroll.buildNetwork") == "['numpy', 'oneroll.batch']"
+
+    def test_attributes(self):
+        from oneroll.batch import RollBatch
+        from oneroll import network
+
+        assert oneroll.RollBatch is RollBatch
+        assert oneroll.network is network
+        assert "generate_companies" in dir(oneroll)
+
+        with pytest.raises(AttributeError):
+            oneroll.no_such_thing
@@ -0,0 +1,178 @@
+"""
+Optional instrumentation of rolling, contests and company generation.
+
+Instrumentation is off by default. The instrumented code only checks the module flag
+enabled, and does nothing else while it is False. Once enabled, every event is counted in
+counters, its hooks are called with the event name and its details, and the time spent in
+"roll", "static_contest", "dynamic_contest", "company" and "generate_companies" is kept in
+timings as a Histogram per name.
+
+    rolls                                   a Roll was made
+    dice                                    dice were drawn, counted per die
+    capped                roll, dice        a pool of more than 10 dice was limited to 10
+    limit_width_rerolls   roll, match       a Match wider than 5 was limited, counted per die
+    reroll_missing        roll, index       reroll() was given an index without a die
+    contests                                a static or dynamic contest was decided
+    companies                               a company was generated
+    company_assets        company, asset    onerollcompany() gave an asset to a company
+
+    >>> with listening("capped", lambda name, **data: print(data["dice"])):
+    ...     roll = Roll(12)
+    12
+    >>> counters["capped"]
+    1
+
+Counters and histograms are not locked; counts from several threads may be slightly off.
+"""
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+enabled = False
+
+counters = Counter()
+timings = {}
+_hooks = defaultdict(list)
+
+
+class Histogram:
+    """
+    Distribution of durations in power of two buckets of nanoseconds.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = Counter()
+
+    def add(self, seconds):
+        """
+        Record one duration.
+
+        :param seconds: Duration in seconds.
+        """
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        self.buckets[max(int(seconds * 1e9), 1).bit_length()] += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        """
+        Upper bound of the bucket holding the q-quantile.
+
+        :param q: Quantile from 0 to 1, eg. 0.99.
+        :return: Duration in seconds.
+        """
+        rank = q * self.count
+
+        for bucket in sorted(self.buckets):
+            rank -= self.buckets[bucket]
+            if rank <= 0:
+                return (1 << bucket) / 1e9
+
+        return self.max or 0.0
+
+    def __repr__(self):
+        return "Histogram(count={}, mean={:.3g}s, p99<={:.3g}s)".format(self.count, self.mean, self.quantile(0.99))
+
+
+def enable():
+    """Turn instrumentation on."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Turn instrumentation off. Counters and timings are kept."""
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Clear all counters and timings. Hooks stay registered."""
+    counters.clear()
+    timings.clear()
+
+
+def on(name, hook):
+    """
+    Register a hook for an event.
+
+    :param name: Event name.
+    :param hook: Callable taking the event name and the event details as keyword arguments.
+    :return: hook
+    """
+    _hooks[name].append(hook)
+    return hook
+
+
+def off(name, hook):
+    """Remove a hook registered with on()."""
+    _hooks[name].remove(hook)
+
+
+def event(name, n=1, **data):
+    """
+    Count an event and call its hooks. Only called by instrumented code while enabled.
+
+    :param name: Event name, also the counter increased.
+    :param n: Amount the counter is increased by.
+    :param data: Details passed on to the hooks.
+    """
+    counters[name] += n
+
+    for hook in _hooks.get(name, ()):
+        hook(name, **data)
+
+
+def start():
+    """Start time for observe(). Instrumented code calls it as: enabled and start()"""
+    return time.perf_counter()
+
+
+def observe(name, started):
+    """
+    Record the time since started in the histogram name.
+
+    :param name: Name of the timing.
+    :param started: Value returned by start(); nothing is recorded if it is False.
+    """
+    if started is False:
+        return
+
+    if name not in timings:
+        timings[name] = Histogram()
+
+    timings[name].add(time.perf_counter() - started)
+
+
+@contextmanager
+def instrumented():
+    """Enable instrumentation inside a with block, restoring the previous state after."""
+    global enabled
+    before = enabled
+    enabled = True
+
+    try:
+        yield counters
+    finally:
+        enabled = before
+
+
+@contextmanager
+def listening(name, hook):
+    """Enable instrumentation and register a hook inside a with block."""
+    on(name, hook)
+
+    try:
+        with instrumented():
+            yield hook
+    finally:
+        off(name, hook)
@@ -0,0 +1,107 @@
+from oneroll.instrument import *
+from oneroll import instrument
+from oneroll.companies import onerollcompany
+from oneroll.core import DiceBuffer, Roll, dynamic_contest, static_contest
+import random
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    reset()
+    yield
+    disable()
+    reset()
+
+
+class TestInstrument:
+    """Tests for counters, hooks and timings."""
+
+    def test_disabled(self):
+        """Nothing is counted or timed while instrumentation is off."""
+        Roll(12)
+        static_contest(5)
+        onerollcompany(rng=random.Random(1))
+
+        assert not counters
+        assert not timings
+
+    def test_counters(self):
+        with instrumented():
+            Roll(4)
+            Roll(12)
+            Roll([1, 2, 3])
+            static_contest(5)
+            dynamic_contest(Roll(3), Roll(3))
+
+        assert counters["rolls"] == 6
+        assert counters["dice"] == 4 + 10 + 5 + 3 + 3
+        assert counters["capped"] == 1
+        assert counters["contests"] == 2
+        assert timings["roll"].count == 6
+        assert timings["static_contest"].count == 1
+        assert timings["dynamic_contest"].count == 1
+
+    def test_buffered_dice(self):
+        """Dice taken from a DiceBuffer are counted once, not again when the buffer refills."""
+        buffer = DiceBuffer(random.Random(1), block=8)
+
+        with instrumented():
+            Roll(5, rng=buffer)
+            Roll(6, rng=buffer)
+
+        assert counters["dice"] == 11
+
+    def test_hooks(self):
+        capped = []
+
+        with listening("capped", lambda name, roll, dice: capped.append((name, dice))):
+            Roll(15, penalty=2)
+
+        Roll(15)
+
+        assert capped == [("capped", 13)]
+        assert not instrument.enabled
+
+    def test_hooks_see_complete_roll(self):
+        """Hooks are called after the Roll is built, so they can use it."""
+        seen = []
+        hook = lambda name, roll, **data: seen.append((name, repr(roll), roll.counts))
+
+        with listening("capped", hook), listening("limit_width_rerolls", hook):
+            capped = Roll(12)
+            limited = Roll(40, over10=True, limit_width=True, rng=random.Random(0))
+
+        assert seen[0] == ("capped", repr(capped), capped.counts)
+        assert seen[1:] and all(item == ("limit_width_rerolls", repr(limited), limited.counts) for item in seen[1:])
+
+    def test_reroll_missing(self):
+        missing = []
+        roll = Roll([1, 2])
+
+        with listening("reroll_missing", lambda name, roll, index: missing.append(index)):
+            with pytest.raises(IndexError):
+                roll.reroll(5)
+
+        assert missing == [5]
+
+    def test_company(self):
+        assets = []
+
+        with listening("company_assets", lambda name, company, asset: assets.append(asset)):
+            company = onerollcompany(rng=random.Random(3))
+
+        assert assets == company.assets
+        assert counters["companies"] == 1
+        assert timings["company"].count == 1
+
+    def test_histogram(self):
+        histogram = Histogram()
+
+        for seconds in (1e-6, 2e-6, 3e-6, 1e-3):
+            histogram.add(seconds)
+
+        assert histogram.count == 4
+        assert histogram.min == 1e-6 and histogram.max == 1e-3
+        assert 1e-6 <= histogram.quantile(0.5) <= 4.1e-6
+        assert histogram.quantile(1) >= 1e-3
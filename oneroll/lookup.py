@@ -0,0 +1,294 @@
+"""
+Precomputed table of every possible outcome of small ORE pools.
+
+The order of the dice does not matter in ORE, so a roll of n dice is fully described by
+its face histogram. There are only C(n + 9, 9) of them, 92,378 for 10 dice. The table
+lists all of them for every pool size up to max_dice, together with their highest and
+widest Match, waste dice and probability. After use_table(), Roll results and contests of
+small pools are looked up in it too.
+
+The table is built the first time it is used and cached on disk as .npy files, which
+later runs memory-map instead of rebuilding. Importing this module does not touch the
+disk.
+
+    >>> table = default_table()
+    >>> table.lookup(Roll([2, 2, 2, 3, 4, 5, 6, 6]))
+    Outcome(matches=[3x2, 2x6], highest=2x6, widest=3x2, waste=[3, 4, 5], probability=3.36e-05)
+"""
+import os
+import shutil
+from collections import namedtuple
+from itertools import combinations
+from math import comb, factorial
+
+import numpy as np
+
+from . import core
+from .batch import highest_matches, widest_matches
+from .core import Match, Roll
+
+VERSION = 1
+COLUMNS = ("counts", "highest", "widest", "waste", "probability")
+
+Outcome = namedtuple("Outcome", ["matches", "highest", "widest", "waste", "probability"])
+
+
+def cache_dir():
+    """
+    Directory the outcome tables are cached in: $ONEROLL_CACHE_DIR, or ~/.cache/oneroll.
+    """
+    return os.environ.get("ONEROLL_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "oneroll")
+
+
+def enumerate_histograms(n):
+    """
+    All face histograms of n dice in lexicographic order.
+
+    :param n: Number of dice.
+    :return: uint8 array of shape (C(n + 9, 9), 10).
+    """
+    # Stars and bars: the positions of 9 bars among n + 9 slots, in lexicographic order,
+    # give the histograms in lexicographic order.
+    bars = np.array(list(combinations(range(n + 9), 9)), dtype=np.int16).reshape(-1, 9)
+    edges = np.hstack([np.full((len(bars), 1), -1, dtype=np.int16), bars,
+                       np.full((len(bars), 1), n + 9, dtype=np.int16)])
+
+    return (np.diff(edges, axis=1) - 1).astype(np.uint8)
+
+
+def build(max_dice):
+    """
+    Compute the outcome table columns for all pools of up to max_dice dice.
+
+    :param max_dice: Largest pool size in the table.
+    :return: Dict of column name: array.
+    """
+    counts = np.vstack([enumerate_histograms(n) for n in range(max_dice + 1)])
+    sizes = counts.sum(axis=1, dtype=np.int64)
+
+    fact = np.array([float(factorial(k)) for k in range(max_dice + 1)])
+    probability = fact[sizes] / fact[counts].prod(axis=1) / 10.0 ** sizes
+
+    waste = ((counts == 1) << np.arange(10, dtype=np.uint16)).sum(axis=1, dtype=np.uint16)
+
+    return {"counts": counts,
+            "highest": highest_matches(counts),
+            "widest": widest_matches(counts),
+            "waste": waste,
+            "probability": probability}
+
+
+class OutcomeTable:
+    """
+    Every outcome of every pool of up to max_dice dice, indexed by face histogram.
+
+    Nothing is computed or read until the table is first used.
+
+    :param max_dice: Largest pool size in the table.
+    :param path: Directory of the cached table. Defaults to a directory in cache_dir().
+    """
+
+    def __init__(self, max_dice=10, path=None):
+        self.max_dice = max_dice
+        self.path = path or os.path.join(cache_dir(), "outcomes-v{}-{}".format(VERSION, max_dice))
+        self._columns = None
+        self._ranks = None
+        self._cdf = {}
+
+        # before[i, rest, c]: number of histograms that precede one with c dice on face
+        # i + 1, among those sharing the faces before it and with rest dice left for face i + 1 on.
+        n = max_dice + 1
+        self._before = np.zeros((9, n, n + 1), dtype=np.int64)
+        for i in range(9):
+            for rest in range(n):
+                for c in range(rest + 1):
+                    self._before[i, rest, c + 1] = self._before[i, rest, c] + comb(rest - c + 8 - i, 8 - i)
+
+        self.offsets = np.array([comb(size + 9, 10) for size in range(n + 1)], dtype=np.int64)
+
+    def _load(self):
+        if self._columns is None:
+            try:
+                self._columns = {name: np.load(os.path.join(self.path, name + ".npy"), mmap_mode="r")
+                                 for name in COLUMNS}
+            except (OSError, ValueError):
+                self._columns = build(self.max_dice)
+                self._save()
+
+        return self._columns
+
+    def _save(self):
+        """Write the table to disk. Failing to do so only means it is rebuilt next time."""
+        tmp = "{}.tmp{}".format(self.path, os.getpid())
+
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            for name, column in self._columns.items():
+                np.save(os.path.join(tmp, name + ".npy"), column)
+            os.replace(tmp, self.path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def __getattr__(self, name):
+        if name in COLUMNS:
+            return self._load()[name]
+        raise AttributeError("'OutcomeTable' object has no attribute '{}'".format(name))
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def index(self, counts):
+        """
+        Row of a face histogram in the table.
+
+        :param counts: Sequence of 10 counts, or an array of shape (n, 10) of them.
+        :return: int, or array of ints for an array of histograms.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        single = counts.ndim == 1
+        counts = counts.reshape(-1, 10)
+
+        size = counts.sum(axis=1)
+        if (size > self.max_dice).any():
+            raise ValueError("Only pools of up to {} dice are in the table.".format(self.max_dice))
+
+        rest = size[:, None] - np.hstack([np.zeros((len(counts), 1), dtype=np.int64), counts.cumsum(axis=1)[:, :8]])
+        rows = self.offsets[size] + self._before[np.arange(9), rest, counts[:, :9]].sum(axis=1)
+
+        return int(rows[0]) if single else rows
+
+    def lookup(self, roll):
+        """
+        Results of a roll from the table.
+
+        :param roll: Roll, CompactRoll or sequence of 10 face counts.
+        :return: Outcome
+        """
+        counts = roll.counts if hasattr(roll, "counts") else roll
+        row = self.index(counts)
+
+        return Outcome(*self._results(counts, row), float(self._load()["probability"][row]))
+
+    def results(self, counts):
+        """
+        Results of a face histogram from the table, in the order of the Roll properties.
+
+        :param counts: Sequence of 10 face counts.
+        :return: Tuple of (matches, highest, widest, waste).
+        """
+        if self._ranks is None:
+            # index() for a single histogram, without the overhead of small NumPy arrays.
+            self._ranks = self._before.tolist(), self.offsets.tolist()
+
+        before, offsets = self._ranks
+
+        rest = sum(counts)
+        if rest > self.max_dice:
+            raise ValueError("Only pools of up to {} dice are in the table.".format(self.max_dice))
+
+        row = offsets[rest]
+        for i in range(9):
+            row += before[i][rest][counts[i]]
+            rest -= counts[i]
+
+        return self._results(counts, row)
+
+    def _results(self, counts, row):
+        columns = self._load()
+
+        highest = Match(*columns["highest"][row].tolist())
+        widest = Match(*columns["widest"][row].tolist())
+        waste = int(columns["waste"][row])
+
+        return ([Match(count, face) for face, count in enumerate(counts, 1) if count > 1],
+                highest if highest.width else (),
+                widest if widest.width else (),
+                [face for face in range(1, 11) if waste >> face - 1 & 1])
+
+    def static_contest(self, roll, diff=1):
+        """static_contest() for a Roll, resolved by one table lookup."""
+        height = self.highest[self.index(roll.counts), 1]
+        return bool(height and height >= diff)
+
+    def dynamic_contest(self, roll1, roll2, width_wins=False):
+        """dynamic_contest() for two Rolls, resolved by one table lookup per roll."""
+        column = self.widest if width_wins else self.highest
+        key = 0 if width_wins else 1
+        score1 = column[self.index(roll1.counts), key]
+        score2 = column[self.index(roll2.counts), key]
+
+        if not (score1 or score2):
+            return None
+
+        return bool(score1 > score2)
+
+    def sample(self, pool, size=None, rng=None):
+        """
+        Draw outcomes of a pool directly from the table instead of rolling single dice.
+
+        :param pool: Number of dice, at most max_dice.
+        :param size: Number of outcomes to draw, or None for a single one.
+        :param rng: numpy.random.Generator or seed.
+        :return: Table rows of the drawn outcomes, see sample_rolls() for Roll objects.
+        """
+        if not 0 <= pool <= self.max_dice:
+            raise ValueError("Only pools of up to {} dice are in the table.".format(self.max_dice))
+
+        if pool not in self._cdf:
+            cdf = np.cumsum(self.probability[self.offsets[pool]:self.offsets[pool + 1]])
+            self._cdf[pool] = cdf / cdf[-1]
+
+        rng = np.random.default_rng(rng)
+        rows = np.searchsorted(self._cdf[pool], rng.random(size), side="right") + self.offsets[pool]
+
+        return rows
+
+    def sample_rolls(self, pool, size, rng=None):
+        """
+        Draw Rolls of a pool directly from the table.
+
+        :param pool: Number of dice, at most max_dice.
+        :param size: Number of Rolls.
+        :param rng: numpy.random.Generator or seed.
+        :return: List of Roll objects.
+        """
+        counts = self.counts[self.sample(pool, size, rng)]
+        faces = np.arange(1, 11)
+
+        return [Roll._from_counts(np.repeat(faces, row).tolist(), row.tolist()) for row in counts]
+
+
+_default = None
+
+
+def default_table():
+    """
+    Shared OutcomeTable for pools of up to 10 dice.
+
+    :return: OutcomeTable
+    """
+    global _default
+
+    if _default is None:
+        _default = OutcomeTable()
+
+    return _default
+
+
+def use_table(table=True):
+    """
+    Resolve the results of Rolls, and so the contests between them, through an outcome table.
+
+    Only pools of up to table.max_dice dice are looked up; larger ones are still computed
+    from their dice. Results already cached by a Roll are kept until its dice change. A
+    Roll computes its results from a histogram of 10 counts, so a lookup per Roll is not
+    faster; the table pays off for its own bulk methods.
+
+        >>> use_table()
+        >>> Roll([2, 2, 7]).highest      # looked up in default_table()
+        2x2
+        >>> use_table(None)
+
+    :param table: OutcomeTable, True for default_table(), or None to stop using a table.
+    """
+    core._outcomes = default_table() if table is True else table
@@ -0,0 +1,89 @@
+from oneroll.lookup import *
+from oneroll.core import _summarize, dynamic_contest, static_contest
+from oneroll.odds import highest_distribution
+from math import comb
+import pytest
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    return OutcomeTable(max_dice=6, path=str(tmp_path_factory.mktemp("cache") / "outcomes"))
+
+
+class TestOutcomeTable:
+    """Tests for the precomputed outcome table."""
+
+    def test_size(self, table):
+        """The table holds every histogram of 0 to max_dice dice exactly once."""
+        assert len(table) == sum(comb(n + 9, 9) for n in range(7))
+        assert len(table.counts) == len(table)
+        assert len({bytes(row) for row in table.counts}) == len(table)
+
+    def test_index(self, table):
+        """index() finds the row of every histogram in the table."""
+        assert (table.index(table.counts) == np.arange(len(table))).all()
+        assert table.index([0] * 10) == 0
+
+        with pytest.raises(ValueError):
+            table.index([7] + [0] * 9)
+
+    def test_probabilities(self, table):
+        """The outcomes of every pool size add up to one."""
+        for n in range(7):
+            assert table.probability[table.offsets[n]:table.offsets[n + 1]].sum() == pytest.approx(1)
+
+    def test_lookup_same_as_roll(self, table):
+        for x in range(300):
+            roll = Roll(x % 7)
+            outcome = table.lookup(roll)
+
+            assert outcome.matches == roll.matches
+            assert outcome.highest == roll.highest
+            assert outcome.widest == roll.widest
+            assert outcome.waste == roll.waste
+
+    def test_contests(self, table):
+        for x in range(300):
+            roll1, roll2 = Roll(x % 7), Roll(6 - x % 7)
+
+            assert table.static_contest(roll1, x % 11) == static_contest(roll1, x % 11)
+            assert table.dynamic_contest(roll1, roll2) == dynamic_contest(roll1, roll2)
+            assert table.dynamic_contest(roll1, roll2, True) == dynamic_contest(roll1, roll2, True)
+
+    def test_cached_on_disk(self, table):
+        """A second table over the same path memory-maps the saved columns."""
+        table.counts
+        cached = OutcomeTable(max_dice=6, path=table.path)
+
+        assert isinstance(cached.probability, np.memmap)
+        assert (cached.widest == table.widest).all()
+
+    def test_sample(self, table):
+        """Sampled outcomes follow the exact distribution of the pool."""
+        rolls = table.sample_rolls(4, 20000, rng=1)
+        assert all(len(roll) == 4 for roll in rolls)
+
+        no_match = sum(not roll.matches for roll in rolls) / len(rolls)
+        assert no_match == pytest.approx(float(highest_distribution(4)[()]), abs=0.02)
+
+        assert table.offsets[3] <= table.sample(3, rng=2) < table.offsets[4]
+
+    def test_use_table(self, table, monkeypatch):
+        """With use_table() the results of small pools, and the contests between them, come from the table."""
+        looked_up = []
+        results = table.results
+        monkeypatch.setattr(table, "results", lambda counts: looked_up.append(len(counts)) or results(counts))
+
+        use_table(table)
+        try:
+            for x in range(100):
+                roll1, roll2, large = Roll(x % 7), Roll(6 - x % 7), Roll(12, over10=True)
+
+                assert (roll1.matches, roll1.highest, roll1.widest, roll1.waste) == _summarize(roll1._counts)
+                assert large.matches == _summarize(large._counts)[0]
+                dynamic_contest(roll1, roll2)
+        finally:
+            use_table(None)
+
+        assert len(looked_up) == 200
+        assert Roll([3, 3]).highest == Match(2, 3) and len(looked_up) == 200
@@ -0,0 +1,164 @@
+"""
+Random networks of companies.
+
+Companies are nodes 0 to n - 1, numbered like the sequence of companies the network is built
+from. The network is a random tree, every company linked to one of the companies before it,
+with some random extra edges on top. Edges are kept as an array of node id pairs, and the
+adjacency as CSR arrays, so building and walking networks of millions of companies does not
+need NetworkX.
+
+    >>> network = build_company_network(generate_companies(1000, rng=1), extra_edges=50, seed=1)
+    >>> network
+    CompanyNetwork(companies=1000, edges=1049)
+    >>> network.neighbors(0)
+    array([  1,   2,   6,  21,  42, 125], dtype=int32)
+"""
+import numpy as np
+
+
+def random_tree(n, rng):
+    """
+    Edges of a random recursive tree: node i is linked to a uniformly chosen node before it.
+
+    :param n: Number of nodes.
+    :param rng: numpy.random.Generator
+    :return: int64 array of shape (n - 1, 2) of (parent, child) pairs.
+    """
+    children = np.arange(1, max(n, 1), dtype=np.int64)
+    parents = rng.integers(0, children) if len(children) else children
+
+    return np.column_stack([parents, children])
+
+
+def random_edges(n, k, rng):
+    """
+    k random edges between distinct nodes.
+
+    :param n: Number of nodes.
+    :param k: Number of edges.
+    :param rng: numpy.random.Generator
+    :return: int64 array of shape (k, 2).
+    """
+    if n < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    u = rng.integers(0, n, size=k)
+    v = (u + rng.integers(1, n, size=k)) % n
+
+    return np.column_stack([u, v])
+
+
+class CompanyNetwork:
+    """
+    Undirected simple graph of companies on integer node ids.
+
+    :param companies: Sequence of companies, eg. a list of Company objects or a CompanyTable. Node i is companies[i].
+    :param edges: Array-like of shape (m, 2) of node id pairs. Self-loops and repeated edges are dropped.
+    """
+
+    def __init__(self, companies, edges=()):
+        self.companies = companies
+        self.edges = np.zeros((0, 2), dtype=np.int64)
+        self._csr = None
+        self.add_edges(edges)
+
+    def __len__(self):
+        return len(self.companies)
+
+    def add_edges(self, edges):
+        """
+        Add edges to the network.
+
+        :param edges: Array-like of shape (m, 2) of node id pairs.
+        :return: int64 array of the edges that were new, as (low id, high id) pairs.
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+        if len(edges) and (edges.min() < 0 or edges.max() >= len(self)):
+            raise ValueError("Edge refers to a node that is not in the network of {} companies.".format(len(self)))
+
+        edges = np.sort(edges, axis=1)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+
+        n = np.int64(len(self))
+        keys = edges[:, 0] * n + edges[:, 1]
+        keys, first = np.unique(keys, return_index=True)
+        new = ~np.isin(keys, self.edges[:, 0] * n + self.edges[:, 1])
+        added = edges[np.sort(first[new])]
+
+        if len(added):
+            self.edges = np.vstack([self.edges, added])
+            self._csr = None
+
+        return added
+
+    @property
+    def csr(self):
+        """
+        Adjacency in CSR form: the neighbors of node i are indices[indptr[i]:indptr[i + 1]], in ascending order.
+
+        :return: Tuple of (indptr, indices), int64 and int32 arrays.
+        """
+        if self._csr is None:
+            source = np.concatenate([self.edges[:, 0], self.edges[:, 1]])
+            target = np.concatenate([self.edges[:, 1], self.edges[:, 0]])
+            order = np.lexsort([target, source])
+
+            indptr = np.zeros(len(self) + 1, dtype=np.int64)
+            indptr[1:] = np.bincount(source, minlength=len(self)).cumsum()
+            self._csr = indptr, target[order].astype(np.int32)
+
+        return self._csr
+
+    @property
+    def degree(self):
+        """Number of neighbors of every node."""
+        return np.diff(self.csr[0])
+
+    def neighbors(self, node):
+        """
+        Neighbors of a node.
+
+        :param node: Node id.
+        :return: int32 array of node ids.
+        """
+        indptr, indices = self.csr
+        return indices[indptr[node]:indptr[node + 1]]
+
+    def to_networkx(self):
+        """
+        The network as a networkx.Graph. Nodes are the integer ids, with the company's name,
+        stats and assets, and the company itself as "company", as node attributes.
+
+        :return: networkx.Graph
+        """
+        import networkx
+
+        graph = networkx.Graph()
+
+        for node, company in enumerate(self.companies):
+            graph.add_node(node, company=company, name=company.name, assets=company.assets, **company.stats)
+
+        graph.add_edges_from(self.edges.tolist())
+
+        return graph
+
+    def __repr__(self):
+        return "CompanyNetwork(companies={}, edges={})".format(len(self), len(self.edges))
+
+
+def build_company_network(companies, extra_edges=0, seed=None):
+    """
+    Link companies into a random tree, then add random extra edges.
+
+    Runs in linear time in the number of companies.
+
+    :param companies: Sequence of companies, eg. a list of Company objects or a CompanyTable.
+    :param extra_edges: Number of random edges added on top of the tree. Edges already in the network are not added again.
+    :param seed: numpy.random.Generator or seed.
+    :return: CompanyNetwork
+    """
+    rng = np.random.default_rng(seed)
+    n = len(companies)
+
+    return CompanyNetwork(companies, np.vstack([random_tree(n, rng), random_edges(n, extra_edges, rng)]))
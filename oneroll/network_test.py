@@ -0,0 +1,67 @@
+from oneroll.network import *
+from oneroll.companies import Company
+from oneroll.generate import generate_companies
+import networkx
+import pytest
+
+
+class TestBuildCompanyNetwork:
+    """Tests for build_company_network."""
+
+    def test_tree(self):
+        """Without extra edges the network is a spanning tree with every node linked to an earlier one."""
+        network = build_company_network([Company() for x in range(200)], seed=1)
+
+        assert len(network.edges) == 199
+        assert (network.edges[:, 0] < network.edges[:, 1]).all()
+        assert networkx.is_tree(network.to_networkx())
+
+    def test_extra_edges(self):
+        network = build_company_network([Company() for x in range(200)], extra_edges=20, seed=1)
+
+        assert 199 < len(network.edges) <= 219
+        assert networkx.is_connected(network.to_networkx())
+
+    def test_seed(self):
+        companies = [Company() for x in range(100)]
+
+        assert (build_company_network(companies, 10, seed=5).edges == build_company_network(companies, 10, seed=5).edges).all()
+
+    def test_node_attributes(self):
+        table = generate_companies(20, columns=True, rng=1)
+        graph = build_company_network(table, extra_edges=3, seed=1).to_networkx()
+
+        assert sorted(graph.nodes) == list(range(20))
+        assert graph.nodes[4]["company"] == table[4]
+        assert graph.nodes[4]["might"] == table[4].might
+        assert graph.nodes[4]["assets"] == table[4].assets
+
+    def test_small(self):
+        assert len(build_company_network([], extra_edges=5).edges) == 0
+        assert len(build_company_network([Company()], extra_edges=5).edges) == 0
+
+
+class TestCompanyNetwork:
+    """Tests for the CompanyNetwork class."""
+
+    def test_csr(self):
+        """The CSR adjacency lists the same neighbors as NetworkX."""
+        network = build_company_network([Company() for x in range(300)], extra_edges=50, seed=2)
+        graph = network.to_networkx()
+
+        for node in graph:
+            assert network.neighbors(node).tolist() == sorted(graph[node])
+
+        assert network.degree.tolist() == [graph.degree(node) for node in range(300)]
+
+    def test_add_edges(self):
+        """Repeated edges and self-loops are not added, in either direction."""
+        network = CompanyNetwork([Company() for x in range(4)], [(0, 1), (1, 2)])
+        added = network.add_edges([(1, 0), (2, 2), (3, 0), (0, 3)])
+
+        assert added.tolist() == [[0, 3]]
+        assert network.neighbors(0).tolist() == [1, 3]
+
+    def test_invalid_edge(self):
+        with pytest.raises(ValueError):
+            CompanyNetwork([Company()] * 3, [(0, 3)])
@@ -0,0 +1,344 @@
+"""
+Exact odds for One Roll Engine pools.
+
+Instead of rolling, every probability here is counted: a pool of n d10 has 10**n equally
+likely outcomes, and the number of outcomes whose face histogram satisfies some per-face
+bounds is a sum of multinomial coefficients. Those sums are memoized, so whole odds tables
+are cheap to build.
+
+    >>> no_match_probability(4)
+    Fraction(63, 125)
+    >>> dynamic_odds(5, 3).win
+    Fraction(1490439, 2500000)
+"""
+from collections import Counter, namedtuple
+from fractions import Fraction
+from functools import lru_cache
+from math import comb
+
+from .core import Match
+
+
+class Pool(namedtuple("Pool", ["dice", "penalty", "over10", "ed", "md"], defaults=(0, False, None, False))):
+    """
+    Description of an ORE dice pool for odds calculations.
+
+        >>> Pool(6, ed=10)
+        Pool(dice=6, penalty=0, over10=False, ed=10, md=False)
+
+    :param dice: Number of dice in the pool.
+    :param penalty: Number of penalty dice, subtracted before rolling.
+    :param over10: Allow rolling more than 10 dice.
+    :param ed: Value of an Expert Die added to the roll, or None.
+    :param md: True if a Master Die is added after rolling. It is always set to the value
+        that is best for the question asked: the highest Match for heights and difficulties,
+        the widest Match for widths.
+    """
+    __slots__ = ()
+
+    @property
+    def rolled(self):
+        """Number of dice actually rolled, after penalty and the 10 dice limit, like Roll."""
+        x = max(self.dice - self.penalty, 0)
+
+        if not self.over10:
+            x = min(x, 10)
+
+        return x
+
+
+ContestOdds = namedtuple("ContestOdds", ["win", "lose", "none", "tie"])
+ContestOdds.__doc__ = """\
+Probabilities of the results of dynamic_contest().
+
+:param win: Probability that dynamic_contest returns True.
+:param lose: Probability that dynamic_contest returns False, ties included.
+:param none: Probability that dynamic_contest returns None, ie. neither roll has a Match.
+:param tie: Probability that both rolls have a Match and neither beats the other.
+"""
+
+
+@lru_cache(maxsize=None)
+def _ways(n, m, lo, hi):
+    """Number of ways to spread n distinguishable dice over m faces with lo to hi dice on every face."""
+    if m == 0:
+        return 1 if n == 0 else 0
+
+    return sum(comb(n, c) * _ways(n - c, m - 1, lo, hi) for c in range(lo, min(hi, n) + 1))
+
+
+@lru_cache(maxsize=None)
+def _count(n, groups):
+    """
+    Number of ways to spread n distinguishable dice over groups of faces.
+
+    :param groups: Tuple of (faces, lo, hi) triples; each face of a group gets lo to hi dice.
+    """
+    if not groups:
+        return 1 if n == 0 else 0
+
+    (m, lo, hi), rest = groups[0], groups[1:]
+
+    return sum(comb(n, k) * _ways(k, m, lo, hi) * _count(n - k, rest) for k in range(n + 1))
+
+
+def _outcomes(pool, bounds):
+    """
+    Number of outcomes of a pool whose face histogram lies within bounds.
+
+    :param pool: Pool
+    :param bounds: Dict of face: (lo, hi) bounds on the number of dice showing that face,
+        Expert Die included. Faces that are not listed are unbounded.
+    :return: int, out of 10 ** pool.rolled equally likely outcomes.
+    """
+    n = pool.rolled
+    groups = Counter()
+
+    for face in range(1, 11):
+        lo, hi = bounds.get(face, (0, n + 1))
+
+        if face == pool.ed:
+            lo, hi = lo - 1, hi - 1
+
+        lo, hi = max(lo, 0), min(hi, n)
+
+        if hi < lo:
+            return 0
+
+        groups[lo, hi] += 1
+
+    return _count(n, tuple(sorted((m, lo, hi) for (lo, hi), m in groups.items())))
+
+
+def _bounds(above, face, width, below, between=()):
+    """
+    Bounds for "face shows width dice, faces above it show at most above, faces below at most below".
+
+    :param between: Optional (top_face, top_width, middle) to additionally put top_width dice
+        on top_face and at most middle dice on the faces between face and top_face.
+    """
+    bounds = {f: (0, below) for f in range(1, face)}
+    bounds[face] = (width, width)
+    top = face
+
+    if between:
+        top, top_width, middle = between
+        bounds.update({f: (0, middle) for f in range(face + 1, top)})
+        bounds[top] = (top_width, top_width)
+
+    bounds.update({f: (0, above) for f in range(top + 1, 11)})
+
+    return bounds
+
+
+def _unbounded(pool):
+    return pool.rolled + 1
+
+
+def _has_dice(pool):
+    return pool.rolled > 0 or pool.ed is not None
+
+
+@lru_cache(maxsize=None)
+def _highest_counts(pool):
+    """Outcome counts of Roll.highest, () meaning no Match."""
+    free = _unbounded(pool) + 1
+    counts = Counter()
+
+    if pool.md:
+        # The Master Die goes to the highest die rolled: either it joins the highest Match
+        # or it pairs up with a waste die higher than that.
+        for face in range(1, 11):
+            for width in range(1, free):
+                counts[Match(width + 1, face)] += _outcomes(pool, _bounds(0, face, width, free))
+    else:
+        for face in range(1, 11):
+            for width in range(2, free):
+                counts[Match(width, face)] += _outcomes(pool, _bounds(1, face, width, free))
+
+    return _complete(pool, counts)
+
+
+@lru_cache(maxsize=None)
+def _widest_counts(pool):
+    """Outcome counts of Roll.widest, () meaning no Match."""
+    free = _unbounded(pool) + 1
+    counts = Counter()
+
+    if pool.md:
+        # The Master Die goes to the highest of the widest sets, making it the only widest one.
+        for face in range(1, 11):
+            for width in range(1, free):
+                counts[Match(width + 1, face)] += _outcomes(pool, _bounds(width - 1, face, width, width))
+    else:
+        for face in range(1, 11):
+            for width in range(2, free):
+                # The highest Match is as wide as any other one.
+                counts[Match(width, face)] += _outcomes(pool, _bounds(1, face, width, width))
+
+                # The lowest of the widest Matches, with a narrower highest Match above it.
+                for top in range(face + 1, 11):
+                    for top_width in range(2, width):
+                        bounds = _bounds(1, face, width, width - 1, (top, top_width, width))
+                        counts[Match(width, face)] += _outcomes(pool, bounds)
+
+    return _complete(pool, counts)
+
+
+@lru_cache(maxsize=None)
+def _width_counts(pool):
+    """Outcome counts of the largest Match width, None meaning no Match."""
+    counts = Counter()
+    below = 0
+
+    for width in range(_unbounded(pool) + 1):
+        within = _outcomes(pool, {f: (0, width) for f in range(1, 11)})
+        result = width + 1 if pool.md and width else width
+        counts[result if result > 1 else None] += within - below
+        below = within
+
+    return counts
+
+
+def _complete(pool, counts):
+    """Add the no Match outcomes to counts and drop impossible results."""
+    counts = Counter({result: n for result, n in counts.items() if n})
+
+    if pool.md and _has_dice(pool):
+        counts[()] += 0
+    else:
+        counts[()] += _outcomes(pool, {f: (0, 1) for f in range(1, 11)})
+
+    return counts
+
+
+def _as_pool(pool):
+    if type(pool) == int:
+        return Pool(pool)
+
+    if not isinstance(pool, Pool):
+        raise TypeError("Int or Pool expected but {} given.".format(type(pool)))
+
+    if pool.ed is not None and not 1 <= pool.ed <= 10:
+        raise ValueError("Expert Die must be between 1 and 10.")
+
+    return pool
+
+
+def _distribution(counts, pool):
+    total = 10 ** pool.rolled
+    return {result: Fraction(n, total) for result, n in counts.items()}
+
+
+def highest_distribution(pool):
+    """
+    Exact distribution of Roll.highest for a pool.
+
+        >>> highest_distribution(2)[Match(2, 10)]
+        Fraction(1, 100)
+
+    :param pool: int number of dice or Pool.
+    :return: Dict of Match: probability; the key () holds the probability of no Match.
+    """
+    pool = _as_pool(pool)
+    return _distribution(_highest_counts(pool), pool)
+
+
+def widest_distribution(pool):
+    """
+    Exact distribution of Roll.widest for a pool, with the same tiebreak as Roll.widest.
+
+    :param pool: int number of dice or Pool.
+    :return: Dict of Match: probability; the key () holds the probability of no Match.
+    """
+    pool = _as_pool(pool)
+    return _distribution(_widest_counts(pool), pool)
+
+
+def no_match_probability(pool):
+    """
+    Exact probability that a pool rolls no Match at all.
+
+    :param pool: int number of dice or Pool.
+    :return: Fraction
+    """
+    return highest_distribution(pool)[()]
+
+
+@lru_cache(maxsize=None)
+def _score_counts(pool, width_wins):
+    """Outcome counts of the value dynamic_contest compares, None meaning no Match."""
+    if width_wins:
+        return _width_counts(pool)
+
+    counts = Counter()
+
+    for result, n in _highest_counts(pool).items():
+        counts[result[1] if result else None] += n
+
+    return counts
+
+
+def static_odds(pool, diff=1):
+    """
+    Exact probability that static_contest succeeds.
+
+        >>> static_odds(10, diff=10)
+        Fraction(2639010709, 10000000000)
+
+    :param pool: int number of dice or Pool.
+    :param diff: Difficulty the height of the highest Match must reach.
+    :return: Fraction
+    """
+    pool = _as_pool(pool)
+    counts = _score_counts(pool, False)
+
+    return Fraction(sum(n for height, n in counts.items() if height is not None and height >= diff),
+                    10 ** pool.rolled)
+
+
+def dynamic_odds(pool1, pool2, width_wins=False):
+    """
+    Exact probabilities of the results of dynamic_contest(pool1, pool2).
+
+    :param pool1: int number of dice or Pool.
+    :param pool2: int number of dice or Pool.
+    :param width_wins: Compare the widest Matches instead of the highest ones.
+    :return: ContestOdds
+    """
+    pool1 = _as_pool(pool1)
+    pool2 = _as_pool(pool2)
+    counts1 = _score_counts(pool1, width_wins)
+    counts2 = _score_counts(pool2, width_wins)
+
+    win = tie = 0
+    for score1, n1 in counts1.items():
+        if score1 is None:
+            continue
+        for score2, n2 in counts2.items():
+            if score2 is None or score1 > score2:
+                win += n1 * n2
+            elif score1 == score2:
+                tie += n1 * n2
+
+    total = 10 ** (pool1.rolled + pool2.rolled)
+    none = counts1[None] * counts2[None]
+
+    return ContestOdds(Fraction(win, total),
+                       Fraction(total - win - none, total),
+                       Fraction(none, total),
+                       Fraction(tie, total))
+
+
+def dynamic_odds_matrix(pools1=range(1, 16), pools2=range(1, 16), width_wins=False):
+    """
+    Table of dynamic_odds() for every combination of two sets of pools.
+
+    :param pools1: Iterable of ints or Pools for the first roll.
+    :param pools2: Iterable of ints or Pools for the second roll.
+    :param width_wins: Compare the widest Matches instead of the highest ones.
+    :return: List of rows, one per pool in pools1, of ContestOdds, one per pool in pools2.
+    """
+    pools2 = list(pools2)
+
+    return [[dynamic_odds(pool1, pool2, width_wins) for pool2 in pools2] for pool1 in pools1]
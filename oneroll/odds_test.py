@@ -0,0 +1,115 @@
+from oneroll.odds import *
+from oneroll.core import Roll, dynamic_contest, static_contest
+from collections import Counter
+from itertools import product
+import pytest
+
+
+def outcomes(pool):
+    """Every equally likely dice list of a Pool, Expert Die included."""
+    for dice in product(range(1, 11), repeat=pool.rolled):
+        yield list(dice) + ([pool.ed] if pool.ed else [])
+
+
+def best_md(dice, key):
+    """Roll with the Master Die value that maximizes key."""
+    return max((Roll(dice + [md]) for md in range(1, 11)), key=key)
+
+
+def by_height(roll):
+    return (roll.highest[1], roll.highest[0]) if roll.highest else (0, 0)
+
+
+def by_width(roll):
+    return tuple(roll.widest) if roll.widest else (0, 0)
+
+
+def frequencies(counter, total):
+    return {result: Fraction(n, total) for result, n in counter.items()}
+
+
+def nonzero(distribution):
+    return {result: p for result, p in distribution.items() if p}
+
+
+POOLS = [Pool(0), Pool(1), Pool(3), Pool(4), Pool(12, penalty=9), Pool(3, ed=5), Pool(2, ed=10),
+         Pool(3, md=True), Pool(2, ed=3, md=True), Pool(0, md=True)]
+
+
+class TestDistributions:
+    """The exact distributions must equal a count over every possible roll."""
+
+    @pytest.mark.parametrize("pool", POOLS)
+    def test_highest_widest(self, pool):
+        highest, widest = Counter(), Counter()
+
+        for dice in outcomes(pool):
+            if pool.md:
+                highest[best_md(dice, by_height).highest] += 1
+                widest[best_md(dice, by_width).widest] += 1
+            else:
+                roll = Roll(dice)
+                highest[roll.highest] += 1
+                widest[roll.widest] += 1
+
+        total = 10 ** pool.rolled
+
+        assert nonzero(highest_distribution(pool)) == frequencies(highest, total)
+        assert nonzero(widest_distribution(pool)) == frequencies(widest, total)
+
+    def test_distribution_sums_to_one(self):
+        assert sum(highest_distribution(Pool(15, over10=True, ed=7)).values()) == 1
+        assert sum(widest_distribution(Pool(15, over10=True, md=True)).values()) == 1
+
+    def test_no_match(self):
+        """A pool without any Match has all dice different."""
+        assert no_match_probability(1) == 1
+        assert no_match_probability(3) == Fraction(10 * 9 * 8, 1000)
+        assert no_match_probability(11) == no_match_probability(10)
+        assert no_match_probability(Pool(11, over10=True)) == 0
+
+    def test_invalid_pool(self):
+        with pytest.raises(TypeError):
+            highest_distribution("four")
+
+        with pytest.raises(ValueError):
+            highest_distribution(Pool(4, ed=11))
+
+
+class TestContests:
+    """The exact contest odds must equal a count over every possible pair of rolls."""
+
+    @pytest.mark.parametrize("width_wins", [False, True])
+    @pytest.mark.parametrize("pools", [(2, 2), (3, 1), (1, 3)])
+    def test_dynamic_odds(self, pools, width_wins):
+        results = Counter()
+        ties = 0
+        rolls1 = [Roll(dice) for dice in outcomes(Pool(pools[0]))]
+        rolls2 = [Roll(dice) for dice in outcomes(Pool(pools[1]))]
+
+        for roll1 in rolls1:
+            for roll2 in rolls2:
+                results[dynamic_contest(roll1, roll2, width_wins=width_wins)] += 1
+                ties += bool(roll1.matches and roll2.matches and
+                             dynamic_contest(roll1, roll2, width_wins) == dynamic_contest(roll2, roll1, width_wins))
+
+        total = len(rolls1) * len(rolls2)
+
+        assert dynamic_odds(*pools, width_wins=width_wins) == ContestOdds(Fraction(results[True], total),
+                                                                          Fraction(results[False], total),
+                                                                          Fraction(results[None], total),
+                                                                          Fraction(ties, total))
+
+    @pytest.mark.parametrize("diff", range(1, 11))
+    def test_static_odds(self, diff):
+        wins = sum(static_contest(Roll(dice), diff) for dice in outcomes(Pool(3)))
+
+        assert static_odds(3, diff) == Fraction(wins, 1000)
+
+    def test_matrix(self):
+        """The matrix holds one ContestOdds per pair of pools, each summing to one."""
+        matrix = dynamic_odds_matrix(width_wins=True)
+
+        assert len(matrix) == 15 and all(len(row) == 15 for row in matrix)
+        assert all(odds.win + odds.lose + odds.none == 1 for row in matrix for odds in row)
+        assert matrix[4][2] == dynamic_odds(5, 3, width_wins=True)
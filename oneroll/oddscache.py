@@ -0,0 +1,209 @@
+"""
+Memoized contest odds.
+
+OddsCache sits in front of static_odds() and dynamic_odds(). It keeps the most recently
+used results up to maxsize, counts hits and misses, can be shared between threads, and can
+be saved to a JSON file and loaded again so a restarted process does not start cold.
+
+    >>> cache = OddsCache(maxsize=512, path="odds.json")
+    >>> cache.dynamic(Pool(5, ed=10), 4).win
+    Fraction(140225523, 200000000)
+    >>> cache.info()
+    CacheInfo(hits=0, misses=1, maxsize=512, currsize=1)
+    >>> cache.save()
+"""
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from fractions import Fraction
+
+from .odds import ContestOdds, Pool, _as_pool, dynamic_odds, static_odds
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+VERSION = 1
+
+
+def _encode(value):
+    if isinstance(value, ContestOdds):
+        return [str(p) for p in value]
+    return str(value)
+
+
+def _decode(kind, value):
+    if kind == "dynamic":
+        return ContestOdds(*(Fraction(p) for p in value))
+    return Fraction(value)
+
+
+def _key(kind, pools, arg):
+    """Hashable, JSON friendly cache key."""
+    return (kind,) + tuple(tuple(_as_pool(pool)) for pool in pools) + (arg,)
+
+
+class OddsCache:
+    """
+    Bounded LRU cache of exact contest odds.
+
+    :param maxsize: Number of results kept; the least recently used ones are dropped first.
+    :param path: JSON file the cache is loaded from, if it exists, and saved to by save().
+    """
+
+    def __init__(self, maxsize=1024, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def _get(self, key, compute):
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+
+            self.misses += 1
+
+        # Computed without the lock, so slow misses do not hold up hits of other threads.
+        value = compute()
+
+        with self._lock:
+            self._store(key, value)
+
+        return value
+
+    def _store(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def static(self, pool, diff=1):
+        """
+        Cached static_odds().
+
+        :param pool: int number of dice or Pool.
+        :param diff: Difficulty of the contest.
+        :return: Fraction
+        """
+        return self._get(_key("static", [pool], diff), lambda: static_odds(pool, diff))
+
+    def dynamic(self, pool1, pool2, width_wins=False):
+        """
+        Cached dynamic_odds().
+
+        :param pool1: int number of dice or Pool.
+        :param pool2: int number of dice or Pool.
+        :param width_wins: Compare the widest Matches instead of the highest ones.
+        :return: ContestOdds
+        """
+        return self._get(_key("dynamic", [pool1, pool2], bool(width_wins)),
+                         lambda: dynamic_odds(pool1, pool2, width_wins))
+
+    def info(self):
+        """
+        Cache statistics, like functools.lru_cache's cache_info().
+
+        :return: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """Drop all results and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def save(self, path=None):
+        """
+        Write the cached results to a JSON file. The file is replaced atomically, so readers
+        never see a partly written cache.
+
+        :param path: File to write, defaults to the path the cache was created with.
+        """
+        path = path or self.path
+
+        if not path:
+            raise ValueError("No path to save the odds cache to.")
+
+        with self._lock:
+            entries = [[list(key), _encode(value)] for key, value in self._data.items()]
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".oddscache", suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": VERSION, "entries": entries}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, path=None):
+        """
+        Add the results saved in a JSON file. A missing, unreadable or outdated file is ignored.
+
+        :param path: File to read, defaults to the path the cache was created with.
+        :return: Number of results loaded.
+        """
+        try:
+            with open(path or self.path) as f:
+                data = json.load(f)
+
+            if data.get("version") != VERSION:
+                return 0
+
+            entries = [(self._parse_key(key), _decode(key[0], value)) for key, value in data["entries"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+        with self._lock:
+            for key, value in entries:
+                self._store(key, value)
+
+        return len(entries)
+
+    @staticmethod
+    def _parse_key(key):
+        kind, *pools, arg = key
+        return (kind,) + tuple(tuple(Pool(*pool)) for pool in pools) + (arg,)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.path:
+            self.save()
+
+    def __repr__(self):
+        return "OddsCache(maxsize={}, currsize={})".format(self.maxsize, len(self))
+
+
+_default = None
+
+
+def default_cache():
+    """
+    Shared OddsCache of the process.
+
+    :return: OddsCache
+    """
+    global _default
+
+    if _default is None:
+        _default = OddsCache()
+
+    return _default
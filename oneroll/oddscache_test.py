@@ -0,0 +1,94 @@
+from oneroll.oddscache import *
+from oneroll.odds import dynamic_odds, static_odds
+import json
+import threading
+import pytest
+
+
+class TestOddsCache:
+    """Tests for the OddsCache class."""
+
+    def test_values(self):
+        cache = OddsCache()
+
+        assert cache.static(Pool(6, md=True), 8) == static_odds(Pool(6, md=True), 8)
+        assert cache.dynamic(5, Pool(4, ed=10), width_wins=True) == dynamic_odds(5, Pool(4, ed=10), True)
+
+    def test_hits(self):
+        """An int and the equal Pool share one entry."""
+        cache = OddsCache()
+        cache.dynamic(5, 4)
+        cache.dynamic(Pool(5), Pool(4))
+        cache.dynamic(5, 4, width_wins=True)
+        cache.static(5, 3)
+
+        assert cache.info() == CacheInfo(hits=1, misses=3, maxsize=1024, currsize=3)
+
+    def test_lru(self):
+        """The least recently used result is dropped first."""
+        cache = OddsCache(maxsize=2)
+        cache.static(3)
+        cache.static(4)
+        cache.static(3)
+        cache.static(5)
+        cache.static(3)
+        cache.static(4)
+
+        assert cache.info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+    def test_clear(self):
+        cache = OddsCache()
+        cache.static(3)
+        cache.clear()
+
+        assert cache.info() == CacheInfo(0, 0, 1024, 0)
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "odds.json")
+
+        with OddsCache(path=path) as cache:
+            cache.static(Pool(5, ed=7), 6)
+            cache.dynamic(5, 3)
+
+        restarted = OddsCache(path=path)
+
+        assert len(restarted) == 2
+        assert restarted.dynamic(5, 3) == dynamic_odds(5, 3)
+        assert restarted.static(Pool(5, ed=7), 6) == static_odds(Pool(5, ed=7), 6)
+        assert restarted.info().misses == 0
+        assert not [name for name in tmp_path.iterdir() if name.suffix == ".tmp"]
+
+    def test_bad_file(self, tmp_path):
+        """A corrupt or outdated file leaves the cache cold instead of failing."""
+        path = tmp_path / "odds.json"
+        path.write_text("{not json")
+        assert len(OddsCache(path=str(path))) == 0
+
+        path.write_text(json.dumps({"version": 0, "entries": []}))
+        assert len(OddsCache(path=str(path))) == 0
+
+    def test_save_without_path(self):
+        with pytest.raises(ValueError):
+            OddsCache().save()
+
+    def test_threads(self):
+        cache = OddsCache(maxsize=8)
+        errors = []
+
+        def work(offset):
+            try:
+                for i in range(300):
+                    assert cache.static(1 + (i + offset) % 10, 5) == static_odds(1 + (i + offset) % 10, 5)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(x,)) for x in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        assert not errors
+        assert info.hits + info.misses == 2400
+        assert info.currsize == 8
@@ -0,0 +1,157 @@
+"""
+Relationships between the companies of a network, resolved in bulk.
+
+For every edge of a CompanyNetwork, the first company acts against the second with every
+contested action of oneroll.companies.actions. The pools of both sides are the sums of the
+action's stats, computed for all edges and actions as one matrix product over the stat
+columns and capped at 10 dice like dynamic_contest(int, int) does. All pools are then
+rolled at once and every contest is resolved like dynamic_contest.
+
+    >>> network = build_company_network(generate_companies(100000, columns=True, rng=1), seed=1)
+    >>> relations = resolve_relations(network, rng=1)
+    >>> relations.outcome_table()["attack"]
+    Tally(trials=99999, wins=25965, losses=32976, none=41058)
+"""
+import numpy as np
+
+from .batch import LOSE, NO_MATCH, WIN, dynamic_contest_many
+from .companies import Company, actions
+from .simulate import Tally
+
+
+def action_matrices(table=actions):
+    """
+    Contested actions as 0/1 matrices selecting the stats that form each side's pool.
+
+    Actions without defending stats are not contests and are left out.
+
+    :param table: Dict of action name: (attacker stats, defender stats), like actions.
+    :return: Tuple of (names, attack, defend): list of action names, and int16 arrays of shape (5, len(names)).
+    """
+    names = [name for name, (attack, defend) in table.items() if defend]
+    attack = np.zeros((5, len(names)), dtype=np.int16)
+    defend = np.zeros((5, len(names)), dtype=np.int16)
+
+    for i, name in enumerate(names):
+        for stat in table[name][0]:
+            attack[Company._stats.index(stat), i] += 1
+        for stat in table[name][1]:
+            defend[Company._stats.index(stat), i] += 1
+
+    return names, attack, defend
+
+
+def stat_matrix(companies):
+    """
+    Stats of companies as an int16 array of shape (n, 5), in Company._stats order.
+
+    :param companies: CompanyTable, or a sequence of Company objects.
+    :return: numpy.ndarray
+    """
+    if hasattr(companies, "stats") and isinstance(companies.stats, np.ndarray):
+        return companies.stats
+
+    return np.array([company.stats_tuple for company in companies], dtype=np.int16).reshape(-1, 5)
+
+
+class Relations:
+    """
+    Outcomes of all actions along the edges of a network.
+
+    :param attackers: Node ids of the acting company of every edge.
+    :param defenders: Node ids of the other company of every edge.
+    :param names: Names of the contested actions.
+    :param pools_a: int8 array of shape (edges, actions) of the acting companies' pools.
+    :param pools_b: int8 array of shape (edges, actions) of the other companies' pools.
+    :param outcomes: int8 array of shape (edges, actions): WIN, LOSE or NO_MATCH for the acting company.
+    """
+
+    def __init__(self, attackers, defenders, names, pools_a, pools_b, outcomes):
+        self.attackers = attackers
+        self.defenders = defenders
+        self.names = names
+        self.pools_a = pools_a
+        self.pools_b = pools_b
+        self.outcomes = outcomes
+
+    def __len__(self):
+        return len(self.attackers)
+
+    def outcome_table(self):
+        """
+        Results per action.
+
+        :return: Dict of action name: Tally, with wins and losses from the acting company's side.
+        """
+        table = {}
+
+        for i, name in enumerate(self.names):
+            column = self.outcomes[:, i]
+            wins, losses, none = [int((column == code).sum()) for code in (WIN, LOSE, NO_MATCH)]
+            table[name] = Tally(len(column), wins, losses, none)
+
+        return table
+
+    def relationship_edges(self):
+        """
+        Directed edges from the winner to the loser of every contest that was not a NO_MATCH.
+
+        :return: Tuple of (winners, losers, actions) arrays, actions as indices into names.
+        """
+        edges, action = np.nonzero(self.outcomes != NO_MATCH)
+        won = self.outcomes[edges, action] == WIN
+
+        winners = np.where(won, self.attackers[edges], self.defenders[edges])
+        losers = np.where(won, self.defenders[edges], self.attackers[edges])
+
+        return winners, losers, action
+
+    def to_networkx(self):
+        """
+        The directed relationship graph: an edge from every company that won a contest to
+        the company it won against, with the names of the actions won as "actions".
+
+        :return: networkx.DiGraph
+        """
+        import networkx
+
+        graph = networkx.DiGraph()
+
+        for winner, loser, action in zip(*[column.tolist() for column in self.relationship_edges()]):
+            if graph.has_edge(winner, loser):
+                graph[winner][loser]["actions"].append(self.names[action])
+            else:
+                graph.add_edge(winner, loser, actions=[self.names[action]])
+
+        return graph
+
+    def __repr__(self):
+        return "Relations(edges={}, actions={})".format(len(self), len(self.names))
+
+
+def resolve_relations(network, table=actions, width_wins=False, both_ways=False, rng=None):
+    """
+    Resolve every contested action along every edge of a network.
+
+    :param network: CompanyNetwork
+    :param table: Dict of action name: (attacker stats, defender stats), like actions.
+    :param width_wins: Passed on to the contests, like dynamic_contest.
+    :param both_ways: Also let the second company of every edge act against the first.
+    :param rng: numpy.random.Generator or seed.
+    :return: Relations
+    """
+    rng = np.random.default_rng(rng)
+    names, attack, defend = action_matrices(table)
+    stats = stat_matrix(network.companies)
+
+    attackers, defenders = network.edges[:, 0], network.edges[:, 1]
+    if both_ways:
+        attackers, defenders = np.concatenate([attackers, defenders]), np.concatenate([defenders, attackers])
+
+    # Roll(x) with an int rolls at most 10 dice, and none for a negative x.
+    pools_a = np.clip(stats[attackers] @ attack, 0, 10).astype(np.int8)
+    pools_b = np.clip(stats[defenders] @ defend, 0, 10).astype(np.int8)
+
+    outcomes = dynamic_contest_many(pools_a.ravel(), pools_b.ravel(), width_wins, rng).reshape(pools_a.shape)
+
+    return Relations(attackers, defenders, names, pools_a, pools_b, outcomes)
@@ -0,0 +1,76 @@
+from oneroll.relations import *
+from oneroll.companies import Company, actions
+from oneroll.generate import generate_companies
+from oneroll.network import CompanyNetwork, build_company_network
+from oneroll.odds import dynamic_odds
+
+
+class TestActionPools:
+    """Tests for the pools computed from stat columns."""
+
+    def test_pools(self):
+        """Pools are the sums of the action's stats, capped at 10 dice."""
+        companies = generate_companies(200, rng=1)
+        companies[0].might = 12
+        relations = resolve_relations(build_company_network(companies, extra_edges=20, seed=1), rng=1)
+
+        for (a, d), row_a, row_b in zip(zip(relations.attackers, relations.defenders),
+                                        relations.pools_a, relations.pools_b):
+            for name, pool_a, pool_b in zip(relations.names, row_a, row_b):
+                attack, defend = actions[name]
+                assert pool_a == min(10, sum(getattr(companies[a], stat) for stat in attack))
+                assert pool_b == min(10, sum(getattr(companies[d], stat) for stat in defend))
+
+    def test_uncontested_actions(self):
+        names, attack, defend = action_matrices()
+
+        assert "improve_might" not in names
+        assert len(names) == sum(1 for attack, defend in actions.values() if defend)
+        assert (attack.sum(axis=0) == 2).all()
+
+
+class TestResolve:
+    """Tests for contest resolution."""
+
+    def test_odds(self):
+        """Outcomes of many 5 against 4 dice contests agree with the exact odds."""
+        network = CompanyNetwork([Company(stats=(0, 3, 0, 1, 2))] * 20001, [(0, x) for x in range(1, 20001)])
+        odds = dynamic_odds(5, 4)
+        tally = resolve_relations(network, rng=5).outcome_table()["attack"]
+
+        assert abs(tally.wins / tally.trials - float(odds.win)) < 0.015
+        assert abs(tally.none / tally.trials - float(odds.none)) < 0.015
+
+
+class TestRelations:
+    """Tests for the Relations class."""
+
+    def test_outcome_table(self):
+        relations = resolve_relations(build_company_network(generate_companies(500, columns=True, rng=2), seed=2),
+                                      rng=2)
+
+        for name, tally in relations.outcome_table().items():
+            assert tally.trials == 499 == tally.wins + tally.losses + tally.none
+
+    def test_both_ways(self):
+        network = build_company_network(generate_companies(50, columns=True, rng=2), seed=2)
+        relations = resolve_relations(network, both_ways=True, rng=2)
+
+        assert len(relations) == 98
+        assert relations.attackers[:49].tolist() == relations.defenders[49:].tolist()
+
+    def test_relationship_graph(self):
+        network = build_company_network(generate_companies(300, columns=True, rng=3), extra_edges=30, seed=3)
+        relations = resolve_relations(network, rng=3)
+        graph = relations.to_networkx()
+        winners, losers, action = relations.relationship_edges()
+
+        assert sum(len(data["actions"]) for u, v, data in graph.edges(data=True)) == len(action)
+
+        for edge, (a, d) in enumerate(zip(relations.attackers.tolist(), relations.defenders.tolist())):
+            for i, name in enumerate(relations.names):
+                code = relations.outcomes[edge, i]
+                if code == WIN:
+                    assert name in graph[a][d]["actions"]
+                elif code == LOSE:
+                    assert name in graph[d][a]["actions"]
@@ -0,0 +1,234 @@
+"""
+Append-only binary log of ORE rolls.
+
+A roll log file is a 16 byte header followed by fixed-width records, one per roll:
+
+    size     uint8          number of dice in the roll
+    penalty  uint8          penalty dice of the roll
+    flags    uint8          1: over10, 2: limit_width
+    dice     uint8[width]   die values, padded with 0 after the first size dice
+
+The width is chosen when the file is created and stored in the header. Reading a log
+memory-maps the file, so opening a log of any size is instant and its columns are
+NumPy views into the file.
+
+    >>> with RollLogWriter("rolls.orelog") as log:
+    ...     log.write(Roll([2, 2, 7]))
+    >>> RollLog("rolls.orelog")[0]
+    Roll(x=[2, 2, 7])
+"""
+import os
+import struct
+
+import numpy as np
+
+from .core import Roll
+
+MAGIC = b"ORELOG01"
+HEADER = struct.Struct("<8sII")
+
+OVER10 = 1
+LIMIT_WIDTH = 2
+
+
+def record_dtype(width):
+    """
+    NumPy dtype of one record of a roll log.
+
+    :param width: Number of dice slots per record.
+    :return: numpy.dtype
+    """
+    return np.dtype([("size", np.uint8), ("penalty", np.uint8), ("flags", np.uint8), ("dice", np.uint8, (width,))])
+
+
+def _read_width(path):
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+
+    if len(header) < HEADER.size:
+        raise ValueError("{} is not a roll log: header too short.".format(path))
+
+    magic, width, reserved = HEADER.unpack(header)
+
+    if magic != MAGIC:
+        raise ValueError("{} is not a roll log.".format(path))
+
+    return width
+
+
+class RollLogWriter:
+    """
+    Appends rolls to a roll log file, creating it if needed.
+
+    :param path: Path of the log file.
+    :param width: Number of dice slots per record. Only used when the file is created;
+        appending to an existing log uses the width stored in it.
+    """
+
+    def __init__(self, path, width=16):
+        self.path = path
+
+        if os.path.exists(path) and os.path.getsize(path):
+            self.width = _read_width(path)
+            self.dtype = record_dtype(self.width)
+
+            # Cut off a partial record left by an interrupted write, so new records stay aligned.
+            records = (os.path.getsize(path) - HEADER.size) // self.dtype.itemsize
+            self._file = open(path, "r+b")
+            self._file.truncate(HEADER.size + records * self.dtype.itemsize)
+            self._file.seek(0, os.SEEK_END)
+        else:
+            if not 0 < width < 256:
+                raise ValueError("Record width must be between 1 and 255.")
+
+            self.width = width
+            self.dtype = record_dtype(self.width)
+            self._file = open(path, "wb")
+            self._file.write(HEADER.pack(MAGIC, width, 0))
+
+    def write(self, roll):
+        """
+        Append a single roll.
+
+        :param roll: Roll or CompactRoll
+        """
+        self.write_many([roll])
+
+    def write_many(self, rolls):
+        """
+        Append rolls.
+
+        :param rolls: Iterable of Roll or CompactRoll objects.
+        """
+        rolls = list(rolls)
+        records = np.zeros(len(rolls), dtype=self.dtype)
+
+        for record, roll in zip(records, rolls):
+            dice = roll.dice
+            self._check_size(len(dice))
+
+            record["size"] = len(dice)
+            record["penalty"] = roll.penalty
+            record["flags"] = (OVER10 if roll.over10 else 0) | (LIMIT_WIDTH if roll.limit_width else 0)
+            record["dice"][:len(dice)] = dice
+
+        self._file.write(records.tobytes())
+
+    def write_dice(self, dice, penalty=0, over10=False, limit_width=False):
+        """
+        Append rolls given as raw dice, eg. the dice of a RollBatch.
+
+        :param dice: 2-D array-like of die values, one row per roll.
+        :param penalty: Penalty recorded for every roll.
+        :param over10: over10 flag recorded for every roll.
+        :param limit_width: limit_width flag recorded for every roll.
+        """
+        dice = np.asarray(dice)
+
+        if dice.ndim != 2:
+            raise ValueError("2-D array of dice expected but got {} dimensions.".format(dice.ndim))
+
+        # Checked before the cast to uint8, which would wrap values like -1 or 257 into range.
+        if dice.size and (dice.min() < 1 or dice.max() > 10):
+            raise ValueError("Die values must be between 1 and 10.")
+
+        dice = dice.astype(np.uint8)
+        self._check_size(dice.shape[1])
+
+        records = np.zeros(len(dice), dtype=self.dtype)
+        records["size"] = dice.shape[1]
+        records["penalty"] = penalty
+        records["flags"] = (OVER10 if over10 else 0) | (LIMIT_WIDTH if limit_width else 0)
+        records["dice"][:, :dice.shape[1]] = dice
+
+        self._file.write(records.tobytes())
+
+    def _check_size(self, size):
+        if size > self.width:
+            raise ValueError("Roll of {} dice does not fit into records of width {}.".format(size, self.width))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RollLog:
+    """
+    Read-only, memory-mapped view of a roll log file.
+
+    The columns size, penalty, flags and dice are NumPy views into the file and are
+    not copied into memory. Indexing with an int returns a Roll, slicing returns another
+    RollLog over the selected records, and iterating creates Rolls one at a time.
+
+    :param path: Path of the log file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.width = _read_width(path)
+        self.dtype = record_dtype(self.width)
+
+        count = (os.path.getsize(path) - HEADER.size) // self.dtype.itemsize
+
+        if count:
+            # A record cut short by an interrupted write is ignored.
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+
+    @property
+    def size(self):
+        """Number of dice of every roll."""
+        return self.records["size"]
+
+    @property
+    def penalty(self):
+        """Penalty of every roll."""
+        return self.records["penalty"]
+
+    @property
+    def flags(self):
+        """Flags of every roll, see OVER10 and LIMIT_WIDTH."""
+        return self.records["flags"]
+
+    @property
+    def dice(self):
+        """Die values of every roll as an array of shape (len(log), width), padded with 0."""
+        return self.records["dice"]
+
+    def _roll(self, record):
+        flags = int(record["flags"])
+
+        return Roll(record["dice"][:record["size"]].tolist(),
+                    penalty=int(record["penalty"]),
+                    over10=bool(flags & OVER10),
+                    limit_width=bool(flags & LIMIT_WIDTH))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            view = RollLog.__new__(RollLog)
+            view.path = self.path
+            view.width = self.width
+            view.dtype = self.dtype
+            view.records = self.records[index]
+            return view
+
+        return self._roll(self.records[index])
+
+    def __iter__(self):
+        for record in self.records:
+            yield self._roll(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return "RollLog(path={!r}, rolls={})".format(self.path, len(self))
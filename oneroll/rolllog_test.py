@@ -0,0 +1,108 @@
+from oneroll.rolllog import *
+from oneroll.batch import RollBatch
+from oneroll.compact import CompactRoll
+import pytest
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "rolls.orelog")
+
+
+class TestRollLog:
+    """Tests for writing and reading roll logs."""
+
+    def test_roundtrip(self, path):
+        """Rolls read back from a log equal the written ones, penalty and flags included."""
+        rolls = [Roll([2, 2, 7]), Roll(14, penalty=1, over10=True), Roll(3, limit_width=True), Roll(0)]
+
+        with RollLogWriter(path) as log:
+            log.write_many(rolls)
+            log.write(CompactRoll([1, 1]))
+
+        read = list(RollLog(path))
+
+        assert [repr(roll) for roll in read] == [repr(roll) for roll in rolls] + ["Roll(x=[1, 1])"]
+
+    def test_columns_are_views(self, path):
+        """Columns are memory-mapped views into the file, not copies."""
+        batch = RollBatch(1000, 6, rng=1)
+
+        with RollLogWriter(path, width=6) as log:
+            log.write_dice(batch.dice, penalty=2)
+
+        log = RollLog(path)
+
+        assert len(log) == 1000
+        assert isinstance(log.records, np.memmap)
+        assert np.shares_memory(log.dice, log.records)
+        assert (log.dice == batch.dice).all()
+        assert (log.size == 6).all() and (log.penalty == 2).all()
+
+    def test_slices(self, path):
+        with RollLogWriter(path) as log:
+            log.write_many(Roll([x, x]) for x in range(1, 11))
+
+        log = RollLog(path)
+
+        assert isinstance(log[2:5], RollLog)
+        assert [roll.dice for roll in log[2:5]] == [[3, 3], [4, 4], [5, 5]]
+        assert log[-1].dice == [10, 10]
+
+    def test_append(self, path):
+        """Reopening a log appends with the width stored in it."""
+        with RollLogWriter(path, width=4) as log:
+            log.write(Roll([1, 2]))
+
+        with RollLogWriter(path, width=30) as log:
+            assert log.width == 4
+            log.write(Roll([3, 4]))
+
+            with pytest.raises(ValueError):
+                log.write(Roll([1, 2, 3, 4, 5]))
+
+        assert [roll.dice for roll in RollLog(path)] == [[1, 2], [3, 4]]
+
+    def test_partial_record_ignored(self, path):
+        """A record cut short by an interrupted write is not read."""
+        with RollLogWriter(path) as log:
+            log.write(Roll([5, 6]))
+
+        with open(path, "ab") as f:
+            f.write(b"\x02\x00")
+
+        assert len(RollLog(path)) == 1
+
+    def test_append_after_partial_record(self, path):
+        """Reopening a log drops a partial record, so rolls appended after it read back intact."""
+        with RollLogWriter(path) as log:
+            log.write(Roll([1, 2, 3]))
+
+        with open(path, "ab") as f:
+            f.write(b"\x02\x00")
+
+        with RollLogWriter(path) as log:
+            log.write_many([Roll([5, 5]), Roll([7, 8, 9])])
+
+        assert [roll.dice for roll in RollLog(path)] == [[1, 2, 3], [5, 5], [7, 8, 9]]
+
+    def test_empty_and_invalid(self, path):
+        RollLogWriter(path).close()
+        assert len(RollLog(path)) == 0
+
+        with open(path, "wb") as f:
+            f.write(b"not a roll log at all")
+
+        with pytest.raises(ValueError):
+            RollLog(path)
+
+    def test_write_dice_invalid(self, path):
+        """Raw dice outside 1 to 10 are rejected, not wrapped into range, and nothing is written."""
+        with RollLogWriter(path) as log:
+            for dice in ([[1, 0]], [[11, 2]], [[-1, 2]], np.array([[257, 2]]), [1, 2]):
+                with pytest.raises(ValueError):
+                    log.write_dice(dice)
+
+            log.write_dice(np.array([[3, 10]], dtype=np.int64))
+
+        assert [roll.dice for roll in RollLog(path)] == [[3, 10]]
@@ -0,0 +1,157 @@
+"""
+Parallel Monte Carlo simulation of ORE contests.
+
+Trials are split into chunks of a fixed size, and every chunk rolls with its own random
+stream derived from the seed and the chunk number. Chunks are spread over a process pool
+but always tallied in order, so results only depend on the seed, never on the number of
+workers.
+
+    >>> tally = simulate_contests(5, 3, 100000, seed=1)
+    >>> tally.trials
+    100000
+"""
+import hashlib
+import math
+import multiprocessing
+import os
+import random
+from collections import namedtuple
+
+from .core import DiceBuffer, dynamic_contest, static_contest
+
+
+class Tally(namedtuple("Tally", ["trials", "wins", "losses", "none"])):
+    """
+    Counts of contest results.
+
+    :param trials: Number of contests.
+    :param wins: Contests won by the first pool, or successful static contests.
+    :param losses: Contests lost by the first pool, ties included, or failed static contests.
+    :param none: Dynamic contests where neither roll had a Match.
+    """
+    __slots__ = ()
+
+    @property
+    def win_rate(self):
+        return self.wins / self.trials if self.trials else 0.0
+
+    def interval(self, z=1.96):
+        """
+        Wilson score interval of the win rate.
+
+        :param z: Standard score of the confidence level, 1.96 for 95%.
+        :return: Tuple of (low, high).
+        """
+        if not self.trials:
+            return 0.0, 1.0
+
+        n = self.trials
+        p = self.win_rate
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+
+        return center - half, center + half
+
+    def combine(self, other):
+        """Tally of both sets of contests."""
+        return Tally(*(a + b for a, b in zip(self, other)))
+
+
+def chunk_seed(seed, chunk):
+    """
+    Seed of the random stream of one chunk of trials.
+
+    :param seed: Seed of the whole simulation.
+    :param chunk: Number of the chunk.
+    :return: int
+    """
+    digest = hashlib.sha256("{}:{}".format(seed, chunk).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _run_chunk(args):
+    pool_a, pool_b, trials, seed, width_wins, diff = args
+
+    rng = DiceBuffer(random.Random(seed))
+    wins = losses = none = 0
+
+    for x in range(trials):
+        if pool_b is None:
+            result = static_contest(pool_a, diff, rng=rng)
+        else:
+            result = dynamic_contest(pool_a, pool_b, width_wins=width_wins, rng=rng)
+
+        if result is None:
+            none += 1
+        elif result:
+            wins += 1
+        else:
+            losses += 1
+
+    return Tally(trials, wins, losses, none)
+
+
+def iter_tallies(pool_a, pool_b, n, workers=None, seed=None, width_wins=False, diff=1, chunk_size=10000):
+    """
+    Simulate contests and yield the running Tally after every chunk of trials.
+
+    Stopping the iteration early stops the workers.
+
+    :param pool_a: Number of dice of the first pool.
+    :param pool_b: Number of dice of the second pool, or None for static contests of pool_a against diff.
+    :param n: Number of contests.
+    :param workers: Number of worker processes. Defaults to the number of CPUs; 1 runs in this process.
+    :param seed: Seed of the simulation. Defaults to a random seed.
+    :param width_wins: Passed on to dynamic_contest.
+    :param diff: Difficulty of static contests.
+    :param chunk_size: Number of trials per chunk.
+    :return: Generator of Tally objects.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    workers = workers or os.cpu_count() or 1
+    chunks = ((pool_a, pool_b, min(chunk_size, n - start), chunk_seed(seed, i), width_wins, diff)
+              for i, start in enumerate(range(0, n, chunk_size)))
+
+    tally = Tally(0, 0, 0, 0)
+
+    if workers == 1:
+        for chunk in chunks:
+            tally = tally.combine(_run_chunk(chunk))
+            yield tally
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.imap(_run_chunk, chunks):
+            tally = tally.combine(result)
+            yield tally
+
+
+def simulate_contests(pool_a, pool_b, n, workers=None, seed=None, width_wins=False, diff=1, chunk_size=10000,
+                      target=None, z=1.96):
+    """
+    Simulate n contests between two pools in parallel.
+
+    :param pool_a: Number of dice of the first pool.
+    :param pool_b: Number of dice of the second pool, or None for static contests of pool_a against diff.
+    :param n: Maximum number of contests.
+    :param workers: Number of worker processes. Defaults to the number of CPUs; 1 runs in this process.
+    :param seed: Seed of the simulation. The same seed gives the same Tally for any number of workers.
+    :param width_wins: Passed on to dynamic_contest.
+    :param diff: Difficulty of static contests.
+    :param chunk_size: Number of trials per chunk.
+    :param target: Stop early once the confidence interval of the win rate is at most this wide on each side.
+    :param z: Standard score of the confidence level used with target.
+    :return: Tally
+    """
+    tally = Tally(0, 0, 0, 0)
+
+    for tally in iter_tallies(pool_a, pool_b, n, workers, seed, width_wins, diff, chunk_size):
+        if target is not None:
+            low, high = tally.interval(z)
+
+            if (high - low) / 2 <= target:
+                break
+
+    return tally
@@ -0,0 +1,56 @@
+from oneroll.simulate import *
+from oneroll.odds import dynamic_odds, static_odds
+import random
+
+
+class TestSimulateContests:
+    """Tests for the parallel contest simulator."""
+
+    def test_reproducible_across_workers(self):
+        """The same seed gives the same Tally no matter how many workers roll."""
+        single = simulate_contests(5, 4, 20000, workers=1, seed=7, chunk_size=3000)
+        parallel = simulate_contests(5, 4, 20000, workers=3, seed=7, chunk_size=3000)
+
+        assert single == parallel
+        assert single.trials == 20000
+        assert single.wins + single.losses + single.none == 20000
+
+    def test_seeds_differ(self):
+        assert simulate_contests(5, 4, 5000, workers=1, seed=1) != simulate_contests(5, 4, 5000, workers=1, seed=2)
+
+    def test_global_random_untouched(self):
+        """Simulating in this process does not change the state of the random module."""
+        state = random.getstate()
+        simulate_contests(3, 3, 1000, workers=1, seed=1)
+
+        assert random.getstate() == state
+
+    def test_matches_exact_odds(self):
+        """Simulated win rates lie within a generous interval around the exact odds."""
+        tally = simulate_contests(6, 4, 40000, workers=2, seed=3)
+        low, high = tally.interval(z=4)
+        assert low <= dynamic_odds(6, 4).win <= high
+
+        tally = simulate_contests(6, 4, 40000, workers=1, seed=3, width_wins=True)
+        low, high = tally.interval(z=4)
+        assert low <= dynamic_odds(6, 4, width_wins=True).win <= high
+
+        tally = simulate_contests(7, None, 40000, workers=1, seed=3, diff=6)
+        low, high = tally.interval(z=4)
+        assert low <= static_odds(7, diff=6) <= high
+        assert tally.none == 0
+
+    def test_streaming_and_early_stop(self):
+        """Partial tallies grow chunk by chunk; a target interval stops the simulation early."""
+        tallies = list(iter_tallies(4, 4, 10000, workers=1, seed=5, chunk_size=2500))
+        assert [tally.trials for tally in tallies] == [2500, 5000, 7500, 10000]
+
+        early = simulate_contests(4, 4, 10 ** 7, workers=2, seed=5, chunk_size=2500, target=0.01)
+        assert early.trials < 10 ** 7
+        assert early == simulate_contests(4, 4, 10 ** 7, workers=1, seed=5, chunk_size=2500, target=0.01)
+
+    def test_interval(self):
+        assert Tally(0, 0, 0, 0).interval() == (0.0, 1.0)
+
+        low, high = Tally(100, 0, 100, 0).interval()
+        assert abs(low) < 1e-9 < high
@@ -0,0 +1,194 @@
+"""
+Best values for Master Dice and Expert Dice.
+
+A Master Die is set after rolling, so every one of its 10 values is tried on the face
+histogram of the roll, which takes constant time. An Expert Die is set before rolling, so
+every value is rated by its exact expected result from oneroll.odds.
+
+Goals are given as goal="height" or goal="width" to get the highest or widest Match, as
+diff=... to succeed in a static contest, or as opponent=... to win a dynamic contest.
+
+    >>> best_md(Roll([2, 5, 5, 9]))
+    9
+    >>> best_md(Roll([2, 5, 5, 9]), goal="width")
+    5
+    >>> best_ed(4, diff=8)
+    10
+"""
+from collections import namedtuple
+from fractions import Fraction
+
+from .core import FACES, Roll, _summarize
+from .odds import Pool, _as_pool, _score_counts, dynamic_odds, highest_distribution, static_odds, \
+    widest_distribution
+
+GOALS = ("height", "width")
+
+Choice = namedtuple("Choice", ["value", "score"])
+Choice.__doc__ = """\
+A Master or Expert Die value and how well it reaches the goal.
+
+:param value: Value of the die.
+:param score: Higher is better. For Master Dice a tuple compared in order, for Expert Dice
+    the exact expected height or width, or probability of success or of winning.
+"""
+
+
+def _check_goal(goal, diff, opponent):
+    if opponent is None and diff is None and goal not in GOALS:
+        raise ValueError("Goal must be one of {} but got {!r}.".format(GOALS, goal))
+
+
+def _compared(matches, width_wins):
+    """The value dynamic_contest compares, 0 for no Match."""
+    if not matches:
+        return 0
+
+    return max(match.width for match in matches) if width_wins else matches[-1].height
+
+
+def md_options(roll, goal="height", diff=None, opponent=None, width_wins=False):
+    """
+    Rate every value of a Master Die added to a roll.
+
+    Scores are tuples, compared in order:
+        goal="height": height, then width of the highest Match.
+        goal="width": width, then height of the widest Match.
+        diff: success of static_contest, then width of the widest Match reaching diff, then height.
+        opponent: win of dynamic_contest against the opponent's Roll, then the compared value.
+
+    :param roll: Roll or CompactRoll the Master Die is added to.
+    :param goal: "height" or "width", if neither diff nor opponent is given.
+    :param diff: Difficulty of a static contest.
+    :param opponent: Roll of the opponent in a dynamic contest.
+    :param width_wins: Passed on to the dynamic contest against opponent.
+    :return: List of 10 Choice, one per value.
+    """
+    _check_goal(goal, diff, opponent)
+
+    counts = list(roll.counts)
+    theirs = None if opponent is None else _compared(opponent.matches, width_wins)
+    choices = []
+
+    for value in FACES:
+        counts[value - 1] += 1
+        matches, highest, widest, waste = _summarize(counts)
+        counts[value - 1] -= 1
+
+        if opponent is not None:
+            mine = _compared(matches, width_wins)
+            score = (mine > theirs, mine)
+        elif diff is not None:
+            reaching = [match.width for match in matches if match.height >= diff]
+            score = (bool(highest) and highest.height >= diff, max(reaching, default=0),
+                     highest.height if highest else 0)
+        elif goal == "height":
+            score = (highest.height, highest.width) if highest else (0, 0)
+        else:
+            score = (widest.width, widest.height) if widest else (0, 0)
+
+        choices.append(Choice(value, score))
+
+    return choices
+
+
+def best_md(roll, goal="height", diff=None, opponent=None, width_wins=False):
+    """
+    Best value of a Master Die added to a roll; see md_options() for the goals.
+
+    Of equally good values, the highest one is chosen.
+
+    :return: int
+    """
+    choices = md_options(roll, goal, diff, opponent, width_wins)
+    return max(choices, key=lambda choice: (choice.score, choice.value)).value
+
+
+def _expected(distribution, key):
+    return sum((key(result) * p for result, p in distribution.items() if result), Fraction(0))
+
+
+def ed_options(dice, goal="height", diff=None, opponent=None, width_wins=False, penalty=0):
+    """
+    Rate every value of an Expert Die by its exact expected result.
+
+    Scores are Fractions:
+        goal="height": expected height of the highest Match, counting no Match as 0.
+        goal="width": expected width of the widest Match, counting no Match as 0.
+        diff: probability that static_contest succeeds.
+        opponent: probability of winning dynamic_contest. The opponent can be a pool size or
+            Pool not yet rolled, or a Roll that is already known.
+
+    :param dice: Number of dice rolled besides the Expert Die.
+    :param goal: "height" or "width", if neither diff nor opponent is given.
+    :param diff: Difficulty of a static contest.
+    :param opponent: int, Pool or Roll of the opponent in a dynamic contest.
+    :param width_wins: Passed on to the dynamic contest against opponent.
+    :param penalty: Penalty dice of the pool.
+    :return: List of 10 Choice, one per value.
+    """
+    _check_goal(goal, diff, opponent)
+
+    if hasattr(opponent, "matches"):
+        theirs = _compared(opponent.matches, width_wins)
+    elif opponent is not None:
+        opponent = _as_pool(opponent)
+
+    choices = []
+
+    for value in FACES:
+        pool = Pool(dice, penalty, ed=value)
+
+        if hasattr(opponent, "matches"):
+            counts = _score_counts(pool, width_wins)
+            score = Fraction(sum(n for mine, n in counts.items() if (mine or 0) > theirs), 10 ** pool.rolled)
+        elif opponent is not None:
+            score = dynamic_odds(pool, opponent, width_wins).win
+        elif diff is not None:
+            score = static_odds(pool, diff)
+        elif goal == "height":
+            score = _expected(highest_distribution(pool), lambda match: match.height)
+        else:
+            score = _expected(widest_distribution(pool), lambda match: match.width)
+
+        choices.append(Choice(value, score))
+
+    return choices
+
+
+def best_ed(dice, goal="height", diff=None, opponent=None, width_wins=False, penalty=0):
+    """
+    Best value of an Expert Die; see ed_options() for the goals.
+
+    Of equally good values, the highest one is chosen.
+
+    :return: int
+    """
+    choices = ed_options(dice, goal, diff, opponent, width_wins, penalty)
+    return max(choices, key=lambda choice: (choice.score, choice.value)).value
+
+
+def roll_with_best_md(dice, goal="height", diff=None, opponent=None, width_wins=False, rng=None):
+    """
+    Like roll_with_md(), but the Master Die is set by best_md() instead of asking.
+
+    :return: Roll object.
+    """
+    _roll = Roll(dice, rng=rng)
+    _roll.dice.append(best_md(_roll, goal, diff, opponent, width_wins))
+    _roll.dice.sort()
+
+    return _roll
+
+
+def roll_with_best_ed(dice, goal="height", diff=None, opponent=None, width_wins=False, rng=None):
+    """
+    Like roll_with_ed(), but the Expert Die is set by best_ed() instead of asking.
+
+    :return: Roll object.
+    """
+    _roll = Roll(dice, rng=rng)
+    _roll.dice.append(best_ed(dice, goal, diff, opponent, width_wins))
+    _roll.dice.sort()
+
+    return _roll
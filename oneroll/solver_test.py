@@ -0,0 +1,101 @@
+from oneroll.solver import *
+from oneroll.core import Roll, dynamic_contest, static_contest
+from fractions import Fraction
+from itertools import product
+import random
+import pytest
+
+
+def with_md(roll, value):
+    return Roll(roll.dice + [value])
+
+
+class TestMasterDie:
+    """Tests for md_options and best_md."""
+
+    def test_height(self):
+        """No other value gives a higher Match than the best one."""
+        rng = random.Random(1)
+
+        for x in range(300):
+            roll = Roll(rng.randint(1, 8), rng=rng)
+            best = with_md(roll, best_md(roll)).highest
+            heights = [with_md(roll, value).highest for value in range(1, 11)]
+
+            assert max((m.height, m.width) for m in heights if m) == (best.height, best.width)
+
+    def test_width(self):
+        rng = random.Random(2)
+
+        for x in range(300):
+            roll = Roll(rng.randint(1, 8), rng=rng)
+            best = with_md(roll, best_md(roll, goal="width")).widest
+
+            assert best.width == max(with_md(roll, value).widest.width for value in range(1, 11)
+                                     if with_md(roll, value).widest)
+
+    def test_diff(self):
+        rng = random.Random(3)
+
+        for x in range(300):
+            roll, diff = Roll(rng.randint(1, 6), rng=rng), rng.randint(1, 10)
+            success = static_contest(with_md(roll, best_md(roll, diff=diff)), diff)
+
+            assert success == any(static_contest(with_md(roll, value), diff) for value in range(1, 11))
+
+    @pytest.mark.parametrize("width_wins", [False, True])
+    def test_opponent(self, width_wins):
+        rng = random.Random(4)
+
+        for x in range(300):
+            roll, opponent = Roll(rng.randint(1, 6), rng=rng), Roll(rng.randint(1, 6), rng=rng)
+            choices = md_options(roll, opponent=opponent, width_wins=width_wins)
+
+            for value, (win, score) in choices:
+                assert win == bool(dynamic_contest(with_md(roll, value), opponent, width_wins))
+
+    def test_goal(self):
+        with pytest.raises(ValueError):
+            md_options(Roll([1, 2]), goal="speed")
+
+
+class TestExpertDie:
+    """Tests for ed_options and best_ed, against all outcomes of small pools."""
+
+    def outcomes(self, dice, value):
+        for rolled in product(range(1, 11), repeat=dice):
+            yield Roll(list(rolled) + [value])
+
+    def test_height(self):
+        for value, score in ed_options(2):
+            heights = [roll.highest.height if roll.highest else 0 for roll in self.outcomes(2, value)]
+            assert score == Fraction(sum(heights), len(heights))
+
+    def test_width(self):
+        for value, score in ed_options(2, goal="width"):
+            widths = [roll.widest.width if roll.widest else 0 for roll in self.outcomes(2, value)]
+            assert score == Fraction(sum(widths), len(widths))
+
+    def test_diff(self):
+        for value, score in ed_options(2, diff=6):
+            assert score == Fraction(sum(static_contest(roll, 6) for roll in self.outcomes(2, value)), 100)
+
+    def test_known_opponent(self):
+        opponent = Roll([4, 4, 7])
+
+        for value, score in ed_options(2, opponent=opponent):
+            wins = sum(bool(dynamic_contest(roll, opponent)) for roll in self.outcomes(2, value))
+            assert score == Fraction(wins, 100)
+
+    def test_pool_opponent(self):
+        """Against a pool not yet rolled, choices are rated by the exact chance of winning."""
+        choices = ed_options(3, opponent=3)
+
+        assert all(0 < score < 1 for value, score in choices)
+        assert best_ed(3, opponent=3) == 10
+
+    def test_roll_with_best(self):
+        roll = roll_with_best_ed(3, rng=random.Random(5))
+
+        assert 10 in roll.dice and len(roll) == 4
+        assert len(roll_with_best_md(3, rng=random.Random(5))) == 4
@@ -0,0 +1,209 @@
+"""
+Endless feeds of rolls, contests and companies.
+
+The iter_ functions are generators. They roll their dice in blocks with RollBatch and hand
+out the results one at a time, or in lists of chunk results, so memory use depends on the
+block and chunk sizes only, never on how many results are taken. Without n they never
+stop; where keeps only the results it returns True for.
+
+    >>> strong = iter_companies(where=lambda company: company.might >= 3, rng=1)
+    >>> next(strong).might >= 3
+    True
+    >>> with RollLogWriter("rolls.orelog") as log:
+    ...     for chunk in iter_rolls(6, n=10000000, chunk=100000, rng=1):
+    ...         log.write_many(chunk)
+"""
+from itertools import islice, repeat
+
+import numpy as np
+
+from .batch import NO_MATCH, WIN, RollBatch, dynamic_contest_many, static_contest_many
+from .companytable import CompanyTable
+from .core import Roll
+from .generate import _compiled, generate_companies
+
+_RESULTS = {WIN: True, NO_MATCH: None}
+
+
+def chunked(items, size):
+    """
+    Group an iterable into lists of size items; the last list may be shorter.
+
+    :param items: Iterable, eg. one of the iter_ generators.
+    :param size: Number of items per list.
+    :return: Generator of lists.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1 but got {}.".format(size))
+
+    items = iter(items)
+
+    while True:
+        chunk = list(islice(items, size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _feed(blocks, n, where, chunk):
+    """Filter, limit and chunk a generator of blocks of results."""
+    items = (item for block in blocks for item in block)
+
+    if where is not None:
+        items = filter(where, items)
+
+    if n is not None:
+        items = islice(items, n)
+
+    return chunked(items, chunk) if chunk else items
+
+
+def _sizes(block, n, where):
+    """Size of every block, drawing no more than n results when nothing is filtered out."""
+    if n is None or where is not None:
+        while True:
+            yield block
+
+    while n > 0:
+        yield min(block, n)
+        n -= block
+
+
+def _rolls(batch):
+    penalty, over10, limit_width = batch.penalty, batch.over10, batch.limit_width
+
+    return [Roll._from_counts(dice, counts, penalty, over10, limit_width)
+            for dice, counts in zip(batch.dice.tolist(), batch.counts.tolist())]
+
+
+def iter_rolls(pool=4, n=None, penalty=0, over10=False, limit_width=False, where=None, chunk=None, block=4096,
+               rng=None):
+    """
+    Generate Roll objects of the same pool.
+
+    :param pool: Number of dice to roll, like Roll(pool).
+    :param n: Number of rolls, or None for an endless feed.
+    :param penalty: Penalty dice, see Roll.
+    :param over10: Allow rolling more than 10 dice.
+    :param limit_width: Limit width of Matches to maximum of 5.
+    :param where: Callable taking a Roll; only rolls it returns True for are generated.
+    :param chunk: Generate lists of chunk rolls instead of single rolls.
+    :param block: Number of rolls rolled at once.
+    :param rng: numpy.random.Generator or seed.
+    :return: Generator of Roll, or of lists of Roll.
+    """
+    def blocks():
+        generator = np.random.default_rng(rng)
+
+        for size in _sizes(block, n, where):
+            yield _rolls(RollBatch(size, pool, penalty, over10, limit_width, generator))
+
+    return _feed(blocks(), n, where, chunk)
+
+
+def iter_contests(pool1, pool2=None, diff=1, width_wins=False, n=None, where=None, chunk=None, block=4096,
+                  rng=None):
+    """
+    Generate contests between rolls of the same pools.
+
+    With pool2 every contest is decided like dynamic_contest(Roll(pool1), Roll(pool2)),
+    without it like static_contest(Roll(pool1), diff).
+
+    :param pool1: Number of dice of the first roll.
+    :param pool2: Number of dice of the second roll, or None for static contests.
+    :param diff: Difficulty of static contests.
+    :param width_wins: Compare the widest Matches in dynamic contests.
+    :param n: Number of contests, or None for an endless feed.
+    :param where: Callable taking a contest tuple; only contests it returns True for are generated.
+    :param chunk: Generate lists of chunk contests instead of single contests.
+    :param block: Number of contests rolled at once.
+    :param rng: numpy.random.Generator or seed.
+    :return: Generator of (result, roll1, roll2) tuples, roll2 being None in static contests,
+        or of lists of them.
+    """
+    def blocks():
+        generator = np.random.default_rng(rng)
+
+        for size in _sizes(block, n, where):
+            batch1 = RollBatch(size, pool1, rng=generator)
+
+            if pool2 is None:
+                results = (static_contest_many(batch1, diff) == WIN).tolist()
+                rolls2 = repeat(None)
+            else:
+                batch2 = RollBatch(size, pool2, rng=generator)
+                codes = dynamic_contest_many(batch1, batch2, width_wins).tolist()
+                results = [_RESULTS.get(code, False) for code in codes]
+                rolls2 = _rolls(batch2)
+
+            yield list(zip(results, _rolls(batch1), rolls2))
+
+    return _feed(blocks(), n, where, chunk)
+
+
+def _table_chunks(tables, n, size):
+    """Regroup a generator of CompanyTables into tables of size companies, n in total."""
+    pending = []
+    held = 0
+
+    for table in tables:
+        if n is not None:
+            table = table[:n] if len(table) > n else table
+            n -= len(table)
+
+        pending.append(table)
+        held += len(table)
+
+        while held >= size:
+            joined = CompanyTable.concat(pending)
+            yield joined[:size]
+            pending = [joined[size:]]
+            held -= size
+
+        if n == 0:
+            break
+
+    if held:
+        yield CompanyTable.concat(pending)
+
+
+def iter_companies(n=None, dice=15, names=None, where=None, chunk=None, columns=False, block=1024, rng=None,
+                   compiled=_compiled):
+    """
+    Generate One Roll Companies, like generate_companies() but without end.
+
+    With columns=True the companies come in CompanyTables of chunk companies, or of block
+    companies without chunk, and where is called with a CompanyTable and returns a boolean
+    mask, eg. where=lambda table: table.might >= 3.
+
+    :param n: Number of companies, or None for an endless feed.
+    :param dice: Dice rolled per company.
+    :param names: None, or a callable returning a new name, eg. Corpus().randomname.
+    :param where: Callable taking a Company; only companies it returns True for are generated.
+    :param chunk: Generate lists of chunk companies instead of single companies.
+    :param columns: Generate CompanyTables instead of Company objects.
+    :param block: Number of companies rolled at once.
+    :param rng: numpy.random.Generator or seed.
+    :param compiled: CompiledORC of the company table to use.
+    :return: Generator of Company, of lists of Company, or of CompanyTable.
+    """
+    if names is not None and not callable(names):
+        raise TypeError("Names must be None or a callable returning a name.")
+
+    def blocks():
+        generator = np.random.default_rng(rng)
+
+        for size in _sizes(block, n, where):
+            companies = generate_companies(size, dice, names, columns, generator, compiled)
+
+            if columns and where is not None:
+                companies = companies.filter(where(companies))
+
+            yield companies
+
+    if columns:
+        return _table_chunks(blocks(), n, chunk or block)
+
+    return _feed(blocks(), n, where, chunk)
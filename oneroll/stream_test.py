@@ -0,0 +1,103 @@
+from oneroll.stream import *
+from oneroll.companytable import CompanyTable
+from oneroll.core import Roll, dynamic_contest, static_contest
+from oneroll.generate import generate_companies
+from itertools import islice
+import pytest
+
+
+class TestIterRolls:
+    """Tests for iter_rolls."""
+
+    def test_rolls(self):
+        rolls = list(iter_rolls(6, n=1000, block=300, rng=1))
+
+        assert len(rolls) == 1000
+        assert all(isinstance(roll, Roll) and len(roll) == 6 for roll in rolls)
+        assert all(roll.matches == Roll(list(roll.dice)).matches for roll in rolls)
+
+    def test_endless(self):
+        rolls = iter_rolls(3, block=10, rng=2)
+
+        assert len(list(islice(rolls, 95))) == 95
+
+    def test_where(self):
+        rolls = list(iter_rolls(4, n=200, where=lambda roll: roll.matches, rng=3))
+
+        assert len(rolls) == 200 and all(roll.matches for roll in rolls)
+
+    def test_chunks(self):
+        chunks = list(iter_rolls(5, n=250, chunk=100, block=64, rng=4))
+
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+    def test_limit_width(self):
+        rolls = iter_rolls(40, n=100, over10=True, limit_width=True, rng=5)
+
+        assert all(roll.widest.width <= 5 for roll in rolls)
+
+
+class TestIterContests:
+    """Tests for iter_contests."""
+
+    def test_dynamic(self):
+        contests = list(iter_contests(5, 4, n=2000, block=512, rng=1))
+
+        assert len(contests) == 2000
+        assert all(result == dynamic_contest(roll1, roll2) for result, roll1, roll2 in contests)
+        assert {result for result, roll1, roll2 in contests} == {True, False, None}
+
+    def test_static(self):
+        contests = list(iter_contests(5, diff=6, n=500, rng=2))
+
+        assert all(roll2 is None and result == static_contest(roll1, 6) for result, roll1, roll2 in contests)
+
+    def test_where(self):
+        wins = list(islice(iter_contests(3, 6, where=lambda contest: contest[0], rng=3), 100))
+
+        assert len(wins) == 100 and all(result for result, roll1, roll2 in wins)
+
+
+class TestIterCompanies:
+    """Tests for iter_companies."""
+
+    def test_same_as_generate_companies(self):
+        """Without a filter, the feed holds the companies generate_companies makes from the same seed."""
+        streamed = list(iter_companies(n=100, block=100, rng=1))
+        companies = generate_companies(100, rng=1)
+
+        assert [company.stats_tuple for company in streamed] == [company.stats_tuple for company in companies]
+        assert [company.assets for company in streamed] == [company.assets for company in companies]
+
+    def test_where(self):
+        strong = list(iter_companies(n=300, where=lambda company: company.might >= 3, chunk=128, block=256, rng=2))
+
+        assert [len(chunk) for chunk in strong] == [128, 128, 44]
+        assert all(company.might >= 3 for chunk in strong for company in chunk)
+
+    def test_columns(self):
+        tables = list(iter_companies(n=1000, where=lambda table: table.might >= 2, columns=True, chunk=300, rng=3))
+
+        assert [len(table) for table in tables] == [300, 300, 300, 100]
+        assert all(isinstance(table, CompanyTable) and (table.might >= 2).all() for table in tables)
+        assert all(len(table.asset_ids) == table.asset_offsets[-1] for table in tables)
+
+    def test_names(self):
+        names = iter(["A", "B", "C"])
+        companies = iter_companies(n=3, names=lambda: next(names), rng=4)
+
+        assert [company.name for company in companies] == ["A", "B", "C"]
+
+        with pytest.raises(TypeError):
+            iter_companies(names=["A", "B"])
+
+
+class TestChunked:
+    """Tests for chunked."""
+
+    def test_chunked(self):
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(chunked([], 3)) == []
+
+        with pytest.raises(ValueError):
+            next(chunked(range(7), 0))
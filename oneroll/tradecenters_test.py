@@ -0,0 +1,120 @@
+from oneroll.tradecenters import *
+from oneroll import tradecenters
+from oneroll.network import CompanyNetwork, build_company_network
+import networkx
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def network():
+    return build_company_network(list(range(300)), extra_edges=40, seed=3)
+
+
+def exact(network):
+    graph = networkx.Graph()
+    graph.add_nodes_from(range(len(network)))
+    graph.add_edges_from(network.edges.tolist())
+    scores = networkx.betweenness_centrality(graph)
+    return np.array([scores[node] for node in range(len(network))])
+
+
+class TestSingleSource:
+    """Tests for single_source."""
+
+    def test_distances(self, network):
+        graph = networkx.Graph(network.edges.tolist())
+        dist, delta = single_source(*network.csr, 7)
+
+        assert dist.tolist() == [networkx.shortest_path_length(graph, 7, node) for node in range(300)]
+        assert delta[7] == 0
+
+    def test_unreachable(self):
+        network = CompanyNetwork(list(range(4)), [(0, 1), (2, 3)])
+        dist, delta = single_source(*network.csr, 0)
+
+        assert dist.tolist() == [0, 1, -1, -1]
+
+
+class TestTradeCenters:
+    """Tests for the TradeCenters class."""
+
+    def test_exact(self, network):
+        """With every node as a pivot the values are the exact betweenness."""
+        assert np.allclose(TradeCenters(network).betweenness, exact(network))
+
+    def test_sampled(self, network):
+        """Sampled values stay within the error bound."""
+        centers = TradeCenters(network, k=60, seed=2)
+
+        assert np.abs(centers.betweenness - exact(network)).max() <= centers.error()
+
+    def test_scale(self, network):
+        """Pivots contribute their exact dependencies, scaled by n / k."""
+        pivots = [0, 5, 9]
+        centers = TradeCenters(network, pivots=pivots)
+        total = sum(single_source(*network.csr, pivot)[1] for pivot in pivots)
+
+        assert np.allclose(centers.betweenness, total * 100 / (299 * 298))
+
+    def test_top(self, network):
+        scores = exact(network)
+        top = TradeCenters(network).top(3)
+
+        assert [company for company, score in top] == np.argsort(-scores, kind="stable")[:3].tolist()
+
+    def test_workers(self, network):
+        """Spreading pivots over processes gives the same values."""
+        centers = TradeCenters(network, k=40, seed=1, workers=1, incremental=True)
+        parallel = TradeCenters(network, k=40, seed=1, workers=2, incremental=True)
+
+        assert np.allclose(centers.betweenness, parallel.betweenness)
+        assert (centers._distances == parallel._distances).all()
+
+    def test_add_edges(self, network):
+        """Incremental updates give the values of a fresh computation with the same pivots."""
+        centers = TradeCenters(network, k=50, seed=4, incremental=True)
+        searched = centers.add_edges([(0, 299), (10, 200), (5, 6)])
+
+        assert 0 < searched <= 50
+        assert np.allclose(centers.betweenness, TradeCenters(network, pivots=centers.pivots).betweenness)
+
+    def test_add_edges_not_incremental(self, network):
+        """Without incremental distances, adding edges searches from every pivot again."""
+        centers = TradeCenters(network, k=20, seed=5)
+        assert centers._distances is None
+        assert centers.add_edges([(0, 299)]) == 20
+        assert np.allclose(centers.betweenness, TradeCenters(network, pivots=centers.pivots).betweenness)
+
+    def test_distance_limit(self, network, monkeypatch):
+        monkeypatch.setattr(tradecenters, "MAX_DISTANCES", 100 * len(network))
+
+        with pytest.raises(ValueError):
+            TradeCenters(network, incremental=True)
+
+        assert TradeCenters(network, k=100, seed=6, incremental=True).k == 100
+
+    def test_add_edges_same_distance(self):
+        """An edge between nodes at the same distance from every pivot repeats no search."""
+        network = CompanyNetwork(list(range(5)), [(0, 1), (0, 2), (1, 3), (2, 4)])
+        centers = TradeCenters(network, pivots=[0], incremental=True)
+
+        assert centers.add_edges([(1, 2)]) == 0
+        assert centers.add_edges([(1, 2)]) == 0
+        assert centers.add_edges([(3, 2)]) == 1
+
+
+class TestErrorBound:
+    """Tests for error_bound and pivots_for."""
+
+    def test_exact(self):
+        assert error_bound(100, 100) == 0.0
+
+    def test_pivots_for(self):
+        k = pivots_for(100000, 0.05)
+
+        assert error_bound(100000, k) <= 0.05 < error_bound(100000, k - 1)
+
+    def test_trade_centers(self, network):
+        assert [company for company, score in trade_centers(network, 3)] == \
+               [company for company, score in TradeCenters(network).top(3)]